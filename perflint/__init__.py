@@ -4,12 +4,51 @@ from typing import TYPE_CHECKING
 from perflint.for_loop_checker import ForLoopChecker, LoopInvariantChecker
 from perflint.list_checker import ListChecker
 from perflint.comprehension_checker import ComprehensionChecker
+from perflint.function_call_checker import FunctionCallChecker
+from perflint.constant_checker import ConstantFoldingChecker
+from perflint.allocation_checker import AllocationChecker
+from perflint.io_checker import IOChecker
+from perflint.materialization_checker import MaterializationChecker
+from perflint.zero_copy_checker import ZeroCopyChecker
+from perflint.memoization_checker import MemoizationChecker
+from perflint.dbapi_checker import DBAPIChecker
+from perflint.logging_checker import LoggingChecker
+from perflint.import_time_checker import ImportTimeChecker
+from perflint.specialization_checker import SpecializationChecker
+from perflint.concurrency_checker import ConcurrencyChecker
+from perflint.dispatch_checker import DispatchChecker
+from perflint.history_checker import HistoryChecker, add_history_reporter
+from perflint.inference_checker import InferenceBudgetChecker
+from perflint.reporters import JSONLinesReporter, SARIFReporter
 
 if TYPE_CHECKING:
     from pylint.lint import PyLinter
 
 __version__ = "0.8.1"
 
+# Checkers in the order they are registered, used by the perflint command to enable their messages.
+CHECKERS = (
+    ForLoopChecker,
+    LoopInvariantChecker,
+    ListChecker,
+    ComprehensionChecker,
+    FunctionCallChecker,
+    ConstantFoldingChecker,
+    AllocationChecker,
+    IOChecker,
+    MaterializationChecker,
+    ZeroCopyChecker,
+    MemoizationChecker,
+    DBAPIChecker,
+    LoggingChecker,
+    ImportTimeChecker,
+    SpecializationChecker,
+    ConcurrencyChecker,
+    DispatchChecker,
+    HistoryChecker,
+    InferenceBudgetChecker,
+)
+
 
 def register(linter: "PyLinter") -> None:
     """This required method auto registers the checker during initialization.
@@ -17,7 +56,12 @@ def register(linter: "PyLinter") -> None:
     :param linter: The linter to register the checker to.
     """
 
-    linter.register_checker(ForLoopChecker(linter))
-    linter.register_checker(LoopInvariantChecker(linter))
-    linter.register_checker(ListChecker(linter))
-    linter.register_checker(ComprehensionChecker(linter))
+    for checker in CHECKERS:
+        linter.register_checker(checker(linter))
+    linter.register_reporter(JSONLinesReporter)
+    linter.register_reporter(SARIFReporter)
+
+
+def load_configuration(linter: "PyLinter") -> None:
+    """Called by pylint once the options are parsed and the reporters loaded."""
+    add_history_reporter(linter)
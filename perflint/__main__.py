@@ -1,28 +1,70 @@
+import argparse
+import json
+import sys
+from typing import Optional, Sequence
+
 import pylint
 from pylint.lint import Run as PylintRun
-import sys
 
-from perflint.for_loop_checker import ForLoopChecker, LoopInvariantChecker
-from perflint.list_checker import ListChecker
-from perflint.comprehension_checker import ComprehensionChecker
+from perflint import CHECKERS
+from perflint.history import history_main
+from perflint.sharding import (
+    USAGE_ERROR,
+    ShardError,
+    default_output,
+    merge_main,
+    parse_shard,
+    run_shard,
+)
 
 
-pylint.modify_sys_path()
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    pylint.modify_sys_path()
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv[:1] == ["merge"]:
+        return merge_main(argv[1:])
+    if argv[:1] == ["history"]:
+        return history_main(argv[1:])
 
-rules = (
-    list(ForLoopChecker.msgs.keys())
-    + list(LoopInvariantChecker.msgs.keys())
-    + list(ListChecker.msgs.keys())
-    + list(ComprehensionChecker.msgs.keys())
-)
+    parser = argparse.ArgumentParser(prog="perflint", add_help=False, allow_abbrev=False)
+    parser.add_argument("--shard", type=parse_shard)
+    parser.add_argument("--shard-output")
+    sharding, pylint_args = parser.parse_known_args(argv)
+
+    rules = [msgid for checker in CHECKERS for msgid in checker.msgs]
+
+    args = []
+    args.append("--load-plugins=perflint")
+    args.append("--disable=all")
+    args.append("--enable={0}".format(",".join(rules)))
+    args.extend(pylint_args)
+
+    if sharding.shard is None:
+        PylintRun(args)
+        return 0  # PylintRun exits
+
+    try:
+        result = run_shard(args, sharding.shard)
+    except ShardError as ex:
+        print(f"perflint --shard: {ex}", file=sys.stderr)
+        return USAGE_ERROR
+    output = sharding.shard_output or default_output(sharding.shard)
+    try:
+        with open(output, "w", encoding="utf-8") as file:
+            json.dump(result, file)
+    except OSError as ex:
+        print(ex, file=sys.stderr)
+        return USAGE_ERROR
+    print(
+        "Shard {0}/{1}: {2} messages written to {3}".format(
+            *sharding.shard, len(result["messages"]), output
+        )
+    )
+    return 0
 
-args = []
-args.append("--load-plugins=perflint")
-args.append("--disable=all")
-args.append("--enable={0}".format(",".join(rules)))
-args.extend(sys.argv[1:])
 
-try:
-    PylintRun(args)
-except KeyboardInterrupt:
-    sys.exit(1)
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        sys.exit(1)
@@ -0,0 +1,221 @@
+from typing import Optional
+from astroid import nodes
+from astroid.const import Context
+from pylint.checkers import BaseChecker
+from pylint.checkers import utils as checker_utils
+
+from perflint.defuse import get_def_use
+from perflint.inference import safe_infer
+from perflint.loop_context import Loop, get_loop_context, in_loop
+
+
+constant_replacements = {
+    "list": "tuple",
+    "set": "frozenset",
+    "dict": "module-level constant",
+}
+
+container_nodes = (
+    nodes.List,
+    nodes.Tuple,
+    nodes.Set,
+    nodes.Dict,
+    nodes.ListComp,
+    nodes.SetComp,
+    nodes.DictComp,
+)
+
+
+def _is_atomic(node: nodes.NodeNG) -> bool:
+    """Values which never hold references to other objects are atomic."""
+    if isinstance(node, nodes.JoinedStr):
+        return True
+    if not isinstance(node, nodes.Const):
+        node = safe_infer(node)
+    return isinstance(node, nodes.Const)
+
+
+def is_gc_tracked(node: nodes.NodeNG) -> bool:
+    """Check if a container allocation creates an object tracked by the garbage collector.
+
+    Lists, sets and comprehensions are always tracked. Dictionaries and tuples
+    are only tracked when they can hold references to other containers.
+    """
+    if isinstance(node, nodes.Dict):
+        return not all(_is_atomic(v) for _, v in node.items)
+    if isinstance(node, nodes.Tuple):
+        return not all(_is_atomic(e) for e in node.elts)
+    return True
+
+
+def _is_constant_literal(node: nodes.NodeNG) -> bool:
+    if isinstance(node, (nodes.List, nodes.Tuple, nodes.Set)):
+        return bool(node.elts) and all(isinstance(e, nodes.Const) for e in node.elts)
+    if isinstance(node, nodes.Dict):
+        return bool(node.items) and all(
+            isinstance(k, nodes.Const) and isinstance(v, nodes.Const)
+            for k, v in node.items
+        )
+    return False
+
+
+def _is_folded_by_compiler(node: nodes.NodeNG) -> bool:
+    """The compiler turns constant operands of `in` and for-loop iterables into constants."""
+    if isinstance(node, nodes.Tuple) and (
+        not node.elts or _is_constant_literal(node)
+    ):
+        return True
+    if not isinstance(node, (nodes.List, nodes.Set)) or not _is_constant_literal(node):
+        return False
+    if isinstance(node.parent, nodes.Compare):
+        return any(
+            op in ("in", "not in") and right is node for op, right in node.parent.ops
+        )
+    return isinstance(node.parent, nodes.For) and node.parent.iter is node
+
+
+def _is_swap(node: nodes.NodeNG) -> bool:
+    """`a, b = b, a` is compiled without building a tuple."""
+    return (
+        isinstance(node, nodes.Tuple)
+        and isinstance(node.parent, nodes.Assign)
+        and node.parent.value is node
+        and isinstance(node.parent.targets[0], (nodes.Tuple, nodes.List))
+        and len(node.parent.targets[0].elts) == len(node.elts)
+    )
+
+
+def _is_allocation(node: nodes.NodeNG) -> bool:
+    """Check if a container expression allocates a new object when it's evaluated."""
+    if getattr(node, "ctx", None) in (Context.Store, Context.Del):
+        return False
+    return not (_is_folded_by_compiler(node) or _is_swap(node))
+
+
+def _escapes(node: nodes.NodeNG) -> bool:
+    """Check if a value is passed to a call, returned, yielded or put in another container."""
+    parent = node.parent
+    if isinstance(parent, nodes.Call):
+        return node is not parent.func
+    return isinstance(
+        parent,
+        (
+            nodes.Keyword,
+            nodes.Starred,
+            nodes.Return,
+            nodes.Yield,
+            nodes.YieldFrom,
+            nodes.List,
+            nodes.Tuple,
+            nodes.Set,
+            nodes.Dict,
+        ),
+    )
+
+
+def _assigned_name(node: nodes.NodeNG) -> Optional[str]:
+    """Get the name a container is assigned to, as in ``name = [...]``."""
+    parent = node.parent
+    if isinstance(parent, nodes.Assign) and parent.value is node and len(parent.targets) == 1:
+        target = parent.targets[0]
+    elif isinstance(parent, nodes.AnnAssign) and parent.value is node:
+        target = parent.target
+    else:
+        return None
+    return target.name if isinstance(target, nodes.AssignName) else None
+
+
+def is_shared_safely(node: nodes.NodeNG) -> bool:
+    """Check if a container could be built once and shared by every iteration.
+
+    It can't be when it's mutated, or outlives the iteration it's built in.
+    """
+    if _escapes(node):
+        return False
+    name = _assigned_name(node)
+    if name is None:
+        return True
+    scope = node.scope()
+    if get_def_use(scope).is_mutated(name):
+        return False
+    return not any(
+        _escapes(use) for use in scope.nodes_of_class(nodes.Name) if use.name == name
+    )
+
+
+class AllocationChecker(BaseChecker):
+    """
+    Check for short-lived container allocations inside loops.
+    """
+
+    name = "allocation-checker"
+    priority = -1
+    msgs = {
+        "W8701": (
+            "Constant %s is rebuilt on every iteration, define it once outside of the loop as a %s.",
+            "loop-constant-container",
+            "Containers of constants are allocated on each iteration of a loop.",
+        ),
+        "W8702": (
+            "Loop allocates %d containers per iteration, %d of them tracked by the garbage collector. Consider reusing a preallocated buffer.",
+            "loop-container-allocations",
+            "Short-lived containers cost an allocation and, when tracked by the garbage collector, make collections more frequent.",
+        ),
+    }
+    options = (
+        (
+            "max-loop-allocations",
+            {
+                "default": 3,
+                "type": "int",
+                "metavar": "<int>",
+                "help": "Maximum number of containers allocated per iteration of a loop.",
+            },
+        ),
+    )
+
+    @checker_utils.only_required_for_messages("loop-container-allocations")
+    def leave_for(self, node: nodes.For) -> None:
+        self._leave_loop(node)
+
+    @checker_utils.only_required_for_messages("loop-container-allocations")
+    def leave_while(self, node: nodes.While) -> None:
+        self._leave_loop(node)
+
+    def _leave_loop(self, node: Loop) -> None:
+        allocations = [
+            child
+            for child in get_loop_context(node).evaluated
+            if isinstance(child, container_nodes) and _is_allocation(child)
+        ]
+        if len(allocations) <= self.linter.config.max_loop_allocations:
+            return
+        tracked = sum(1 for allocation in allocations if is_gc_tracked(allocation))
+        self.add_message(
+            "loop-container-allocations",
+            node=node,
+            args=(len(allocations), tracked),
+        )
+
+    def _visit_container(self, node: nodes.NodeNG) -> None:
+        if not in_loop(node) or not _is_allocation(node):
+            return
+        if _is_constant_literal(node) and is_shared_safely(node):
+            kind = node.pytype().split(".")[-1]
+            self.add_message(
+                "loop-constant-container",
+                node=node,
+                args=(kind, constant_replacements[kind]),
+            )
+
+    @checker_utils.only_required_for_messages("loop-constant-container")
+    def visit_list(self, node: nodes.List) -> None:
+        self._visit_container(node)
+
+    @checker_utils.only_required_for_messages("loop-constant-container")
+    def visit_set(self, node: nodes.Set) -> None:
+        self._visit_container(node)
+
+    @checker_utils.only_required_for_messages("loop-constant-container")
+    def visit_dict(self, node: nodes.Dict) -> None:
+        self._visit_container(node)
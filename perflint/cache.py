@@ -0,0 +1,53 @@
+"""Analysis results kept for the most recently checked modules only.
+
+The checkers cache what they compute about nodes (loop contexts, def-use
+indexes, function summaries) because several checkers, and several visits of
+the same checker, query the same nodes. astroid keeps the tree of every module
+linted until the end of the run, so caches keyed by nodes would otherwise
+grow with the size of the whole project. A ``ModuleCache`` groups its values
+by the module of their node and releases the values of the least recently
+used module once more than ``MODULES_KEPT`` modules are cached, which keeps
+the memory used by the analysis proportional to the modules being checked.
+
+Values of a released module are computed again if they are needed again, for
+example when a function of an imported module is summarised.
+"""
+from collections import OrderedDict
+from typing import Dict, Generic, Optional, TypeVar
+from astroid import nodes
+
+MODULES_KEPT = 8  # The module being checked, and the modules it calls into
+
+V = TypeVar("V")
+
+
+class ModuleCache(Generic[V]):
+    """Values by node, released a module at a time."""
+
+    def __init__(self, modules: int = MODULES_KEPT):
+        self.modules = modules
+        self._values: "OrderedDict[nodes.Module, Dict[nodes.NodeNG, V]]" = OrderedDict()
+
+    def _module_values(self, node: nodes.NodeNG) -> Dict[nodes.NodeNG, V]:
+        module = node.root()
+        values = self._values.get(module)
+        if values is None:
+            values = self._values[module] = {}
+            if len(self._values) > self.modules:
+                self._values.popitem(last=False)
+        else:
+            self._values.move_to_end(module)
+        return values
+
+    def get(self, node: nodes.NodeNG) -> Optional[V]:
+        return self._module_values(node).get(node)
+
+    def __setitem__(self, node: nodes.NodeNG, value: V) -> None:
+        self._module_values(node)[node] = value
+
+    def cached_modules(self) -> int:
+        """Get the number of modules with cached values."""
+        return len(self._values)
+
+    def clear(self) -> None:
+        self._values.clear()
@@ -0,0 +1,254 @@
+"""Project-wide call graph, used to find functions which are called from inside loops.
+
+A function called once per iteration of a loop is as hot as the loop body, so
+checkers which only apply inside loops can treat its body as being in a loop.
+The call graph of a package is built lazily: the callers of a function are
+only looked for in the modules of the package which mention its name. The
+calls of each module can be persisted to an index file, which is used until
+a module of the package changes.
+"""
+import hashlib
+import json
+import os
+import re
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
+from astroid import MANAGER, bases, nodes
+from astroid.exceptions import AstroidBuildingError
+from astroid.modutils import modpath_from_file
+
+from perflint.cache import ModuleCache
+from perflint.inference import budget, safe_infer
+from perflint.loop_context import loop_depth
+
+INDEX_VERSION = 3
+MAX_HEAT = 3
+MODULE_SCOPE = "<module>"
+
+Edge = Tuple[str, str, int]  # Caller, callee and the loop depth of the call
+
+
+def function_key(func: Union[nodes.FunctionDef, nodes.Module]) -> str:
+    """Identify a function by its file and qualified name within the module."""
+    module = func.root()
+    path = os.path.abspath(module.file) if module.file else module.name
+    if isinstance(func, nodes.Module):
+        return f"{path}::{MODULE_SCOPE}"
+    return f"{path}::{func.qname()[len(module.name) + 1:]}"
+
+
+def module_edges(module: nodes.Module, root: Optional[str] = None) -> List[Edge]:
+    """Find the calls between functions in a module, and the loop depth of each call.
+
+    When ``root`` is given, only calls to functions in modules under it are included.
+    """
+    edges = []
+    for call in module.nodes_of_class(nodes.Call):
+        callee = safe_infer(call.func)
+        if isinstance(callee, bases.BoundMethod):
+            callee = callee._proxied
+        if not isinstance(callee, nodes.FunctionDef):
+            continue
+        callee_file = callee.root().file
+        if root is not None and (
+            callee_file is None or not os.path.abspath(callee_file).startswith(root)
+        ):
+            continue  # Outside of the project
+        caller = call.frame()
+        if not isinstance(caller, (nodes.FunctionDef, nodes.Module)):
+            continue  # Lambdas and class bodies
+        edges.append((function_key(caller), function_key(callee), loop_depth(call)))
+    return edges
+
+
+def package_root(path: str) -> str:
+    """Get the directory of the top-level package containing a module."""
+    directory = os.path.dirname(os.path.abspath(path))
+    while os.path.exists(os.path.join(os.path.dirname(directory), "__init__.py")):
+        directory = os.path.dirname(directory)
+    return directory
+
+
+def project_files(path: str) -> Iterator[str]:
+    """Get the modules of the project containing a module."""
+    yield from root_files(package_root(path))
+
+
+def root_files(root: str) -> Iterator[str]:
+    """Get the modules of the project in a directory returned by ``package_root``."""
+    if not os.path.exists(os.path.join(root, "__init__.py")):
+        # A standalone module, only the modules next to it are in the project
+        for name in sorted(os.listdir(root)):
+            if name.endswith(".py"):
+                yield os.path.join(root, name)
+        return
+    for directory, subdirectories, files in os.walk(root):
+        subdirectories[:] = sorted(
+            d for d in subdirectories if not d.startswith(".") and d != "__pycache__"
+        )
+        for name in sorted(files):
+            if name.endswith(".py"):
+                yield os.path.join(directory, name)
+
+
+class CallGraph:
+    """Calls between functions, and the loop depth they're made at."""
+
+    def __init__(self):
+        self._callers: Dict[str, List[Tuple[str, int]]] = {}
+        self._heat: Dict[str, int] = {}
+
+    def _add(self, edges: List[Edge]) -> None:
+        for caller, callee, depth in edges:
+            self._callers.setdefault(callee, []).append((caller, depth))
+
+    def add_edges(self, edges: List[Edge]) -> None:
+        self._add(edges)
+        self._heat.clear()
+
+    def _load_callers(self, key: str) -> None:
+        """Add the calls which may be to a function, in graphs built lazily."""
+
+    def _key_heat(self, key: str) -> int:
+        if key in self._heat:
+            return self._heat[key]
+        self._load_callers(key)
+        self._heat[key] = 0  # Recursive calls don't make a function hotter
+        heat = 0
+        for caller, depth in self._callers.get(key, ()):
+            heat = max(heat, depth + self._key_heat(caller))
+            if heat >= MAX_HEAT:
+                heat = MAX_HEAT
+                break
+        self._heat[key] = heat
+        return heat
+
+    def heat(self, func: nodes.FunctionDef) -> int:
+        """Get the number of loops a function is called from, across the project."""
+        return self._key_heat(function_key(func))
+
+
+def project_stamp(root: str) -> str:
+    """Identify the state of every module of a project, by path, size and modification time."""
+    digest = hashlib.sha1()
+    for path in root_files(root):
+        stat = os.stat(path)
+        digest.update(f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+class CallGraphIndex:
+    """Persisted call graph edges of each file of a project.
+
+    Calls are inferred through other modules, so the edges of an unchanged file
+    can change when another file does. The index of a project is only used
+    while none of its modules changed.
+    """
+
+    def __init__(self, path: Optional[str], root: str):
+        self.path = path
+        self.root = root
+        self._roots: Dict[str, dict] = {}
+        self._files: Dict[str, list] = {}
+        self._changed = False
+        self.stamp = project_stamp(root) if path else ""
+        if path and os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as index_file:
+                    index = json.load(index_file)
+                if index.get("version") == INDEX_VERSION:
+                    self._roots = index["roots"]
+                    entry = self._roots.get(root)
+                    if entry is not None and entry["stamp"] == self.stamp:
+                        self._files = entry["files"]
+            except (OSError, ValueError, KeyError, TypeError):
+                self._roots, self._files = {}, {}
+
+    def edges(self, path: str) -> List[Edge]:
+        if path in self._files:
+            return [tuple(edge) for edge in self._files[path]]
+        try:
+            modname = ".".join(modpath_from_file(path))
+        except ImportError:
+            modname = os.path.splitext(os.path.basename(path))[0]
+        fallbacks = budget.run_fallbacks
+        try:
+            module = MANAGER.ast_from_file(path, modname, source=True)
+        except (AstroidBuildingError, SyntaxError):
+            edges = []
+        else:
+            edges = module_edges(module, self.root)
+        if budget.run_fallbacks != fallbacks:
+            return edges  # Some calls weren't inferred, don't persist partial edges
+        self._files[path] = [list(edge) for edge in edges]
+        self._changed = True
+        return edges
+
+    def save(self) -> None:
+        if not self.path or not self._changed:
+            return
+        self._roots[self.root] = {"stamp": self.stamp, "files": self._files}
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as index_file:
+            json.dump({"version": INDEX_VERSION, "roots": self._roots}, index_file)
+        self._changed = False
+
+
+class ProjectCallGraph(CallGraph):
+    """Call graph of a project, reading the calls of a module when they may be to a function looked up."""
+
+    def __init__(self, root: str, index_path: Optional[str] = None):
+        super().__init__()
+        self.index = CallGraphIndex(index_path, root)
+        self._root = root
+        self._files_by_name: Optional[Dict[str, List[str]]] = None
+        self._loaded: Set[str] = set()
+
+    def _files_using(self, name: str) -> List[str]:
+        """Get the modules of the project which mention a name, reading each module once."""
+        if self._files_by_name is None:
+            self._files_by_name = {}
+            for path in root_files(self._root):
+                try:
+                    with open(path, encoding="utf-8", errors="replace") as module_file:
+                        names = set(re.findall(r"\w+", module_file.read()))
+                except OSError:
+                    continue
+                for word in names:
+                    self._files_by_name.setdefault(word, []).append(path)
+        return self._files_by_name.get(name, [])
+
+    def _load_callers(self, key: str) -> None:
+        # Calls to a function, or its alias, are in modules which mention its name
+        name = key.rpartition("::")[2].rpartition(".")[2]
+        if name == MODULE_SCOPE:
+            return
+        for path in self._files_using(name):
+            if path not in self._loaded:
+                self._loaded.add(path)
+                self._add(self.index.edges(path))
+
+
+# Call graphs of projects by root directory, and of modules without a file.
+_project_graphs: Dict[str, ProjectCallGraph] = {}
+_module_graphs: "ModuleCache[CallGraph]" = ModuleCache()
+
+
+def get_call_graph(module: nodes.Module, index_path: Optional[str] = None) -> CallGraph:
+    """Get the call graph of the project containing a module."""
+    if module.file is None or not os.path.exists(module.file):
+        graph = _module_graphs.get(module)
+        if graph is None:
+            graph = _module_graphs[module] = CallGraph()
+            graph.add_edges(module_edges(module))
+        return graph
+
+    root = package_root(module.file)
+    if root not in _project_graphs:
+        _project_graphs[root] = ProjectCallGraph(root, index_path)
+    return _project_graphs[root]
+
+
+def save_indexes() -> None:
+    """Persist the calls read by the project call graphs to their index files."""
+    for graph in _project_graphs.values():
+        graph.index.save()
@@ -1,7 +1,8 @@
 from astroid import nodes
 from pylint.checkers import BaseChecker
 from pylint.checkers import utils as checker_utils
-from astroid.helpers import safe_infer
+
+from perflint.inference import safe_infer
 
 
 class ComprehensionChecker(BaseChecker):
@@ -29,9 +30,6 @@ class ComprehensionChecker(BaseChecker):
         ),
     }
 
-    def visit_for(self, node: nodes.For):
-        pass
-
     @checker_utils.only_required_for_messages(
         "use-list-comprehension", "use-dict-comprehension", "use-list-copy"
     )
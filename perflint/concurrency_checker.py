@@ -0,0 +1,208 @@
+from typing import Optional
+from astroid import bases, nodes
+from pylint.checkers import BaseChecker
+from pylint.checkers import utils as checker_utils
+
+from perflint.inference import safe_infer
+from perflint.io_checker import call_qname
+from perflint.loop_context import LoopContext, enclosing_loop
+from perflint.purity import Effects, function_effects, is_project_function
+from perflint.utils import assigned_value, self_attribute_assignments
+
+
+thread_pool_types = {
+    "concurrent.futures.thread.ThreadPoolExecutor",
+    "multiprocessing.pool.ThreadPool",
+}
+pool_types = {
+    *thread_pool_types,
+    "concurrent.futures.process.ProcessPoolExecutor",
+    "multiprocessing.pool.Pool",
+}
+lock_types = {
+    "threading.lock",
+    "threading._RLock",
+    "threading.Condition",
+    "threading.Semaphore",
+    "threading.BoundedSemaphore",
+    "multiprocessing.synchronize.Lock",
+    "multiprocessing.synchronize.RLock",
+}
+# threading.RLock() can't be inferred
+lock_factories = {"threading.Lock", "threading.RLock", "_thread.allocate_lock"}
+pool_methods = (
+    "submit",
+    "map",
+    "apply",
+    "apply_async",
+    "imap",
+    "imap_unordered",
+    "starmap",
+    "starmap_async",
+    "map_async",
+)
+
+
+def instance_type(node: nodes.NodeNG) -> Optional[str]:
+    """Get the qualified name of the class of an expression, if it infers to an instance."""
+    inferred = safe_infer(node)
+    if isinstance(inferred, bases.Instance):
+        return inferred.pytype()
+    return None
+
+
+def _is_lock_value(value: Optional[nodes.NodeNG]) -> bool:
+    return isinstance(value, nodes.Call) and (
+        instance_type(value) in lock_types or call_qname(value) in lock_factories
+    )
+
+
+def is_lock(node: nodes.NodeNG) -> bool:
+    """Check if an expression is a ``threading`` or ``multiprocessing`` lock."""
+    if instance_type(node) in lock_types:
+        return True
+    if isinstance(node, nodes.Attribute):
+        assignments = self_attribute_assignments(node)
+    elif isinstance(node, nodes.Name):
+        _, assignments = node.lookup(node.name)
+    else:
+        return False
+    return any(_is_lock_value(assigned_value(assigned)) for assigned in assignments)
+
+
+def is_cpu_bound(func: nodes.NodeNG) -> bool:
+    """Check if a function is pure Python which loops without doing any I/O.
+
+    Calls which can't be analysed, such as into C extensions which may release
+    the GIL, count as I/O.
+    """
+    if isinstance(func, bases.BoundMethod):
+        func = func._proxied
+    if not isinstance(func, nodes.FunctionDef) or not is_project_function(func):
+        return False
+    if func.is_generator() or isinstance(func, nodes.AsyncFunctionDef):
+        return False
+    if function_effects(func) & Effects.IO:
+        return False
+    loops = func.nodes_of_class((nodes.For, nodes.While, nodes.Comprehension))
+    return next(loops, None) is not None
+
+
+def _is_submit(node: Optional[nodes.NodeNG]) -> bool:
+    return (
+        isinstance(node, nodes.Call)
+        and isinstance(node.func, nodes.Attribute)
+        and node.func.attrname in ("submit", "apply_async")
+        and instance_type(node.func.expr) in pool_types
+    )
+
+
+def _is_coarse_enough(loop: LoopContext, statement: nodes.NodeNG) -> bool:
+    """Check if a lock taken by a statement of a loop could be taken around the loop.
+
+    Locks taken in inner loops, or for the whole body of a loop, are reported.
+    Locks held for part of the body of an outer loop are fine-grained on purpose.
+    """
+    if loop.depth > 1:
+        return True
+    if isinstance(statement, nodes.With):
+        return loop.node.body == [statement]
+    return loop.node.body[0] is statement
+
+
+class ConcurrencyChecker(BaseChecker):
+    """
+    Check for thread and process pools, locks and futures used in ways which serialize work.
+    """
+
+    name = "concurrency-checker"
+    priority = -1
+    msgs = {
+        "W9601": (
+            'Function "%s" is CPU-bound pure Python, threads can\'t run it in parallel because of the GIL. Use a ProcessPoolExecutor instead.',
+            "cpu-bound-thread-pool",
+            "Only one thread runs Python bytecode at a time, thread pools only speed up work which waits on I/O or releases the GIL.",
+        ),
+        "W9602": (
+            '"%s" creates a pool on every iteration, create it once before the loop.',
+            "pool-created-in-loop",
+            "Starting and stopping worker threads or processes is expensive, pools are meant to be reused.",
+        ),
+        "W9603": (
+            'Lock "%s" is acquired on every iteration, acquire it once around the loop or batch the work done while holding it.',
+            "lock-in-loop",
+            "Acquiring and releasing a lock has an overhead, and lets other threads contend for it on every iteration.",
+        ),
+        "W9604": (
+            "result() is called right after submitting the task, which waits for each task before submitting the next. Submit all the tasks first, then use as_completed() or map().",
+            "result-after-submit",
+            "Waiting on each future in the loop which submits them runs the tasks one at a time.",
+        ),
+    }
+
+    @checker_utils.only_required_for_messages(
+        "cpu-bound-thread-pool",
+        "pool-created-in-loop",
+        "lock-in-loop",
+        "result-after-submit",
+    )
+    def visit_call(self, node: nodes.Call) -> None:
+        loop = enclosing_loop(node)
+        if loop is not None and instance_type(node) in pool_types:
+            self.add_message(
+                "pool-created-in-loop", node=node, args=(node.func.as_string(),)
+            )
+            return
+        if node.func.as_string().endswith("Thread"):
+            self._check_thread(node)
+            return
+        if not isinstance(node.func, nodes.Attribute):
+            return
+        method = node.func.attrname
+        if method in pool_methods and node.args:
+            if instance_type(node.func.expr) in thread_pool_types:
+                self._check_cpu_bound(node.args[0])
+        elif method == "acquire" and loop is not None:
+            if is_lock(node.func.expr) and _is_coarse_enough(loop, node.statement()):
+                self.add_message(
+                    "lock-in-loop", node=node, args=(node.func.expr.as_string(),)
+                )
+        elif method in ("result", "get") and loop is not None:
+            self._check_result(node, loop)
+
+    def _check_thread(self, node: nodes.Call) -> None:
+        klass = safe_infer(node.func)
+        if not isinstance(klass, nodes.ClassDef) or klass.qname() != "threading.Thread":
+            return
+        for keyword in node.keywords or ():
+            if keyword.arg == "target":
+                self._check_cpu_bound(keyword.value)
+
+    def _check_cpu_bound(self, func: nodes.NodeNG) -> None:
+        if is_cpu_bound(safe_infer(func)):
+            self.add_message(
+                "cpu-bound-thread-pool", node=func, args=(func.as_string(),)
+            )
+
+    def _check_result(self, node: nodes.Call, loop: LoopContext) -> None:
+        """Look for ``pool.submit(...).result()``, or a future waited on in the loop submitting it."""
+        future = node.func.expr
+        if _is_submit(future):
+            self.add_message("result-after-submit", node=node)
+            return
+        if not isinstance(future, nodes.Name):
+            return
+        _, assignments = future.lookup(future.name)
+        for assigned in assignments:
+            if _is_submit(assigned_value(assigned)) and loop.node.parent_of(assigned):
+                self.add_message("result-after-submit", node=node)
+                return
+
+    @checker_utils.only_required_for_messages("lock-in-loop")
+    def visit_with(self, node: nodes.With) -> None:
+        loop = enclosing_loop(node)
+        if loop is None or not _is_coarse_enough(loop, node):
+            return
+        for item, _ in node.items:
+            if is_lock(item):
+                self.add_message("lock-in-loop", node=node, args=(item.as_string(),))
@@ -0,0 +1,154 @@
+from typing import Union
+from astroid import nodes
+from pylint.checkers import BaseChecker
+from pylint.checkers import utils as checker_utils
+
+from perflint.inference import safe_infer
+from perflint.loop_context import in_loop
+
+
+constant_types = (int, float, complex, str, bytes)
+
+
+def _is_literal(node: nodes.NodeNG) -> bool:
+    if isinstance(node, nodes.Const):
+        return isinstance(node.value, constant_types) and not isinstance(
+            node.value, bool
+        )
+    if isinstance(node, nodes.UnaryOp):
+        return _is_literal(node.operand)
+    return False
+
+
+def _is_constant_assignment(assignments) -> bool:
+    """A name is constant when it's assigned exactly once, to a literal."""
+    if len(assignments) != 1:
+        return False
+    assigned = assignments[0]
+    if not isinstance(assigned, nodes.AssignName):
+        return False
+    if not isinstance(assigned.parent, nodes.Assign):
+        return False
+    return _is_literal(assigned.parent.value)
+
+
+def is_module_constant(node: nodes.Name) -> bool:
+    """Check if a name refers to a never-reassigned module-level constant."""
+    if checker_utils.is_builtin(node.name):
+        return False
+    scope, _ = node.lookup(node.name)
+    if not isinstance(scope, nodes.Module):
+        return False
+    return _is_constant_assignment(scope.globals.get(node.name, []))
+
+
+def _is_class_constant(klass: nodes.ClassDef, attrname: str) -> bool:
+    if attrname in klass.instance_attrs:
+        return False
+    return _is_constant_assignment(klass.locals.get(attrname, []))
+
+
+def self_class(node: nodes.Attribute) -> Union[None, nodes.ClassDef]:
+    """Get the class of a ``self.attr`` expression inside a method."""
+    if not isinstance(node.expr, nodes.Name) or node.expr.name != "self":
+        return None
+    frame = node.frame()
+    if not isinstance(frame, nodes.FunctionDef) or frame.type != "method":
+        return None
+    if not isinstance(frame.parent, nodes.ClassDef):
+        return None
+    return frame.parent
+
+
+def is_class_constant(node: nodes.Attribute) -> bool:
+    """Check if ``Class.ATTR`` or ``self.ATTR`` refers to a class-level constant."""
+    klass = self_class(node)
+    if klass is None:
+        klass = safe_infer(node.expr)
+    if not isinstance(klass, nodes.ClassDef):
+        return False
+    return _is_class_constant(klass, node.attrname)
+
+
+def is_constant_expression(node: nodes.NodeNG) -> bool:
+    """Check if an expression is built only from literals and named constants."""
+    if isinstance(node, nodes.Const):
+        return _is_literal(node)
+    if isinstance(node, nodes.Name):
+        return is_module_constant(node)
+    if isinstance(node, nodes.Attribute):
+        return is_class_constant(node)
+    if isinstance(node, nodes.UnaryOp):
+        return is_constant_expression(node.operand)
+    if isinstance(node, nodes.BinOp):
+        return is_constant_expression(node.left) and is_constant_expression(
+            node.right
+        )
+    return False
+
+
+def _uses_named_constant(node: nodes.NodeNG) -> bool:
+    if isinstance(node, (nodes.Name, nodes.Attribute)):
+        return True
+    return any(_uses_named_constant(child) for child in node.get_children())
+
+
+class ConstantFoldingChecker(BaseChecker):
+    """
+    Check for constant expressions that could be folded outside of loops.
+    """
+
+    name = "constant-folding-checker"
+    priority = -1
+    msgs = {
+        "W8601": (
+            'Expression "%s" only uses constants, fold it into a local variable before the loop.',
+            "loop-constant-expression",
+            "Python only folds expressions of literals, named constants are evaluated on every iteration.",
+        ),
+        "W8602": (
+            'Class constant "%s" is read through self in a loop, copy it to a local variable before the loop.',
+            "class-constant-via-self-in-loop",
+            "Reading a class attribute through an instance checks the instance dictionary first.",
+        ),
+    }
+
+    def _is_foldable(self, node: nodes.NodeNG) -> bool:
+        return isinstance(
+            node, (nodes.BinOp, nodes.UnaryOp)
+        ) and is_constant_expression(node)
+
+    def _visit_operation(self, node: Union[nodes.BinOp, nodes.UnaryOp]) -> None:
+        if not in_loop(node):
+            return
+        if self._is_foldable(node.parent):
+            return  # Only report the outermost expression
+        if not self._is_foldable(node):
+            return
+        if not _uses_named_constant(node):
+            return  # The compiler already folds expressions of literals
+        self.add_message("loop-constant-expression", node=node, args=(node.as_string(),))
+
+    @checker_utils.only_required_for_messages("loop-constant-expression")
+    def visit_binop(self, node: nodes.BinOp) -> None:
+        self._visit_operation(node)
+
+    @checker_utils.only_required_for_messages("loop-constant-expression")
+    def visit_unaryop(self, node: nodes.UnaryOp) -> None:
+        self._visit_operation(node)
+
+    @checker_utils.only_required_for_messages("class-constant-via-self-in-loop")
+    def visit_attribute(self, node: nodes.Attribute) -> None:
+        if not in_loop(node):
+            return
+        klass = self_class(node)
+        if klass is None or not _is_class_constant(klass, node.attrname):
+            return
+        parent = node.parent
+        while isinstance(parent, (nodes.BinOp, nodes.UnaryOp)):
+            if self._is_foldable(parent):
+                return  # Reported as part of a constant expression
+            parent = parent.parent
+        self.add_message(
+            "class-constant-via-self-in-loop", node=node, args=(node.as_string(),)
+        )
@@ -0,0 +1,162 @@
+from typing import Optional
+from astroid import bases, nodes
+from pylint.checkers import BaseChecker
+from pylint.checkers import utils as checker_utils
+
+from perflint.inference import safe_infer
+from perflint.io_checker import call_qname
+from perflint.loop_context import enclosing_loop
+from perflint.utils import assigned_value, self_attribute_assignments
+
+
+connect_functions = {
+    "_sqlite3.connect",
+    "sqlite3.connect",
+    "psycopg.connect",
+    "psycopg2.connect",
+    "pymysql.connect",
+    "MySQLdb.connect",
+    "mysql.connector.connect",
+    "oracledb.connect",
+    "cx_Oracle.connect",
+    "pyodbc.connect",
+}
+connection_type_names = ("Connection", "connection")
+cursor_type_names = ("Cursor", "cursor")
+batched_statements = ("INSERT", "UPDATE", "DELETE", "REPLACE")
+MAX_DEPTH = 4
+
+
+def _type_kind(name: str) -> Optional[str]:
+    if name in connection_type_names:
+        return "connection"
+    if name in cursor_type_names:
+        return "cursor"
+    return None
+
+
+def _annotation_kind(annotation: nodes.NodeNG) -> Optional[str]:
+    return _type_kind(annotation.as_string().split("[")[0].split(".")[-1])
+
+
+def _value_kind(value: nodes.NodeNG, depth: int) -> Optional[str]:
+    """Get the kind of DB-API object an expression creates."""
+    if not isinstance(value, nodes.Call):
+        return None
+    qname = call_qname(value) or value.func.as_string()
+    if qname in connect_functions:
+        return "connection"
+    if isinstance(value.func, nodes.Attribute) and db_kind(value.func.expr, depth + 1):
+        if value.func.attrname == "cursor":
+            return "cursor"
+        if value.func.attrname == "execute":
+            return "cursor"  # Connection.execute() returns a new cursor
+    return None
+
+
+def _self_attribute_kind(node: nodes.Attribute, depth: int) -> Optional[str]:
+    """Resolve ``self.conn`` through the assignments to the attribute in its class."""
+    for assigned in self_attribute_assignments(node):
+        value = assigned_value(assigned)
+        kind = _value_kind(value, depth) if value is not None else None
+        if kind is not None:
+            return kind
+    return None
+
+
+def db_kind(node: nodes.NodeNG, _depth: int = 0) -> Optional[str]:
+    """Get whether an expression is a DB-API "connection" or "cursor", if it is one."""
+    if _depth > MAX_DEPTH:
+        return None
+    kind = _value_kind(node, _depth)
+    if kind is not None:
+        return kind
+    if isinstance(node, nodes.Attribute):
+        return _self_attribute_kind(node, _depth)
+    if not isinstance(node, nodes.Name):
+        return None
+    _, assignments = node.lookup(node.name)
+    for assigned in assignments:
+        if not isinstance(assigned, nodes.AssignName):
+            continue
+        if isinstance(assigned.parent, nodes.Arguments):
+            arguments = assigned.parent
+            for arg, annotation in zip(arguments.args, arguments.annotations):
+                if arg is assigned and annotation is not None:
+                    return _annotation_kind(annotation)
+            continue
+        if isinstance(assigned.parent, nodes.AnnAssign):
+            kind = _annotation_kind(assigned.parent.annotation)
+            if kind is not None:
+                return kind
+        value = assigned_value(assigned)
+        kind = _value_kind(value, _depth) if value is not None else None
+        if kind is not None:
+            return kind
+    inferred = safe_infer(node)
+    if isinstance(inferred, bases.Instance):
+        return _type_kind(inferred.name)
+    return None
+
+
+def _statement_type(query: nodes.NodeNG) -> Optional[str]:
+    inferred = safe_infer(query)
+    if isinstance(inferred, nodes.Const) and isinstance(inferred.value, str):
+        words = inferred.value.split(None, 1)
+        return words[0].upper() if words else None
+    return None
+
+
+class DBAPIChecker(BaseChecker):
+    """
+    Check for database queries and transactions made on every iteration of a loop.
+    """
+
+    name = "dbapi-checker"
+    priority = -1
+    msgs = {
+        "W9201": (
+            "Query executed on every iteration, %s.",
+            "execute-in-loop",
+            "Each query is a round trip to the database, batching queries avoids N+1 query latency.",
+        ),
+        "W9202": (
+            "Transaction committed on every iteration, commit once after the loop.",
+            "commit-in-loop",
+            "Each commit flushes the transaction to disk, committing per row is much slower than one transaction.",
+        ),
+        "W9203": (
+            "Rows are fetched one at a time with fetchone(), iterate over the cursor or use fetchmany().",
+            "fetchone-loop",
+            "fetchone() has a per-call overhead, cursors are iterators which fetch rows in batches.",
+        ),
+    }
+
+    @checker_utils.only_required_for_messages(
+        "execute-in-loop", "commit-in-loop", "fetchone-loop"
+    )
+    def visit_call(self, node: nodes.Call) -> None:
+        if not isinstance(node.func, nodes.Attribute):
+            return
+        method = node.func.attrname
+        if method not in ("execute", "commit", "fetchone"):
+            return
+        loop = enclosing_loop(node)
+        if loop is None:
+            return
+        kind = db_kind(node.func.expr)
+        if kind is None:
+            return
+        if method == "execute" and node.args:
+            statement = _statement_type(node.args[0])
+            if statement in batched_statements:
+                suggestion = "use executemany()"
+            elif statement == "SELECT":
+                suggestion = "select all the rows at once with a single IN (...) query"
+            else:
+                suggestion = "use executemany() or a single query with IN (...)"
+            self.add_message("execute-in-loop", node=node, args=(suggestion,))
+        elif method == "commit" and kind == "connection":
+            self.add_message("commit-in-loop", node=node)
+        elif method == "fetchone" and isinstance(loop.node, nodes.While):
+            self.add_message("fetchone-loop", node=node)
@@ -0,0 +1,146 @@
+"""Definitions and mutations of the names in a function.
+
+Each function (or module) is indexed once, recording where each name is bound
+and where the object it refers to is mutated: by a method call, subscript or
+attribute assignment, augmented assignment, ``del``, or by being passed to a
+function which writes to its arguments. Checkers query the index instead of
+tracking assignments themselves.
+"""
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Union
+from astroid import nodes
+from astroid.const import Context
+
+from perflint.cache import ModuleCache
+from perflint.purity import Effects, call_effects, method_effects
+
+Scope = Union[nodes.FunctionDef, nodes.Module, nodes.ClassDef, nodes.Lambda]
+
+# Builtins which create iterators over their arguments without changing them.
+iterating_builtins = {"iter", "enumerate", "zip", "map", "filter", "reversed"}
+
+# Indexes by scope, for the most recently checked modules.
+_indexes: "ModuleCache[DefUse]" = ModuleCache()
+
+
+def _root(node: nodes.NodeNG) -> Optional[nodes.Name]:
+    """Get the name an attribute or subscript expression is rooted at."""
+    while isinstance(
+        node, (nodes.Attribute, nodes.Subscript, nodes.AssignAttr, nodes.DelAttr)
+    ):
+        node = node.value if isinstance(node, nodes.Subscript) else node.expr
+    return node if isinstance(node, nodes.Name) else None
+
+
+def _walk(node: nodes.NodeNG) -> Iterator[nodes.NodeNG]:
+    """Walk the nodes of a scope, yielding but not entering nested scopes."""
+    for child in node.get_children():
+        yield child
+        if not isinstance(child, (nodes.FunctionDef, nodes.ClassDef, nodes.Lambda)):
+            yield from _walk(child)
+
+
+def _is_iterating_builtin(node: nodes.Call) -> bool:
+    if not isinstance(node.func, nodes.Name) or node.func.name not in iterating_builtins:
+        return False
+    scope, _ = node.func.lookup(node.func.name)
+    return isinstance(scope, nodes.Module) and scope.name == "builtins"
+
+
+def mutates_receiver(node: nodes.Call) -> bool:
+    """Check if a method call can mutate the object it is called on."""
+    effects = method_effects(node)
+    if effects is None:
+        effects = call_effects(node)  # Not a builtin type, or its type is unknown
+    return bool(effects & Effects.WRITE)
+
+
+def mutates_arguments(node: nodes.Call) -> bool:
+    """Check if a call can mutate the objects passed to it."""
+    if _is_iterating_builtin(node):
+        return False
+    if isinstance(node.func, nodes.Attribute) and method_effects(node) is not None:
+        return False  # Methods of builtin types only mutate their receiver
+    return bool(call_effects(node) & Effects.WRITE)
+
+
+class DefUse:
+    """Where each name in a scope is bound, mutated or aliased."""
+
+    def __init__(self, scope: Scope):
+        self.scope = scope
+        self.definitions: Dict[str, List[nodes.NodeNG]] = {}
+        self.mutations: Dict[str, List[nodes.NodeNG]] = {}
+        self.aliases: Dict[str, List[nodes.NodeNG]] = {}
+        self._changed_in: Dict[nodes.NodeNG, FrozenSet[str]] = {}
+        for node in _walk(scope):
+            self._index(node)
+
+    def _add(self, records: Dict[str, List[nodes.NodeNG]], name: str, node) -> None:
+        records.setdefault(name, []).append(node)
+
+    def _index(self, node: nodes.NodeNG) -> None:
+        if isinstance(node, (nodes.AssignName, nodes.DelName)):
+            if not isinstance(node.parent, nodes.Comprehension):
+                self._add(self.definitions, node.name, node)
+                if isinstance(node.parent, nodes.AugAssign):
+                    self._add(self.mutations, node.name, node)  # In-place for lists
+        elif isinstance(node, (nodes.FunctionDef, nodes.ClassDef)):
+            self._add(self.definitions, node.name, node)
+        elif isinstance(node, (nodes.Import, nodes.ImportFrom)):
+            for name, alias in node.names:
+                self._add(self.definitions, alias or name.split(".")[0], node)
+        elif isinstance(node, (nodes.AssignAttr, nodes.DelAttr)) or (
+            isinstance(node, nodes.Subscript) and node.ctx != Context.Load
+        ):
+            # Includes slice assignment, del and targets of tuple assignment
+            root = _root(node)
+            if root is not None:
+                self._add(self.mutations, root.name, node)
+        elif isinstance(node, nodes.Call):
+            if isinstance(node.func, nodes.Attribute):
+                root = _root(node.func.expr)
+                if root is not None and mutates_receiver(node):
+                    self._add(self.mutations, root.name, node)
+            arguments = [*node.args, *(kw.value for kw in node.keywords or ())]
+            names = [
+                arg.value if isinstance(arg, nodes.Starred) else arg
+                for arg in arguments
+            ]
+            names = [arg for arg in names if isinstance(arg, nodes.Name)]
+            if names and mutates_arguments(node):
+                for name in names:
+                    self._add(self.mutations, name.name, node)
+        elif isinstance(node, (nodes.Assign, nodes.AnnAssign)):
+            if isinstance(node.value, nodes.Name):
+                self._add(self.aliases, node.value.name, node)
+
+    def is_mutated(self, name: str) -> bool:
+        """Check if the object bound to a name is mutated or aliased anywhere in the scope."""
+        return name in self.mutations or name in self.aliases
+
+    def changed_in(self, node: nodes.NodeNG) -> FrozenSet[str]:
+        """Get the names rebound or mutated within a node, e.g. the body of a loop."""
+        if node not in self._changed_in:
+            self._changed_in[node] = frozenset(
+                name
+                for records in (self.definitions, self.mutations)
+                for name, found in records.items()
+                if any(node.parent_of(found_node) for found_node in found)
+            )
+        return self._changed_in[node]
+
+    def nonlocal_mutations(self) -> Set[str]:
+        """Get the names mutated by the scope which belong to an enclosing scope."""
+        return {
+            name
+            for name in (*self.mutations, *self.aliases)
+            if name not in self.scope.locals
+        }
+
+
+def get_def_use(scope: Scope) -> DefUse:
+    """Get the index of a scope, building it on first use."""
+    index = _indexes.get(scope)
+    if index is None:
+        index = _indexes[scope] = DefUse(scope)
+    return index
@@ -0,0 +1,189 @@
+from typing import List, Optional, Tuple
+from astroid import nodes
+from pylint.checkers import BaseChecker
+from pylint.checkers import utils as checker_utils
+
+from perflint.callgraph import get_call_graph, save_indexes
+from perflint.loop_context import in_loop
+
+# A test of a chain: the kind of test, its subject and the number of comparisons it makes
+Test = Tuple[str, str, int]
+
+
+def _is_value(node: nodes.NodeNG) -> bool:
+    """Check if an expression is a constant which could be a key of a dispatch table."""
+    if isinstance(node, nodes.Const):
+        return True
+    while isinstance(node, nodes.Attribute):
+        node = node.expr
+    return isinstance(node, nodes.Name)
+
+
+def _equality_test(node: nodes.Compare) -> Optional[Test]:
+    """Match ``subject == value``, ``value == subject`` and ``subject in (values)``."""
+    if len(node.ops) != 1:
+        return None
+    op, right = node.ops[0]
+    left = node.left
+    if op == "==":
+        if _is_value(right) and not isinstance(left, nodes.Const):
+            return "==", left.as_string(), 1
+        if isinstance(left, nodes.Const):
+            return "==", right.as_string(), 1
+    if op == "in" and isinstance(right, (nodes.Tuple, nodes.List, nodes.Set)):
+        if right.elts and all(_is_value(elt) for elt in right.elts):
+            return "==", left.as_string(), len(right.elts)
+    return None
+
+
+def _isinstance_test(node: nodes.Call) -> Optional[Test]:
+    if not (
+        isinstance(node.func, nodes.Name)
+        and node.func.name == "isinstance"
+        and len(node.args) == 2
+    ):
+        return None
+    types = node.args[1]
+    count = len(types.elts) if isinstance(types, nodes.Tuple) else 1
+    return "isinstance", node.args[0].as_string(), count
+
+
+def dispatch_test(node: nodes.NodeNG) -> Optional[Test]:
+    """Get the dispatch test made by the condition of an ``if``, if it is one."""
+    if isinstance(node, nodes.Compare):
+        return _equality_test(node)
+    if isinstance(node, nodes.Call):
+        return _isinstance_test(node)
+    if isinstance(node, nodes.BoolOp) and node.op == "or":
+        tests = [dispatch_test(value) for value in node.values]
+        if None in tests or len({test[:2] for test in tests}) != 1:
+            return None
+        kind, subject, _ = tests[0]
+        return kind, subject, sum(test[2] for test in tests)
+    return None
+
+
+def _case_comparisons(pattern: nodes.NodeNG) -> Optional[int]:
+    if isinstance(pattern, (nodes.MatchValue, nodes.MatchSingleton)):
+        return 1
+    if isinstance(pattern, nodes.MatchOr):
+        counts = [_case_comparisons(alternative) for alternative in pattern.patterns]
+        return None if None in counts else sum(counts)
+    return None
+
+
+def _is_wildcard(case: nodes.MatchCase) -> bool:
+    return (
+        isinstance(case.pattern, nodes.MatchAs)
+        and case.pattern.pattern is None
+        and case.guard is None
+    )
+
+
+def comparisons_saved(comparisons: List[int]) -> float:
+    """Estimate the comparisons a table lookup saves over a chain of tests.
+
+    Each branch is assumed to be taken equally often. Reaching a branch costs
+    the comparisons of every test before it and its own, a lookup costs one.
+    """
+    total, reached = 0, 0
+    for count in comparisons:
+        reached += count
+        total += reached
+    return total / len(comparisons) - 1
+
+
+def if_chain(node: nodes.If) -> List[nodes.If]:
+    """Get the ``if`` statements of an if/elif chain, starting at its first ``if``."""
+    chain = [node]
+    while len(chain[-1].orelse) == 1 and isinstance(chain[-1].orelse[0], nodes.If):
+        chain.append(chain[-1].orelse[0])
+    return chain
+
+
+class DispatchChecker(BaseChecker):
+    """
+    Check for long chains of equality or type tests which could be a dispatch table.
+    """
+
+    name = "dispatch-checker"
+    priority = -1
+    msgs = {
+        "W9701": (
+            'Chain of %d equality tests on "%s" is evaluated linearly, a dict dispatch table would save about %.1f comparisons per evaluation.',
+            "equality-dispatch-chain",
+            "A dictionary lookup costs the same for every key, a chain of tests costs more the later the matching branch is.",
+        ),
+        "W9702": (
+            'Chain of %d isinstance() tests on "%s" is evaluated linearly, functools.singledispatch or a dict keyed by type would save about %.1f checks per evaluation.',
+            "isinstance-dispatch-chain",
+            "singledispatch looks up the implementation for a type once and caches it.",
+        ),
+    }
+    options = (
+        (
+            "max-dispatch-branches",
+            {
+                "default": 4,
+                "type": "int",
+                "metavar": "<int>",
+                "help": "Maximum number of tests on the same value in an if/elif chain or match statement in hot code.",
+            },
+        ),
+    )
+
+    def _is_hot(self, node: nodes.NodeNG) -> bool:
+        """Check if a node is in a loop, or in a function called from a loop."""
+        if in_loop(node):
+            return True
+        func = node.frame()
+        if not isinstance(func, nodes.FunctionDef):
+            return False
+        if not getattr(self.linter.config, "call_graph", False):
+            return False
+        graph = get_call_graph(func.root(), self.linter.config.call_graph_index)
+        return graph.heat(func) > 0
+
+    def close(self) -> None:
+        save_indexes()
+
+    def _report(
+        self, node: nodes.NodeNG, kind: str, subject: str, comparisons: List[int]
+    ) -> None:
+        if len(comparisons) <= self.linter.config.max_dispatch_branches:
+            return
+        if not self._is_hot(node):
+            return
+        self.add_message(
+            "equality-dispatch-chain" if kind == "==" else "isinstance-dispatch-chain",
+            node=node,
+            args=(len(comparisons), subject, comparisons_saved(comparisons)),
+        )
+
+    @checker_utils.only_required_for_messages(
+        "equality-dispatch-chain", "isinstance-dispatch-chain"
+    )
+    def visit_if(self, node: nodes.If) -> None:
+        if isinstance(node.parent, nodes.If) and node.parent.orelse == [node]:
+            return  # Part of the chain of the enclosing if
+        chain: List[Test] = []
+        for branch in if_chain(node):
+            test = dispatch_test(branch.test)
+            if test is None or (chain and test[:2] != chain[0][:2]):
+                break  # Only the leading tests on the same subject could be a table
+            chain.append(test)
+        if chain:
+            kind, subject, _ = chain[0]
+            self._report(node, kind, subject, [test[2] for test in chain])
+
+    @checker_utils.only_required_for_messages("equality-dispatch-chain")
+    def visit_match(self, node: nodes.Match) -> None:
+        comparisons = []
+        for case in node.cases:
+            if _is_wildcard(case):
+                break
+            count = _case_comparisons(case.pattern)
+            if count is None or case.guard is not None:
+                break
+            comparisons.append(count)
+        self._report(node, "==", node.subject.as_string(), comparisons)
@@ -1,10 +1,23 @@
-from typing import Dict, List, Set, Union
+from typing import Dict, FrozenSet, List, Optional, Set, Union
 from astroid import nodes
-from astroid.helpers import safe_infer
+from astroid.const import Context
 from pylint.checkers import BaseChecker
 from pylint.checkers import utils as checker_utils
 from pylint.interfaces import INFERENCE
 
+from perflint.callgraph import get_call_graph, save_indexes
+from perflint.inference import safe_infer
+from perflint.loop_context import (
+    LoopContext,
+    get_loop_context,
+    in_loop,
+    is_builtin_call,
+    loop_depth,
+)
+from perflint.purity import Effects, call_effects, is_pure, writes_state
+from perflint.utils import get_children_recursive, local_type, root_name
+from perflint.zero_copy_checker import is_bytes_like, resliced_names
+
 
 iterable_types = (
     nodes.Tuple,
@@ -18,34 +31,54 @@ iterable_type_names = (
 )
 
 
-def get_children_recursive(node: nodes.NodeNG):
-    """Get children of a node."""
-    for child in node.get_children():
-        yield child
-        yield from get_children_recursive(child)
-
-
-def local_type(name: nodes.NodeNG) -> Union[None, nodes.Name]:
-    if not isinstance(name, nodes.Name):
-        return
-
-    if name.name in name.frame().locals:
-        vals = name.frame().locals[name.name]
-        if len(vals) > 0:
-            assigned = vals[0].assign_type()
-            if isinstance(assigned, nodes.Arguments):
-                for annotation, arg in zip(assigned.annotations, assigned.arguments):
-                    if arg.name == name.name:
-                        if isinstance(annotation, nodes.Name):
-                            return annotation
-                        elif isinstance(annotation, nodes.Subscript) and isinstance(
-                            annotation.value, nodes.Name
-                        ):
-                            return annotation.value
-                        else:
-                            return None
+def _is_ignored(node: nodes.NodeNG) -> bool:
+    """Loop iterables and conditions, and containers of constants, aren't worth moving."""
+    if isinstance(node.parent, nodes.For) and node.parent.iter is node:
+        return True
+    if isinstance(node.parent, nodes.While) and node.parent.test is node:
+        return True
+    if isinstance(node, (nodes.List, nodes.Tuple)):
+        return all(isinstance(e, nodes.Const) for e in node.elts)
+    if isinstance(node, nodes.Dict):
+        return all(
+            isinstance(k, nodes.Const) and isinstance(v, nodes.Const)
+            for k, v in node.items
+        )
+    return False
+
+
+def _uses_names(
+    node: nodes.NodeNG, names: FrozenSet[str], memo: Dict[nodes.NodeNG, bool]
+) -> bool:
+    """Check if a node uses or assigns any of ``names``, remembering the result of each subtree."""
+    if node in memo:
+        return memo[node]
+    if isinstance(node, (nodes.Name, nodes.AssignName)):
+        uses = node.name in names
     else:
-        return
+        uses = any(_uses_names(child, names, memo) for child in node.get_children())
+    memo[node] = uses
+    return uses
+
+
+def _is_index(node: nodes.NodeNG, name: str) -> bool:
+    """Check if a name is bound by an enclosing ``for`` loop over ``range()``, or the index of ``enumerate()``."""
+    for loop in node.node_ancestors():
+        if not isinstance(loop, nodes.For):
+            continue
+        target = loop.target
+        if isinstance(target, nodes.AssignName) and target.name == name:
+            return is_builtin_call(loop.iter, "range")
+        if (
+            isinstance(target, nodes.Tuple)
+            and target.elts
+            and isinstance(target.elts[0], nodes.AssignName)
+            and target.elts[0].name == name
+        ):
+            return is_builtin_call(loop.iter, "enumerate")
+        if any(assigned.name == name for assigned in target.nodes_of_class(nodes.AssignName)):
+            return False
+    return False
 
 
 class ForLoopChecker(BaseChecker):
@@ -66,15 +99,28 @@ class ForLoopChecker(BaseChecker):
             "incorrect-dictionary-iterator",
             "Incorrect use of .items() when not unpacking key and value.",
         ),
+        "W8103": (
+            'Looking up "%s" by key on every iteration, iterate over %s.items() instead.',
+            "dictionary-lookup-in-key-loop",
+            "Iterating over the keys of a dictionary and then looking up each value hashes every key twice.",
+        ),
+        "W8104": (
+            'Membership test on %s.keys(), test "in %s" directly.',
+            "dictionary-keys-membership",
+            "Dictionaries support membership tests directly, without creating a keys view.",
+        ),
     }
 
     @checker_utils.only_required_for_messages(
-        "unnecessary-list-cast", "incorrect-dictionary-iterator"
+        "unnecessary-list-cast",
+        "incorrect-dictionary-iterator",
+        "dictionary-lookup-in-key-loop",
     )
     def visit_for(self, node: nodes.For) -> None:
         """Visit for loops."""
         if not node.iter:
             return
+        self._check_key_lookups(node)
         if not isinstance(node.iter, nodes.Call):
             return
         if not node.iter.func:
@@ -123,6 +169,60 @@ class ForLoopChecker(BaseChecker):
         else:
             return
 
+    def _check_key_lookups(self, node: nodes.For) -> None:
+        """Look for `for k in d: d[k]` and `for k in d.keys(): d[k]`."""
+        if not isinstance(node.target, nodes.AssignName):
+            return
+        mapping = node.iter
+        if (
+            isinstance(mapping, nodes.Call)
+            and isinstance(mapping.func, nodes.Attribute)
+            and mapping.func.attrname == "keys"
+            and not mapping.args
+        ):
+            mapping = mapping.func.expr
+        if not isinstance(mapping, nodes.Name):
+            return
+        if not isinstance(safe_infer(mapping), nodes.Dict):
+            loc = local_type(mapping)
+            if not loc or loc.name.lower() != "dict":
+                return
+        key = node.target.name
+        for statement in node.body:
+            for child in (statement, *get_children_recursive(statement)):
+                if (
+                    isinstance(child, nodes.Subscript)
+                    and child.ctx == Context.Load
+                    and isinstance(child.value, nodes.Name)
+                    and child.value.name == mapping.name
+                    and isinstance(child.slice, nodes.Name)
+                    and child.slice.name == key
+                ):
+                    self.add_message(
+                        "dictionary-lookup-in-key-loop",
+                        node=child,
+                        args=(child.as_string(), mapping.name),
+                    )
+                    return
+
+    @checker_utils.only_required_for_messages("dictionary-keys-membership")
+    def visit_compare(self, node: nodes.Compare) -> None:
+        for op, right in node.ops:
+            if op not in ("in", "not in"):
+                continue
+            if not (
+                isinstance(right, nodes.Call)
+                and isinstance(right.func, nodes.Attribute)
+                and right.func.attrname == "keys"
+                and not right.args
+            ):
+                continue
+            if isinstance(safe_infer(right.func.expr), nodes.Dict):
+                mapping = right.func.expr.as_string()
+                self.add_message(
+                    "dictionary-keys-membership", node=right, args=(mapping, mapping)
+                )
+
 
 class LoopInvariantChecker(BaseChecker):
     """
@@ -157,59 +257,59 @@ class LoopInvariantChecker(BaseChecker):
             "dotted-import-in-loop",
             "Dotted global names in loops are inefficient.",
         ),
+        "W8206": (
+            'Nested loop join on "%s", build a dictionary index (or groupby) of the inner iterable before the loop.',
+            "nested-loop-join",
+            "Matching items of an inner loop against an outer loop is O(n*m), a dictionary lookup is O(1).",
+        ),
     }
+    options = (
+        (
+            "call-graph",
+            {
+                "default": True,
+                "type": "yn",
+                "metavar": "<y or n>",
+                "help": "Treat the body of functions called from inside loops as being in a loop.",
+            },
+        ),
+        (
+            "call-graph-index",
+            {
+                "default": "",
+                "type": "string",
+                "metavar": "<file>",
+                "help": "File to persist the call graph in between runs, disabled when empty.",
+            },
+        ),
+    )
 
     def __init__(self, linter=None):
         super().__init__(linter)
-        self._loop_level = 0
-        self._loop_assignments: List[Set[str]] = []
-        self._loop_names: List[List[nodes.Name]] = []
-        self._loop_consts: List[List[nodes.Const]] = []
-        self._ignore: List[nodes.NodeNG] = []
+        self._function_heat: List[int] = []
 
-    @checker_utils.only_required_for_messages("loop-invariant-statement")
-    def visit_for(self, node: nodes.For) -> None:
-        """Visit for loop bodies."""
-        self._loop_level += 1
-        if isinstance(node.target, nodes.Tuple):
-            self._loop_assignments.append(set(el.name for el in node.target.elts))
-        elif isinstance(node.target, nodes.AssignName):
-            self._loop_assignments.append({node.target.name})
-        else:
-            self._loop_assignments.append(set())
-        self._loop_names.append([])
-        self._loop_consts.append([])
-        self._ignore.append(node.iter)
+    def _heat(self, node: nodes.NodeNG) -> int:
+        """The loop depth of a node, including the loops the current function is called from."""
+        if self._function_heat:
+            return loop_depth(node) + self._function_heat[-1]
+        return loop_depth(node)
 
-    @checker_utils.only_required_for_messages("loop-invariant-statement")
-    def visit_while(self, node: nodes.While) -> None:
-        """Visit while loop bodies."""
-        self._loop_level += 1
-        self._loop_names.append([])
-        self._loop_consts.append([])
-        self._loop_assignments.append(set())
-        self._ignore.append(node.test)
-
-    def _visit_sequence(self, node: Union[nodes.List, nodes.Tuple]) -> None:
-        if not node.elts:
-            self._ignore.append(node)
-        elif all(isinstance(e, nodes.Const) for e in node.elts):
-            self._ignore.append(node)
-
-    def visit_list(self, node: nodes.List) -> None:
-        self._visit_sequence(node)
-
-    def visit_tuple(self, node: nodes.Tuple) -> None:
-        self._visit_sequence(node)
-
-    def visit_dict(self, node: nodes.Dict) -> None:
-        if not node.items:
-            self._ignore.append(node)
-        elif all(
-            isinstance(k, nodes.Const) and isinstance(v, nodes.Const)
-            for k, v in node.items
-        ):
-            self._ignore.append(node)
+    def visit_functiondef(self, node: nodes.FunctionDef) -> None:
+        """Look up how hot a function is from the loops it's called in."""
+        heat = 0
+        if self.linter.config.call_graph:
+            graph = get_call_graph(node.root(), self.linter.config.call_graph_index)
+            heat = graph.heat(node)
+        self._function_heat.append(heat)
+
+    def leave_functiondef(self, node: nodes.FunctionDef) -> None:
+        self._function_heat.pop()
+
+    def close(self) -> None:
+        save_indexes()
+
+    visit_asyncfunctiondef = visit_functiondef
+    leave_asyncfunctiondef = leave_functiondef
 
     @checker_utils.only_required_for_messages("loop-invariant-statement")
     def leave_for(self, node: nodes.For) -> None:
@@ -220,15 +320,9 @@ class LoopInvariantChecker(BaseChecker):
         self._leave_loop(node)
 
     def _leave_loop(self, node: Union[nodes.For, nodes.While]) -> None:
-        """Drop loop level."""
-        self._loop_level -= 1
-        assigned_names = self._loop_assignments.pop()
-        unassigned_names = [
-            name_node
-            for name_node in self._loop_names.pop()
-            if name_node.name not in assigned_names
-        ]
-        used_consts = self._loop_consts.pop()
+        """Report the invariant expressions of a loop."""
+        loop = get_loop_context(node)
+        assigned_names = loop.assigned
         FRAGMENT_NODE_TYPES = (
             nodes.FormattedValue,
             nodes.Attribute,
@@ -236,11 +330,14 @@ class LoopInvariantChecker(BaseChecker):
             nodes.Slice,
             nodes.UnaryOp,
         )
-        NAME_NODES = (nodes.Name, nodes.AssignName)
         SIDE_EFFECT_NODES = (nodes.Yield, nodes.YieldFrom, nodes.Return, nodes.Raise)
 
+        # Results by node for this loop only, so each node is walked once
         visited_nodes: Dict[nodes.NodeNG, bool] = dict()
-        for name_node in [*unassigned_names, *used_consts]:
+        uses_assigned: Dict[nodes.NodeNG, bool] = dict()
+        reported_nodes: Set[nodes.NodeNG] = set()
+        loop_writes: Optional[bool] = None  # If a call in the loop can write non-local state
+        for name_node in loop.invariant_candidates:
             cur_node = name_node.parent
             invariant_node = None
             while cur_node != node:
@@ -249,24 +346,27 @@ class LoopInvariantChecker(BaseChecker):
                 if cur_node in visited_nodes:
                     is_variant = visited_nodes[cur_node]
                 else:
-                    if isinstance(cur_node, nodes.Call) and isinstance(
-                        cur_node.func, nodes.Name
-                    ):
-                        if cur_node.func in unassigned_names:
-                            is_variant = True
-                        elif (
-                            cur_node.func.name == "print"
-                        ):  # Treat print() as a side-effect
+                    if isinstance(cur_node, nodes.Call):
+                        if isinstance(cur_node.parent, nodes.Expr):
+                            # The result is discarded, so it's called for its effects
                             is_variant = True
+                        else:
+                            effects = call_effects(cur_node)
+                            if not is_pure(effects):
+                                is_variant = True
+                            elif effects & Effects.READ:
+                                # What it reads may be written on each iteration
+                                if loop_writes is None:
+                                    loop_writes = any(
+                                        writes_state(child)
+                                        for child in node.get_children()
+                                        if child is not getattr(node, "iter", None)
+                                    )
+                                is_variant = loop_writes
                     elif isinstance(cur_node, SIDE_EFFECT_NODES):
                         is_variant = True
                     if not is_variant:
-                        for child in get_children_recursive(cur_node):
-                            if (
-                                isinstance(child, NAME_NODES)
-                                and child.name in assigned_names
-                            ):
-                                is_variant = True
+                        is_variant = _uses_names(cur_node, assigned_names, uses_assigned)
                     visited_nodes[cur_node] = is_variant
                 if not is_variant:
                     invariant_node = cur_node
@@ -276,37 +376,64 @@ class LoopInvariantChecker(BaseChecker):
 
             if (
                 invariant_node
-                and invariant_node not in self._ignore
+                and invariant_node not in reported_nodes
+                and not _is_ignored(invariant_node)
                 and not isinstance(invariant_node, FRAGMENT_NODE_TYPES)
             ):
+                reported_nodes.add(invariant_node)
                 self.add_message("loop-invariant-statement", node=invariant_node)
 
-    def visit_assign(self, node: nodes.Assign) -> None:
-        """Track assignments in loops."""
-        # we don't handle multiple assignment nor slice assignment
-        if not self._loop_assignments:
-            return  # Skip when empty
-
-        target = node.targets[0]
-        if isinstance(target, nodes.AssignName):
-            self._loop_assignments[-1].add(target.name)
-
-    def visit_augassign(self, node: nodes.AugAssign) -> None:
-        """Track assignments in loops."""
-        # we don't handle multiple assignment nor slice assignment
-        if not self._loop_assignments:
-            return  # Skip when empty
+    def _join_comparisons(self, test: nodes.NodeNG, operator: str, bool_op: str):
+        """Get the comparisons joined by ``bool_op`` in an if-statement test."""
+        if isinstance(test, nodes.BoolOp) and test.op == bool_op:
+            for value in test.values:
+                yield from self._join_comparisons(value, operator, bool_op)
+        elif (
+            isinstance(test, nodes.Compare)
+            and len(test.ops) == 1
+            and test.ops[0][0] == operator
+        ):
+            yield test
+
+    def _is_join(self, compare: nodes.Compare, loop: LoopContext) -> bool:
+        """Check if a comparison is between the inner loop target and an outer loop target.
+
+        Comparing two indexes, e.g. to walk the diagonal of a matrix, isn't a join.
+        """
+        left = root_name(compare.left)
+        right = root_name(compare.ops[0][1])
+        inner_targets = loop.targets
+        outer_targets = loop.outer_targets
+        if not (
+            (left in inner_targets and right in outer_targets)
+            or (left in outer_targets and right in inner_targets)
+        ):
+            return False
+        return not (_is_index(compare, left) and _is_index(compare, right))
 
-        if isinstance(node.target, nodes.AssignName):
-            self._loop_assignments[-1].add(node.target.name)
+    @checker_utils.only_required_for_messages("nested-loop-join")
+    def visit_if(self, node: nodes.If) -> None:
+        """Look for the inner loop of a nested loop being guarded by an equality test."""
+        if not isinstance(node.parent, nodes.For) or node not in node.parent.body:
+            return
+        loop = get_loop_context(node.parent)
+        if loop.parent is None:
+            return
+        # Either `if a.key == b.key: ...` or `if a.key != b.key: continue`
+        if len(node.body) == 1 and isinstance(node.body[0], nodes.Continue):
+            comparisons = self._join_comparisons(node.test, "!=", "or")
+        else:
+            comparisons = self._join_comparisons(node.test, "==", "and")
+        for compare in comparisons:
+            if self._is_join(compare, loop):
+                self.add_message(
+                    "nested-loop-join", node=compare, args=(compare.as_string(),)
+                )
+                return
 
     @checker_utils.only_required_for_messages("loop-global-usage")
     def visit_name(self, node: nodes.Name) -> None:
         """Look for global names"""
-        if self._loop_names:
-            if not checker_utils.is_builtin(node.name) and node.name != "self":
-                self._loop_names[-1].append(node)
-
         if checker_utils.is_builtin(node.name):
             return
         scope, _ = node.lookup(node.name)
@@ -317,49 +444,31 @@ class LoopInvariantChecker(BaseChecker):
             and len(scope.globals[node.name]) > 0
             and isinstance(scope.globals[node.name][0], nodes.AssignName)
         ):
-            if self._loop_level > 0:
+            if self._heat(node) > 0:
                 self.add_message("loop-global-usage", node=node)
 
-    def visit_const(self, node: nodes.Const) -> None:
-        if self._loop_level == 0:
-            return
-        if self._loop_consts:
-            self._loop_consts[-1].append(node)
-
-    def visit_call(self, node: nodes.Call) -> None:
-        """Look for method calls."""
-        if not isinstance(node.func, nodes.Attribute):
-            return
-        if not self._loop_assignments:
-            return  # Skip when empty
-        if isinstance(node.func.expr, nodes.Name):
-            self._loop_assignments[-1].add(node.func.expr.name)
-
     @checker_utils.only_required_for_messages("loop-try-except-usage")
     def visit_tryexcept(self, node: nodes.Try) -> None:
-        if self._loop_level > 0:
+        if in_loop(node):
             self.add_message("loop-try-except-usage", node=node, confidence=INFERENCE)
 
     @checker_utils.only_required_for_messages("memoryview-over-bytes")
     def visit_subscript(self, node: nodes.Subscript) -> None:
-        if self._loop_level == 0:
+        if not isinstance(node.slice, nodes.Slice):
+            return  # Indexing returns an item, it doesn't copy
+        if self._heat(node) == 0:
             return
-        inferred_value = safe_infer(node.value)
-        if not inferred_value:
-            inferred_value = local_type(node.value)
-            if (
-                isinstance(inferred_value, nodes.Name)
-                and inferred_value.name == "bytes"
-            ):
-                self.add_message("memoryview-over-bytes", node=node)
-        if isinstance(inferred_value, nodes.Const) and isinstance(
-            inferred_value.value, bytes
+        if not is_bytes_like(node.value):
+            return
+        if isinstance(node.value, nodes.Name) and any(
+            name.name == node.value.name for name in resliced_names(node.statement())
         ):
-            self.add_message("memoryview-over-bytes", node=node)
+            return  # Reported as consume-and-reslice
+        self.add_message("memoryview-over-bytes", node=node)
 
     @checker_utils.only_required_for_messages("dotted-import-in-loop")
     def visit_attribute(self, node: nodes.Attribute) -> None:
-        if self._loop_level == 0:
+        if self._heat(node) == 0:
             return
         inferred_value = safe_infer(node.expr)
         if inferred_value and isinstance(inferred_value, nodes.Module):
@@ -0,0 +1,145 @@
+import keyword
+from typing import Iterable, Union
+from astroid import bases, nodes
+from pylint.checkers import BaseChecker
+from pylint.checkers import utils as checker_utils
+
+from perflint.inference import safe_infer
+from perflint.loop_context import in_loop
+from perflint.purity import is_project_function
+
+
+def _infer_callee(node: nodes.Call) -> Union[None, nodes.FunctionDef, nodes.Lambda]:
+    """Resolve the function object called by ``node``, if astroid can."""
+    inferred = safe_infer(node.func)
+    if isinstance(inferred, bases.BoundMethod):
+        inferred = inferred._proxied
+    if isinstance(inferred, (nodes.FunctionDef, nodes.Lambda)):
+        return inferred
+    return None
+
+
+def is_trivial_function(func: Union[nodes.FunctionDef, nodes.Lambda]) -> bool:
+    """A function is trivial when its body is a single returned expression."""
+    if isinstance(func, nodes.FunctionDef):
+        if func.decorators or func.is_generator():
+            return False
+        if len(func.body) != 1:
+            return False
+        return isinstance(func.body[0], nodes.Return) and func.body[0].value is not None
+    return isinstance(func, nodes.Lambda)
+
+
+def _is_keyword_name(key: nodes.NodeNG) -> bool:
+    """Check if a dictionary key could be written as a keyword argument."""
+    return (
+        isinstance(key, nodes.Const)
+        and isinstance(key.value, str)
+        and key.value.isidentifier()
+        and not keyword.iskeyword(key.value)
+    )
+
+
+def accepts_keywords(
+    func: Union[nodes.FunctionDef, nodes.Lambda], names: Iterable[str]
+) -> bool:
+    """Check if a function's parameters are known and accept these keyword arguments."""
+    if func.args.args is None:
+        return False  # A builtin, its parameters are unknown
+    if func.args.kwarg:
+        return True
+    parameters = {arg.name for arg in (*func.args.args, *func.args.kwonlyargs)}
+    return set(names) <= parameters
+
+
+class FunctionCallChecker(BaseChecker):
+    """
+    Check for function call overheads.
+    """
+
+    name = "function-call-checker"
+    priority = -1
+    msgs = {
+        "W8501": (
+            'Function "%s" is a single expression, consider inlining it in this loop.',
+            "inline-trivial-function",
+            "Calling a function has an overhead, trivial functions called in a loop can be inlined.",
+        ),
+        "W8502": (
+            "Pass keyword arguments directly instead of unpacking a dictionary literal.",
+            "unnecessary-dict-unpacking",
+            "Building a dictionary only to unpack it into keyword arguments is inefficient.",
+        ),
+        "W8503": (
+            'Forwarding **%s to "%s", which has known parameters. Pass the arguments explicitly.',
+            "kwargs-forwarding",
+            "Packing and unpacking **kwargs for a function with a known signature is inefficient.",
+        ),
+        "W8504": (
+            'Static method "%s" is looked up through self in a loop, call it through the class or copy it to a local variable first.',
+            "staticmethod-via-self-in-loop",
+            "Looking up a static method through an instance walks the instance and class dictionaries.",
+        ),
+    }
+
+    @checker_utils.only_required_for_messages(
+        "inline-trivial-function",
+        "unnecessary-dict-unpacking",
+        "kwargs-forwarding",
+        "staticmethod-via-self-in-loop",
+    )
+    def visit_call(self, node: nodes.Call) -> None:
+        """Look for expensive calling conventions."""
+        for unpacked in node.keywords or ():
+            if unpacked.arg is not None:
+                continue
+            if isinstance(unpacked.value, nodes.Dict):
+                self._check_dict_unpacking(node, unpacked.value)
+            elif isinstance(unpacked.value, nodes.Name):
+                self._check_kwargs_forwarding(node, unpacked.value)
+
+        if not in_loop(node):
+            return
+
+        callee = _infer_callee(node)
+        if callee is None:
+            return
+
+        if (
+            isinstance(node.func, nodes.Attribute)
+            and isinstance(node.func.expr, nodes.Name)
+            and node.func.expr.name == "self"
+            and isinstance(callee, nodes.FunctionDef)
+            and callee.type == "staticmethod"
+        ):
+            self.add_message(
+                "staticmethod-via-self-in-loop", node=node.func, args=(callee.name,)
+            )
+
+        if is_trivial_function(callee) and is_project_function(callee):
+            self.add_message(
+                "inline-trivial-function", node=node, args=(node.func.as_string(),)
+            )
+
+    def _check_dict_unpacking(self, node: nodes.Call, value: nodes.Dict) -> None:
+        if not all(_is_keyword_name(key) for key, _ in value.items):
+            return
+        callee = _infer_callee(node)
+        if callee is None or not accepts_keywords(
+            callee, (key.value for key, _ in value.items)
+        ):
+            return
+        self.add_message("unnecessary-dict-unpacking", node=value)
+
+    def _check_kwargs_forwarding(self, node: nodes.Call, name: nodes.Name) -> None:
+        frame = node.frame()
+        if not isinstance(frame, nodes.FunctionDef):
+            return
+        if frame.args.kwarg != name.name:
+            return
+        callee = _infer_callee(node)
+        if not isinstance(callee, nodes.FunctionDef):
+            return
+        if callee.args.kwarg or callee.args.args is None:
+            return  # The callee takes arbitrary keywords, or is a builtin
+        self.add_message("kwargs-forwarding", node=node, args=(name.name, callee.name))
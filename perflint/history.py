@@ -0,0 +1,249 @@
+"""Performance debt history, recorded in a SQLite database.
+
+``--history`` records the findings of each run, and metrics of each module
+linted, in a SQLite database::
+
+    perflint --history=perflint.sqlite your_code/
+
+Findings are identified by a fingerprint of their rule, file, function and the
+text of their line, so a finding keeps its fingerprint when lines are added or
+removed above it. The findings of two runs can be compared, and the density of
+findings computed by package::
+
+    perflint history perflint.sqlite new
+    perflint history perflint.sqlite fixed --run 12 --previous 10
+    perflint history perflint.sqlite density
+
+Runs are compared with the run before them by default.
+"""
+import argparse
+import datetime
+import hashlib
+import sqlite3
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS modules (
+    run INTEGER NOT NULL REFERENCES runs (id),
+    module TEXT NOT NULL,
+    package TEXT NOT NULL,
+    path TEXT NOT NULL,
+    loc INTEGER NOT NULL,
+    loops INTEGER NOT NULL,
+    cost INTEGER NOT NULL,
+    PRIMARY KEY (run, module)
+);
+CREATE TABLE IF NOT EXISTS findings (
+    run INTEGER NOT NULL REFERENCES runs (id),
+    fingerprint TEXT NOT NULL,
+    module TEXT NOT NULL,
+    path TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    msg_id TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    obj TEXT NOT NULL,
+    msg TEXT NOT NULL,
+    depth INTEGER NOT NULL,
+    cost INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS findings_by_run ON findings (run, fingerprint);
+"""
+
+
+class ModuleMetrics(NamedTuple):
+    module: str
+    package: str
+    path: str
+    loc: int  # Lines which aren't blank or comments
+    loops: int
+    cost: int  # Sum of the estimated cost of the findings in the module
+
+
+class FindingRecord(NamedTuple):
+    fingerprint: str
+    module: str
+    path: str
+    line: int
+    msg_id: str
+    symbol: str
+    obj: str
+    msg: str
+    depth: int  # Number of loops around the finding
+    cost: int  # Estimated evaluations of the finding per call of its function
+
+
+def fingerprint(path: str, symbol: str, obj: str, source: str, occurrence: int) -> str:
+    """Identify a finding independently of its line number.
+
+    ``occurrence`` tells apart identical findings on identical lines of the
+    same function, counting from 0.
+    """
+    source = " ".join(source.split())
+    key = "\0".join((path.replace("\\", "/"), symbol, obj, source, str(occurrence)))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """Open a history database, creating its tables if they don't exist."""
+    connection = sqlite3.connect(path)
+    connection.row_factory = sqlite3.Row
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def record_run(
+    path: str,
+    modules: Iterable[ModuleMetrics],
+    findings: Iterable[FindingRecord],
+    started: Optional[str] = None,
+) -> int:
+    """Record the findings and module metrics of a run in one transaction, and get its id."""
+    if started is None:
+        started = datetime.datetime.now(datetime.timezone.utc).isoformat(
+            timespec="seconds"
+        )
+    connection = connect(path)
+    try:
+        with connection:
+            run = connection.execute(
+                "INSERT INTO runs (started) VALUES (?)", (started,)
+            ).lastrowid
+            connection.executemany(
+                "INSERT INTO modules VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(run, *module) for module in modules],
+            )
+            connection.executemany(
+                "INSERT INTO findings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(run, *finding) for finding in findings],
+            )
+    finally:
+        connection.close()
+    return run
+
+
+def _runs(
+    connection: sqlite3.Connection, run: Optional[int], previous: Optional[int]
+) -> Tuple[Optional[int], Optional[int]]:
+    """Default to the last run, and the run before the one compared."""
+    if run is None:
+        run = connection.execute("SELECT MAX(id) FROM runs").fetchone()[0]
+    if previous is None and run is not None:
+        previous = connection.execute(
+            "SELECT MAX(id) FROM runs WHERE id < ?", (run,)
+        ).fetchone()[0]
+    return run, previous
+
+
+def _compare(
+    connection: sqlite3.Connection, condition: str, of: int, other: Optional[int]
+) -> List[sqlite3.Row]:
+    return connection.execute(
+        f"""
+        SELECT * FROM findings
+        WHERE run = :of AND fingerprint {condition} (
+            SELECT fingerprint FROM findings WHERE run = :other
+        )
+        ORDER BY path, line
+        """,
+        {"of": of, "other": other},
+    ).fetchall()
+
+
+def new_findings(
+    connection: sqlite3.Connection,
+    run: Optional[int] = None,
+    previous: Optional[int] = None,
+) -> List[sqlite3.Row]:
+    """Get the findings of a run which weren't in the previous run."""
+    run, previous = _runs(connection, run, previous)
+    return _compare(connection, "NOT IN", run, previous)
+
+
+def fixed_findings(
+    connection: sqlite3.Connection,
+    run: Optional[int] = None,
+    previous: Optional[int] = None,
+) -> List[sqlite3.Row]:
+    """Get the findings of the previous run which aren't in a run anymore."""
+    run, previous = _runs(connection, run, previous)
+    return _compare(connection, "NOT IN", previous, run)
+
+
+def persistent_findings(
+    connection: sqlite3.Connection,
+    run: Optional[int] = None,
+    previous: Optional[int] = None,
+) -> List[sqlite3.Row]:
+    """Get the findings of a run which were already in the previous run."""
+    run, previous = _runs(connection, run, previous)
+    return _compare(connection, "IN", run, previous)
+
+
+def density(
+    connection: sqlite3.Connection, run: Optional[int] = None
+) -> List[sqlite3.Row]:
+    """Get the number of findings per 1000 lines of code of each package, densest first."""
+    run, _ = _runs(connection, run, None)
+    return connection.execute(
+        """
+        SELECT
+            modules.package AS package,
+            SUM(modules.loc) AS loc,
+            SUM(COALESCE(counts.findings, 0)) AS findings,
+            SUM(modules.cost) AS cost,
+            1000.0 * SUM(COALESCE(counts.findings, 0)) / MAX(SUM(modules.loc), 1) AS per_kloc
+        FROM modules
+        LEFT JOIN (
+            SELECT module, COUNT(*) AS findings FROM findings
+            WHERE run = :run GROUP BY module
+        ) AS counts ON counts.module = modules.module
+        WHERE modules.run = :run
+        GROUP BY modules.package
+        ORDER BY per_kloc DESC, package
+        """,
+        {"run": run},
+    ).fetchall()
+
+
+queries = {
+    "new": new_findings,
+    "fixed": fixed_findings,
+    "persistent": persistent_findings,
+}
+
+
+def history_main(argv: Sequence[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="perflint history",
+        description="Query the performance debt history recorded by perflint --history.",
+    )
+    parser.add_argument("database", help="SQLite database given to --history.")
+    parser.add_argument("query", choices=[*queries, "density"])
+    parser.add_argument("--run", type=int, help="Run to query, the last one by default.")
+    parser.add_argument(
+        "--previous",
+        type=int,
+        help="Run to compare with, the one before --run by default.",
+    )
+    args = parser.parse_args(argv)
+
+    connection = connect(args.database)
+    try:
+        if args.query == "density":
+            for row in density(connection, args.run):
+                print(
+                    f"{row['package'] or '.'}: {row['per_kloc']:.1f} findings per 1k LOC "
+                    f"({row['findings']} in {row['loc']} lines, cost {row['cost']})"
+                )
+            return 0
+        for row in queries[args.query](connection, args.run, args.previous):
+            print(
+                f"{row['path']}:{row['line']}: {row['msg_id']}: {row['msg']} ({row['symbol']})"
+            )
+    finally:
+        connection.close()
+    return 0
@@ -0,0 +1,162 @@
+import multiprocessing
+import os
+import sqlite3
+from typing import Dict, List, Optional, Set, Tuple
+from astroid import MANAGER
+from astroid.exceptions import AstroidBuildingError
+from pylint.checkers import BaseChecker
+from pylint.message import Message
+from pylint.reporters import CollectingReporter, MultiReporter
+
+from perflint.history import FindingRecord, ModuleMetrics, fingerprint, record_run
+from perflint.loop_context import LOOP_NODES
+from perflint.reporters import _StreamingReporter
+from perflint.sharding import ShardReporter
+
+
+def lines_of_code(lines: List[bytes]) -> int:
+    """Count the lines of a module which aren't blank or comments."""
+    return sum(1 for line in lines if line.strip() and not line.lstrip().startswith(b"#"))
+
+
+class HistoryChecker(BaseChecker):
+    """
+    The options and messages of ``HistoryReporter``, which records the findings in a SQLite database.
+    """
+
+    name = "history"
+    priority = -1
+    msgs = {
+        "F9801": (
+            'Can\'t record the findings of the run in history database "%s": %s',
+            "history-write-failed",
+            "The database given to --history couldn't be written to.",
+        ),
+    }
+    options = (
+        (
+            "history",
+            {
+                "default": "",
+                "type": "string",
+                "metavar": "<file>",
+                "help": "SQLite database to record the findings and module metrics of the run in.",
+            },
+        ),
+    )
+
+
+class HistoryReporter(_StreamingReporter):
+    """Record the findings of the perflint checkers, and metrics of each module, in the ``--history`` database.
+
+    Added next to the reporters of the output format by ``add_history_reporter``,
+    it doesn't write any output.
+    """
+
+    def __init__(self, output=None):
+        super().__init__(output)
+        self._msgids: Optional[Set[str]] = None
+        self._source: List[bytes] = []  # Of the current module
+        self._modules: Dict[str, ModuleMetrics] = {}
+        self._records: List[FindingRecord] = []
+        self._occurrences: Dict[Tuple[str, str, str, str], int] = {}
+
+    def handle_message(self, msg: Message) -> None:
+        if self._msgids is None:
+            from perflint import CHECKERS  # pylint: disable=import-outside-toplevel
+
+            self._msgids = {msgid for checker in CHECKERS for msgid in checker.msgs}
+        if msg.msg_id in self._msgids:
+            super().handle_message(msg)
+
+    def on_set_current_module(self, module: str, filepath: Optional[str]) -> None:
+        changed = module != self._module
+        super().on_set_current_module(module, filepath)
+        if not changed or filepath is None:
+            return
+        try:
+            with open(filepath, "rb") as module_file:
+                self._source = module_file.readlines()
+        except OSError:
+            self._source = []
+        if module not in self._modules:
+            self._modules[module] = self._metrics(module, filepath)
+
+    def _metrics(self, module: str, filepath: str) -> ModuleMetrics:
+        try:
+            tree = MANAGER.ast_from_file(filepath, module, source=True)
+        except (AstroidBuildingError, SyntaxError):
+            loops = 0
+        else:
+            loops = sum(1 for _ in tree.nodes_of_class(LOOP_NODES))
+        is_package = os.path.basename(filepath) == "__init__.py"
+        return ModuleMetrics(
+            module=module,
+            package=module if is_package else module.rpartition(".")[0],
+            path=filepath,
+            loc=lines_of_code(self._source),
+            loops=loops,
+            cost=0,
+        )
+
+    def _source_line(self, line: int) -> str:
+        if 0 < line <= len(self._source):
+            return self._source[line - 1].decode("utf-8", errors="replace")
+        return ""
+
+    def _write(self, findings: List[dict]) -> None:
+        seen = set()
+        for finding in findings:
+            location = (finding["symbol"], finding["line"], finding["column"], finding["message"])
+            if location in seen:
+                continue  # pylint reports some messages twice with --jobs
+            seen.add(location)
+            source = self._source_line(finding["line"])
+            key = (finding["path"], finding["symbol"], finding["obj"], source)
+            occurrence = self._occurrences.get(key, 0)
+            self._occurrences[key] = occurrence + 1
+            self._records.append(
+                FindingRecord(
+                    fingerprint=fingerprint(*key, occurrence),
+                    module=finding["module"],
+                    path=finding["path"],
+                    line=finding["line"],
+                    msg_id=finding["messageId"],
+                    symbol=finding["symbol"],
+                    obj=finding["obj"],
+                    msg=finding["message"],
+                    depth=finding["loopDepth"],
+                    cost=finding["estimatedIterations"],
+                )
+            )
+
+    def _end(self) -> None:
+        costs: Dict[str, int] = {}
+        for record in self._records:
+            costs[record.module] = costs.get(record.module, 0) + record.cost
+        modules = [
+            module._replace(cost=costs.get(module.module, 0))
+            for module in self._modules.values()
+        ]
+        records = self._records
+        self._modules, self._records, self._occurrences = {}, [], {}
+        database = self.linter.config.history
+        try:
+            record_run(database, modules, records)
+        except sqlite3.Error as ex:
+            self.linter.add_message("history-write-failed", args=(database, ex))
+
+
+def add_history_reporter(linter) -> None:
+    """Record the run in the ``--history`` database, alongside the reporters of the output format.
+
+    Shards only lint some of the files, so their runs aren't recorded.
+    """
+    if not linter.config.history or isinstance(linter.reporter, ShardReporter):
+        return
+    if (
+        type(linter.reporter) is CollectingReporter  # pylint: disable=unidiomatic-typecheck
+        and multiprocessing.parent_process() is not None
+    ):
+        return  # A --jobs worker, its messages are reported by the main process
+    linter.set_reporter(MultiReporter([linter.reporter, HistoryReporter()], lambda: None))
@@ -0,0 +1,82 @@
+"""Measured import time of the modules being linted.
+
+Modules are imported in a subprocess with ``python -X importtime``, which
+reports the time spent importing each module and the modules it imports.
+Every module in the output is recorded, so importing one module of a package
+usually measures many of the others too, and each module is only imported
+once per run.
+"""
+import os
+import subprocess
+import sys
+from typing import Dict, Optional
+
+from perflint.callgraph import package_root
+
+IMPORT_TIMEOUT = 60
+
+# Cumulative import time in microseconds, by module name.
+_cumulative: Dict[str, int] = {}
+_failed = set()
+
+
+def parse_importtime(output: str) -> Dict[str, int]:
+    """Parse the cumulative time of each module from ``-X importtime`` output."""
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3:
+            continue
+        try:
+            cumulative = int(fields[1])
+        except ValueError:
+            continue  # The header
+        times[fields[2].strip()] = cumulative
+    return times
+
+
+def measure(modname: str, path: Optional[str] = None) -> Dict[str, int]:
+    """Import a module in a new interpreter and get the cumulative time of each module imported.
+
+    ``path`` is the file of the module, its package's parent directory, or its
+    own directory when it isn't in a package, is put on ``sys.path`` so the
+    module can be imported without being installed.
+    """
+    env = dict(os.environ)
+    cwd = None
+    if path is not None:
+        cwd = package_root(path)
+        if os.path.exists(os.path.join(cwd, "__init__.py")):
+            cwd = os.path.dirname(cwd)
+        env["PYTHONPATH"] = os.pathsep.join(
+            [p for p in (cwd, env.get("PYTHONPATH")) if p]
+        )
+    try:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {modname}"],
+            cwd=cwd,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            timeout=IMPORT_TIMEOUT,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return {}
+    if result.returncode != 0:
+        return {}  # Modules which failed to import are still timed
+    return parse_importtime(result.stderr)
+
+
+def import_time(modname: str, path: Optional[str] = None) -> Optional[float]:
+    """Get the cumulative import time of a module in milliseconds, measuring it on first use."""
+    if modname not in _cumulative and modname not in _failed:
+        _cumulative.update(measure(modname, path))
+        if modname not in _cumulative:
+            _failed.add(modname)  # Not importable, don't try again
+    if modname not in _cumulative:
+        return None
+    return _cumulative[modname] / 1000
@@ -0,0 +1,249 @@
+from typing import Dict, Iterator, List, Optional
+from astroid import nodes
+from pylint.checkers import BaseChecker
+from pylint.checkers import utils as checker_utils
+
+from perflint.import_time import import_time
+from perflint.io_checker import call_qname, file_openers, file_readers
+from perflint.loop_context import length_bound
+
+
+io_functions = {
+    *file_openers,
+    *file_readers,
+    "posix.listdir",
+    "posix.scandir",
+    "nt.listdir",
+    "nt.scandir",
+    "os.walk",
+    "glob.glob",
+    "subprocess.run",
+    "subprocess.call",
+    "subprocess.check_call",
+    "subprocess.check_output",
+    "urllib.request.urlopen",
+    "socket.create_connection",
+    "requests.api.get",
+    "requests.api.post",
+    "requests.api.request",
+}
+heavy_modules = {
+    "numpy",
+    "pandas",
+    "scipy",
+    "matplotlib",
+    "sklearn",
+    "sympy",
+    "torch",
+    "tensorflow",
+    "transformers",
+    "cv2",
+    "PIL",
+    "nltk",
+    "boto3",
+    "botocore",
+    "requests",
+}
+REGEX_TABLE_SIZE = 5
+LARGE_COMPREHENSION = 1000
+
+
+def _is_deferred_block(node: nodes.If) -> bool:
+    """``if __name__ == "__main__":`` and ``if TYPE_CHECKING:`` don't run on import."""
+    test = node.test.as_string()
+    return test.endswith("TYPE_CHECKING") or ("__name__" in test and "__main__" in test)
+
+
+def import_time_statements(body: List[nodes.NodeNG]) -> Iterator[nodes.NodeNG]:
+    """Get the statements of a module or class body which run when the module is imported.
+
+    Compound statements are entered, and the expressions they evaluate themselves
+    (such as the test of an ``if``) are yielded instead of the statement.
+    """
+    for statement in body:
+        if isinstance(statement, (nodes.FunctionDef, nodes.AsyncFunctionDef)):
+            continue
+        if isinstance(statement, nodes.If):
+            if _is_deferred_block(statement):
+                continue
+            yield statement.test
+            yield from import_time_statements(statement.body)
+            yield from import_time_statements(statement.orelse)
+        elif isinstance(statement, nodes.With):
+            yield from (item for item, _ in statement.items)
+            yield from import_time_statements(statement.body)
+        elif isinstance(statement, nodes.Try):
+            yield from import_time_statements(statement.body)
+            for handler in statement.handlers:
+                yield from import_time_statements(handler.body)
+            yield from import_time_statements(statement.orelse)
+            yield from import_time_statements(statement.finalbody)
+        elif isinstance(statement, nodes.ClassDef):
+            yield from import_time_statements(statement.body)
+        else:
+            yield statement
+
+
+def _evaluated(node: nodes.NodeNG) -> Iterator[nodes.NodeNG]:
+    """Walk the nodes of a statement, without entering functions and lambdas."""
+    yield node
+    for child in node.get_children():
+        if not isinstance(child, (nodes.FunctionDef, nodes.Lambda)):
+            yield from _evaluated(child)
+
+
+def _function_uses(
+    module: nodes.Module, name: str, imported: nodes.NodeNG
+) -> List[nodes.FunctionDef]:
+    """Get the functions a name is used in, or an empty list if it's also used at import time."""
+    functions = []
+    for use in module.nodes_of_class(nodes.Name):
+        if use.name != name:
+            continue
+        _, assignments = use.lookup(name)
+        if imported not in assignments:
+            continue
+        frame = use.frame()
+        # Annotations, defaults and decorators are evaluated with the function definition
+        if not isinstance(frame, nodes.FunctionDef) or use.statement() is frame:
+            return []
+        if frame not in functions:
+            functions.append(frame)
+    return functions
+
+
+class ImportTimeChecker(BaseChecker):
+    """
+    Check for expensive work done at module level, when a module is imported.
+    """
+
+    name = "import-time-checker"
+    priority = -1
+    msgs = {
+        "W9401": (
+            "Loop at module level runs when the module is imported%s, move it into a function called on first use.",
+            "import-time-loop",
+            "Module level code runs on every import, slowing down the start-up of every program using the module.",
+        ),
+        "W9402": (
+            '"%s" does I/O when the module is imported%s, defer it to a function called on first use.',
+            "import-time-io",
+            "I/O at import time makes importing the module slow and dependent on the environment.",
+        ),
+        "W9403": (
+            "%d regular expressions are compiled when the module is imported%s, compile them lazily on first use.",
+            "import-time-regex-table",
+            "Compiling regular expressions is expensive, large tables of patterns slow down start-up.",
+        ),
+        "W9404": (
+            "Comprehension of %d items is built when the module is imported%s, build it lazily with functools.cache().",
+            "import-time-comprehension",
+            "Large containers computed at module level slow down start-up.",
+        ),
+        "W9405": (
+            'Heavy module "%s" is only used by "%s", import it inside the function to defer its import cost.',
+            "heavy-import-single-use",
+            "Importing a large package at module level makes every import of this module pay for it.",
+        ),
+        "W9406": (
+            'Importing module "%s" takes %.1f ms (cumulative).',
+            "slow-module-import",
+            "Measured with python -X importtime, including the modules it imports.",
+        ),
+    }
+    options = (
+        (
+            "measure-import-time",
+            {
+                "default": False,
+                "type": "yn",
+                "metavar": "<y or n>",
+                "help": "Import each module with python -X importtime and attach its measured import cost to the import-time messages.",
+            },
+        ),
+        (
+            "import-time-threshold",
+            {
+                "default": 100,
+                "type": "int",
+                "metavar": "<ms>",
+                "help": "Measured cumulative import time above which a module, or a module it imports, is slow.",
+            },
+        ),
+    )
+
+    def _measured(self, modname: str, path: Optional[str] = None) -> Optional[float]:
+        if not self.linter.config.measure_import_time:
+            return None
+        return import_time(modname, path)
+
+    @checker_utils.only_required_for_messages(
+        "import-time-loop",
+        "import-time-io",
+        "import-time-regex-table",
+        "import-time-comprehension",
+        "heavy-import-single-use",
+        "slow-module-import",
+    )
+    def visit_module(self, node: nodes.Module) -> None:
+        cost = self._measured(node.name, node.file) if node.file else None
+        suffix = f" (cumulative import time {cost:.1f} ms)" if cost is not None else ""
+        if cost is not None and cost >= self.linter.config.import_time_threshold:
+            self.add_message("slow-module-import", node=node, args=(node.name, cost))
+
+        compiles: List[nodes.Call] = []
+        for statement in import_time_statements(node.body):
+            if isinstance(statement, (nodes.For, nodes.While)):
+                self.add_message("import-time-loop", node=statement, args=(suffix,))
+                continue
+            if isinstance(statement, (nodes.Import, nodes.ImportFrom)):
+                self._check_import(node, statement)
+                continue
+            for child in _evaluated(statement):
+                if isinstance(child, nodes.Call):
+                    qname = call_qname(child)
+                    if qname in io_functions:
+                        self.add_message(
+                            "import-time-io",
+                            node=child,
+                            args=(child.func.as_string(), suffix),
+                        )
+                    elif qname == "re.compile":
+                        compiles.append(child)
+                elif isinstance(child, (nodes.ListComp, nodes.SetComp, nodes.DictComp)):
+                    bound = length_bound(child.generators[0].iter)
+                    if bound is not None and bound >= LARGE_COMPREHENSION:
+                        self.add_message(
+                            "import-time-comprehension", node=child, args=(bound, suffix)
+                        )
+        if len(compiles) >= REGEX_TABLE_SIZE:
+            self.add_message(
+                "import-time-regex-table", node=compiles[0], args=(len(compiles), suffix)
+            )
+
+    def _is_heavy(self, modname: str) -> bool:
+        if modname.split(".")[0] in heavy_modules:
+            return True
+        cost = self._measured(modname)
+        return cost is not None and cost >= self.linter.config.import_time_threshold
+
+    def _check_import(self, module: nodes.Module, node: nodes.NodeNG) -> None:
+        bound: Dict[str, str] = {}
+        for name, alias in node.names:
+            if isinstance(node, nodes.ImportFrom):
+                modname = node.modname
+                if node.level:
+                    continue  # Modules of the same package
+            else:
+                modname = name if alias else name.split(".")[0]
+            bound[alias or name.split(".")[0]] = modname
+        for name, modname in bound.items():
+            if name == "*" or not self._is_heavy(modname):
+                continue
+            functions = _function_uses(module, name, node)
+            if len(functions) == 1:
+                self.add_message(
+                    "heavy-import-single-use",
+                    node=node,
+                    args=(modname, functions[0].name),
+                )
@@ -0,0 +1,167 @@
+"""Inference with a time budget.
+
+astroid inference can take minutes on very large, generated modules. The
+checkers infer values with ``safe_infer`` from this module, which spends at
+most ``--perflint-inference-budget-ms`` inferring values in each file, and at
+most ``--perflint-node-inference-budget-ms`` on any single value. Once the
+budget of a file is spent, values are no longer inferred for the rest of it
+and the checkers fall back to syntactic checks: literals and names assigned a
+literal are still resolved, and annotations are still used by the checkers
+which read them (see ``perflint.utils.local_type``).
+
+Inference is interrupted with ``SIGALRM`` when it runs over budget, which puts
+a hard limit on the time spent in it. astroid caches a module before it has
+finished building it, so modules cached by an interrupted inference are
+evicted from the cache. Where timers aren't available (Windows,
+threads other than the main thread, or when another timer is running) the
+budget is only checked between inferences.
+"""
+import contextlib
+import signal
+import threading
+import time
+from typing import Iterator, Optional
+from astroid import MANAGER, nodes
+from astroid.typing import InferenceResult
+from astroid.util import safe_infer as astroid_safe_infer
+
+LITERAL_NODES = (nodes.Const, nodes.List, nodes.Tuple, nodes.Set, nodes.Dict)
+
+
+class InferenceTimeout(BaseException):
+    """Interrupts an inference which ran over budget.
+
+    A ``BaseException`` so astroid doesn't handle it as an inference error.
+    """
+
+
+def _raise_timeout(signum, frame):
+    raise InferenceTimeout
+
+
+def _can_interrupt() -> bool:
+    return (
+        hasattr(signal, "setitimer")
+        and threading.current_thread() is threading.main_thread()
+        and signal.getitimer(signal.ITIMER_REAL)[0] == 0
+    )
+
+
+@contextlib.contextmanager
+def _deadline(seconds: float) -> Iterator[None]:
+    """Raise ``InferenceTimeout`` in the block if it runs for longer than ``seconds``."""
+    if not _can_interrupt():
+        yield
+        return
+    previous = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        try:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        finally:
+            signal.signal(signal.SIGALRM, previous)
+
+
+def syntactic_infer(node: nodes.NodeNG) -> Optional[InferenceResult]:
+    """Resolve literals, and names assigned a literal once in their scope, without inference."""
+    if isinstance(node, LITERAL_NODES):
+        return node
+    if not isinstance(node, nodes.Name):
+        return None
+    _, assignments = node.lookup(node.name)
+    if len(assignments) != 1:
+        return None
+    assigned = assignments[0]
+    if isinstance(assigned, nodes.AssignName) and isinstance(
+        assigned.parent, (nodes.Assign, nodes.AnnAssign)
+    ):
+        value = assigned.parent.value
+        if isinstance(value, LITERAL_NODES):
+            return value
+    return None
+
+
+class InferenceBudget:
+    """Time spent inferring values in the current file, and the values which weren't inferred."""
+
+    def __init__(self) -> None:
+        self.file_budget = 0.0  # Seconds, 0 for no budget
+        self.node_budget = 0.0
+        self.linter = None  # Tells when the linter moves to the next file
+        self.module: Optional[str] = None
+        self.spent = 0.0
+        self.exhausted = False  # The budget of the file is spent
+        self.timeouts = 0  # Values which ran over the budget of a node
+        self.fallbacks = 0  # Values resolved syntactically
+        self.run_fallbacks = 0  # In every file of the run
+        self._inferring = False
+
+    def configure(self, linter, file_budget_ms: int, node_budget_ms: int) -> None:
+        self.linter = linter
+        self.file_budget = file_budget_ms / 1000
+        self.node_budget = node_budget_ms / 1000
+        self.start(None)
+
+    def start(self, module: Optional[str]) -> None:
+        """Reset the budget for a new file."""
+        self.module = module
+        self.spent = 0.0
+        self.exhausted = False
+        self.timeouts = 0
+        self.fallbacks = 0
+
+    @property
+    def degraded(self) -> bool:
+        return self.fallbacks > 0
+
+    def _limit(self) -> float:
+        limits = [self.node_budget] if self.node_budget else []
+        if self.file_budget:
+            limits.append(self.file_budget - self.spent)
+        return min(limits) if limits else 0.0
+
+    def _fallback(self) -> None:
+        self.fallbacks += 1
+        self.run_fallbacks += 1
+
+    def infer(self, node: nodes.NodeNG) -> Optional[InferenceResult]:
+        if self._inferring or not (self.file_budget or self.node_budget):
+            return astroid_safe_infer(node)
+        if self.linter is not None and self.linter.current_name != self.module:
+            self.start(self.linter.current_name)
+        if self.exhausted:
+            self._fallback()
+            return syntactic_infer(node)
+
+        limit = self._limit()
+        started = time.perf_counter()
+        cached = len(MANAGER.astroid_cache)
+        self._inferring = True
+        try:
+            with _deadline(limit):
+                return astroid_safe_infer(node)
+        except InferenceTimeout:
+            # Modules are cached in the order they're built, the last ones may be incomplete
+            for name in list(MANAGER.astroid_cache)[cached:]:
+                del MANAGER.astroid_cache[name]
+            self._fallback()
+            if self.node_budget and limit == self.node_budget:
+                self.timeouts += 1
+            else:
+                self.exhausted = True
+            return syntactic_infer(node)
+        finally:
+            self._inferring = False
+            self.spent += time.perf_counter() - started
+            if self.file_budget and self.spent >= self.file_budget:
+                self.exhausted = True
+
+
+budget = InferenceBudget()
+
+
+def safe_infer(node: nodes.NodeNG) -> Optional[InferenceResult]:
+    """Infer the single value of a node within the inference budget, like ``astroid.helpers.safe_infer``."""
+    return budget.infer(node)
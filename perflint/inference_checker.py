@@ -0,0 +1,53 @@
+from astroid import nodes
+from pylint.checkers import BaseChecker
+
+from perflint.inference import budget
+
+
+class InferenceBudgetChecker(BaseChecker):
+    """
+    Configure the inference budget, and report the modules which ran over it.
+    """
+
+    name = "inference-budget"
+    priority = -1
+    msgs = {
+        "I9901": (
+            "Inference ran over its budget, %d values in this module were only checked syntactically.",
+            "inference-budget-exceeded",
+            "Checks which need inference are skipped or use annotations and literals instead, so findings may be missing.",
+        ),
+    }
+    options = (
+        (
+            "perflint-inference-budget-ms",
+            {
+                "default": 0,
+                "type": "int",
+                "metavar": "<ms>",
+                "help": "Maximum time spent inferring values in each file, 0 for no limit.",
+            },
+        ),
+        (
+            "perflint-node-inference-budget-ms",
+            {
+                "default": 0,
+                "type": "int",
+                "metavar": "<ms>",
+                "help": "Maximum time spent inferring a single value, 0 for no limit.",
+            },
+        ),
+    )
+
+    def open(self) -> None:
+        budget.configure(
+            self.linter,
+            self.linter.config.perflint_inference_budget_ms,
+            self.linter.config.perflint_node_inference_budget_ms,
+        )
+
+    def leave_module(self, node: nodes.Module) -> None:
+        if budget.module == node.name and budget.degraded:
+            self.add_message(
+                "inference-budget-exceeded", node=node, args=(budget.fallbacks,)
+            )
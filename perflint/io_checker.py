@@ -0,0 +1,252 @@
+from typing import Optional
+from astroid import bases, nodes
+from pylint.checkers import BaseChecker
+from pylint.checkers import utils as checker_utils
+
+from perflint.inference import safe_infer
+from perflint.utils import (
+    get_children_recursive,
+    iterated_once,
+    local_type,
+)
+from perflint.loop_context import LoopContext, enclosing_loop
+
+
+file_openers = {
+    "_io.open",
+    "io.open",
+    "codecs.open",
+    "gzip.open",
+    "bz2.open",
+    "lzma.open",
+    "pathlib.Path.open",
+}
+file_readers = {
+    "pathlib.Path.read_text",
+    "pathlib.Path.read_bytes",
+}
+stat_functions = {
+    "genericpath.exists",
+    "genericpath.isfile",
+    "genericpath.isdir",
+    "genericpath.getsize",
+    "genericpath.getmtime",
+    "genericpath.getatime",
+    "genericpath.getctime",
+    "posixpath.lexists",
+    "posixpath.islink",
+    "ntpath.lexists",
+    "ntpath.islink",
+    "posix.stat",
+    "posix.lstat",
+    "nt.stat",
+    "nt.lstat",
+    "os.stat",
+    "os.lstat",
+    "pathlib.Path.exists",
+    "pathlib.Path.is_file",
+    "pathlib.Path.is_dir",
+    "pathlib.Path.is_symlink",
+    "pathlib.Path.stat",
+    "pathlib.Path.lstat",
+}
+file_type_names = (
+    "IO",
+    "TextIO",
+    "BinaryIO",
+    "TextIOWrapper",
+    "BufferedReader",
+    "BufferedWriter",
+    "FileIO",
+)
+path_classes = ("Path", "PurePath", "PosixPath", "WindowsPath", "PathBase")
+
+
+def call_qname(node: nodes.Call) -> Optional[str]:
+    """Get the qualified name of the function called by ``node``.
+
+    Methods of the ``pathlib`` path classes are normalised to ``pathlib.Path.<name>``.
+    """
+    inferred = safe_infer(node.func)
+    if isinstance(inferred, bases.BoundMethod):
+        klass = inferred.bound
+        if isinstance(klass, bases.Instance):
+            klass = klass._proxied
+        if getattr(klass, "name", None) in path_classes:
+            return f"pathlib.Path.{inferred.name}"
+        return inferred.qname()
+    if isinstance(inferred, nodes.FunctionDef):
+        return inferred.qname()
+    return None
+
+
+def opening_call(node: nodes.NodeNG) -> Optional[nodes.Call]:
+    """Find the ``open()`` call which assigned the file handle ``node``.
+
+    Both ``f = open(...)`` and ``with open(...) as f`` are supported.
+    """
+    if isinstance(node, nodes.Call):
+        return node if call_qname(node) in file_openers else None
+    if not isinstance(node, nodes.Name):
+        return None
+    _, assignments = node.lookup(node.name)
+    if len(assignments) != 1 or not isinstance(assignments[0], nodes.AssignName):
+        return None
+    assigned = assignments[0]
+    if isinstance(assigned.parent, nodes.Assign):
+        return opening_call(assigned.parent.value)
+    if isinstance(assigned.parent, nodes.With):
+        for item, var in assigned.parent.items:
+            if var is assigned:
+                return opening_call(item)
+    return None
+
+
+def is_file(node: nodes.NodeNG) -> bool:
+    """Check if an expression is a file object, by its origin, inferred type or annotation."""
+    if opening_call(node) is not None:
+        return True
+    inferred = safe_infer(node)
+    if isinstance(inferred, bases.Instance) and inferred.name in file_type_names:
+        return True
+    annotation = local_type(node)
+    return annotation is not None and annotation.name in file_type_names
+
+
+def _call_argument(node: nodes.Call, position: int, keyword: str):
+    if len(node.args) > position:
+        return node.args[position]
+    for kw in node.keywords or ():
+        if kw.arg == keyword:
+            return kw.value
+    return None
+
+
+def is_unbuffered_or_binary(node: nodes.Call) -> bool:
+    """Check if an ``open()`` call opens a binary or unbuffered file."""
+    mode = _call_argument(node, 1, "mode")
+    if isinstance(mode, nodes.Const) and isinstance(mode.value, str):
+        if "b" in mode.value:
+            return True
+    buffering = _call_argument(node, 2, "buffering")
+    return isinstance(buffering, nodes.Const) and buffering.value == 0
+
+
+class IOChecker(BaseChecker):
+    """
+    Check for inefficient file and filesystem access.
+    """
+
+    name = "io-checker"
+    priority = -1
+    msgs = {
+        "W8801": (
+            'File "%s" is opened on every iteration, open it once before the loop.',
+            "open-in-loop",
+            "Opening a file is a system call, and discards the buffer of the previous handle.",
+        ),
+        "W8802": (
+            "Writing to a binary or unbuffered file on every iteration, collect the data and write it once.",
+            "unbatched-write-in-loop",
+            "Each write to an unbuffered or binary file has a fixed overhead, batching writes reduces system calls.",
+        ),
+        "W8803": (
+            "Iterate over the file directly instead of reading all lines with readlines().",
+            "readlines-single-pass",
+            "File objects are iterators of lines, reading them into a list first allocates the whole file.",
+        ),
+        "W8804": (
+            "Reading the whole file to split it into lines, iterate over the file to stream it instead.",
+            "read-splitlines",
+            "Reading an entire file and then splitting it keeps two copies of the file in memory.",
+        ),
+        "W8805": (
+            '"%s" queries the filesystem on every iteration, use os.scandir() for cached file attributes.',
+            "stat-in-loop",
+            "os.scandir() returns entries which cache the type and stat information of each file.",
+        ),
+    }
+
+    @checker_utils.only_required_for_messages(
+        "open-in-loop",
+        "unbatched-write-in-loop",
+        "readlines-single-pass",
+        "read-splitlines",
+        "stat-in-loop",
+    )
+    def visit_call(self, node: nodes.Call) -> None:
+        loop = enclosing_loop(node)
+        if not isinstance(node.func, nodes.Attribute):
+            if loop is not None:
+                self._check_call_in_loop(node, loop)
+            return
+
+        method = node.func.attrname
+        if method == "readlines" and not node.args:
+            self._check_readlines(node)
+        elif method == "splitlines" or (
+            method == "split"
+            and node.args
+            and isinstance(node.args[0], nodes.Const)
+            and node.args[0].value == "\n"
+        ):
+            self._check_splitlines(node)
+        elif method == "write" and loop is not None:
+            handle = opening_call(node.func.expr)
+            if handle is not None and is_unbuffered_or_binary(handle):
+                self.add_message("unbatched-write-in-loop", node=node)
+
+        if loop is not None:
+            self._check_call_in_loop(node, loop)
+
+    def _check_call_in_loop(self, node: nodes.Call, loop: LoopContext) -> None:
+        qname = call_qname(node)
+        if qname in stat_functions:
+            self.add_message("stat-in-loop", node=node, args=(node.func.as_string(),))
+        elif qname in file_openers:
+            arguments = [*node.args, *(kw.value for kw in node.keywords or ())]
+            if isinstance(node.func, nodes.Attribute):
+                arguments.append(node.func.expr)
+            for argument in arguments:
+                for child in (argument, *get_children_recursive(argument)):
+                    if isinstance(child, nodes.Name) and child.name in loop.assigned:
+                        return
+            filename = node.args[0] if node.args else node.func
+            self.add_message("open-in-loop", node=node, args=(filename.as_string(),))
+
+    def _check_readlines(self, node: nodes.Call) -> None:
+        if not is_file(node.func.expr):
+            return
+        if isinstance(node.parent, nodes.For) and node.parent.iter is node:
+            self.add_message("readlines-single-pass", node=node)
+            return
+        # lines = f.readlines() followed by a single for loop over lines
+        if not isinstance(node.parent, nodes.Assign):
+            return
+        target = node.parent.targets[0]
+        if not isinstance(target, nodes.AssignName):
+            return
+        if iterated_once(target):
+            self.add_message("readlines-single-pass", node=node)
+
+    def _check_splitlines(self, node: nodes.Call) -> None:
+        source = node.func.expr
+        if isinstance(source, nodes.Name):
+            # data = f.read(); data.splitlines()
+            _, assignments = source.lookup(source.name)
+            if len(assignments) != 1 or not isinstance(
+                assignments[0].parent, nodes.Assign
+            ):
+                return
+            source = assignments[0].parent.value
+        if not isinstance(source, nodes.Call):
+            return
+        if call_qname(source) in file_readers:
+            self.add_message("read-splitlines", node=node)
+        elif (
+            isinstance(source.func, nodes.Attribute)
+            and source.func.attrname == "read"
+            and not source.args
+            and is_file(source.func.expr)
+        ):
+            self.add_message("read-splitlines", node=node)
@@ -1,8 +1,10 @@
-from typing import Dict, List
+from typing import Dict, List, Set, Union
 from astroid import nodes
 from pylint.checkers import BaseChecker
 from pylint.checkers import utils as checker_utils
 
+from perflint.defuse import get_def_use
+
 
 class ListChecker(BaseChecker):
     """
@@ -22,6 +24,8 @@ class ListChecker(BaseChecker):
     def __init__(self, linter=None):
         super().__init__(linter)
         self._lists_to_watch: List[Dict[str, nodes.AssignName]] = []
+        # Names mutated by nested functions, for each scope in _lists_to_watch
+        self._nested_mutations: List[Set[str]] = []
 
     def visit_assign(self, node: nodes.Assign):
         if not isinstance(node.value, nodes.List):
@@ -33,48 +37,33 @@ class ListChecker(BaseChecker):
                 return
             self._lists_to_watch[-1][node.targets[0].name] = node.targets[0]
 
-    def visit_module(self, node: nodes.Module):
+    def _enter_scope(self, node: Union[nodes.Module, nodes.FunctionDef]):
+        if self._nested_mutations:
+            mutated = get_def_use(node).nonlocal_mutations()
+            for outer in self._nested_mutations:
+                outer.update(mutated)
         self._lists_to_watch.append({})
+        self._nested_mutations.append(set())
 
-    def _raise_for_scope(self):
+    def _raise_for_scope(self, node: Union[nodes.Module, nodes.FunctionDef]):
         _lists = self._lists_to_watch.pop()
-        for _assignment in _lists.values():
+        nested_mutations = self._nested_mutations.pop()
+        def_use = get_def_use(node)
+        for name, _assignment in _lists.items():
+            if def_use.is_mutated(name) or name in nested_mutations:
+                continue
             self.add_message("use-tuple-over-list", node=_assignment.parent.value)
 
+    def visit_module(self, node: nodes.Module):
+        self._enter_scope(node)
+
     @checker_utils.only_required_for_messages("use-tuple-over-list")
     def leave_module(self, node: nodes.Module):
-        self._raise_for_scope()
+        self._raise_for_scope(node)
 
     def visit_functiondef(self, node: nodes.FunctionDef):
-        self._lists_to_watch.append({})
+        self._enter_scope(node)
 
     @checker_utils.only_required_for_messages("use-tuple-over-list")
     def leave_functiondef(self, node: nodes.FunctionDef):
-        self._raise_for_scope()
-
-    def visit_call(self, node: nodes.Call) -> None:
-        """Look for method calls to list nodes."""
-        if not isinstance(node.func, nodes.Attribute):
-            return
-        if not isinstance(node.func.expr, nodes.Name):
-            return
-        # TODO : Filter from non-mutation methods
-        self._mark_mutated(node.func.expr)
-
-    def _mark_mutated(self, _name: nodes.Name):
-        if _name.name in self._lists_to_watch[-1]:
-            del self._lists_to_watch[-1][_name.name]
-            return
-        scope, _ = _name.lookup(_name.name)
-        if not isinstance(scope, nodes.Module):
-            return
-        if _name.name in scope.globals \
-            and _name.name in self._lists_to_watch[0]:
-            del self._lists_to_watch[0][_name.name]
-
-    def visit_subscript(self, node: nodes.Subscript):
-        if not isinstance(node.parent, nodes.Assign):
-            return
-        if not isinstance(node.value, nodes.Name):
-            return
-        self._mark_mutated(node.value)
+        self._raise_for_scope(node)
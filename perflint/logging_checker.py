@@ -0,0 +1,170 @@
+from typing import Optional
+from astroid import bases, nodes
+from pylint.checkers import BaseChecker
+from pylint.checkers import utils as checker_utils
+
+from perflint.inference import safe_infer
+from perflint.io_checker import call_qname
+from perflint.loop_context import enclosing_loop
+from perflint.utils import assigned_value, self_attribute_assignments
+
+
+logger_factories = {"logging.getLogger"}
+logger_type_names = ("Logger", "RootLogger", "LoggerAdapter")
+# Warnings and errors are normally enabled, so formatting them isn't wasted
+lazy_methods = ("debug", "info", "log")
+MAX_DEPTH = 4
+
+
+def _is_logger_value(value: nodes.NodeNG) -> bool:
+    return isinstance(value, nodes.Call) and call_qname(value) in logger_factories
+
+
+def _is_logger_annotation(annotation: Optional[nodes.NodeNG]) -> bool:
+    if annotation is None:
+        return False
+    return annotation.as_string().split("[")[0].split(".")[-1] in logger_type_names
+
+
+def is_logger(node: nodes.NodeNG) -> bool:
+    """Check if an expression is a ``logging.Logger`` or the ``logging`` module.
+
+    ``logging.getLogger()`` can't be inferred, so loggers are recognised from
+    their assignment or annotation.
+    """
+    if _is_logger_value(node):
+        return True
+    inferred = safe_infer(node)
+    if isinstance(inferred, nodes.Module):
+        return inferred.name == "logging"
+    if isinstance(inferred, bases.Instance) and inferred.name in logger_type_names:
+        return inferred.root().name == "logging"
+    if isinstance(node, nodes.Attribute):
+        return any(
+            _is_logger_value(assigned_value(assigned))
+            for assigned in self_attribute_assignments(node)
+        )
+    if not isinstance(node, nodes.Name):
+        return False
+    _, assignments = node.lookup(node.name)
+    for assigned in assignments:
+        if not isinstance(assigned, nodes.AssignName):
+            continue
+        if isinstance(assigned.parent, nodes.Arguments):
+            arguments = assigned.parent
+            if any(
+                arg is assigned and _is_logger_annotation(annotation)
+                for arg, annotation in zip(arguments.args, arguments.annotations)
+            ):
+                return True
+            continue
+        if isinstance(assigned.parent, nodes.AnnAssign) and _is_logger_annotation(
+            assigned.parent.annotation
+        ):
+            return True
+        if _is_logger_value(assigned_value(assigned)):
+            return True
+    return False
+
+
+def formatting_kind(node: nodes.NodeNG) -> Optional[str]:
+    """Get how a message is formatted eagerly: an f-string, ``%`` or ``.format()``."""
+    if isinstance(node, nodes.JoinedStr) and any(
+        isinstance(value, nodes.FormattedValue) for value in node.values
+    ):
+        return "an f-string"
+    if isinstance(node, nodes.BinOp) and node.op == "%":
+        return "%"
+    if (
+        isinstance(node, nodes.Call)
+        and isinstance(node.func, nodes.Attribute)
+        and node.func.attrname == "format"
+        and isinstance(node.func.expr, nodes.Const)
+        and isinstance(node.func.expr.value, str)
+    ):
+        return ".format()"
+    return None
+
+
+def _is_level_guard(node: nodes.NodeNG, _depth: int = 0) -> bool:
+    """Check for ``logger.isEnabledFor()`` in a test, or a name assigned from it."""
+    if any(
+        isinstance(call.func, nodes.Attribute) and call.func.attrname == "isEnabledFor"
+        for call in node.nodes_of_class(nodes.Call)
+    ):
+        return True
+    if _depth > MAX_DEPTH:
+        return False
+    for name in node.nodes_of_class(nodes.Name):
+        _, assignments = name.lookup(name.name)
+        for assigned in assignments:
+            value = assigned_value(assigned)
+            if value is not None and _is_level_guard(value, _depth + 1):
+                return True
+    return False
+
+
+def _is_guarded(node: nodes.NodeNG) -> bool:
+    """Check if a call is inside an ``if logger.isEnabledFor(...)`` block in its function.
+
+    The block can be in the loop or around it, the message is only formatted
+    when the level is enabled either way.
+    """
+    for parent in node.node_ancestors():
+        if isinstance(parent, (nodes.FunctionDef, nodes.Lambda, nodes.ClassDef)):
+            return False
+        if isinstance(parent, (nodes.If, nodes.IfExp)) and _is_level_guard(parent.test):
+            return True
+    return False
+
+
+class LoggingChecker(BaseChecker):
+    """
+    Check for log messages which are formatted on every iteration of a loop.
+    """
+
+    name = "logging-checker"
+    priority = -1
+    msgs = {
+        "W9301": (
+            "Log message is formatted with %s on every iteration, even when the level is disabled. Pass the arguments to %s() lazily, or hoist an isEnabledFor() check out of the loop.",
+            "eager-log-formatting-in-loop",
+            "Logging methods only format %-style arguments when the message is emitted, formatting the message first does the work even when it is discarded.",
+        ),
+        "W9302": (
+            'Log argument "%s" is computed on every iteration, even when the level is disabled. Hoist an isEnabledFor() check out of the loop.',
+            "log-argument-call-in-loop",
+            "Arguments to a logging method are evaluated before the level is checked.",
+        ),
+    }
+
+    @checker_utils.only_required_for_messages(
+        "eager-log-formatting-in-loop", "log-argument-call-in-loop"
+    )
+    def visit_call(self, node: nodes.Call) -> None:
+        if not isinstance(node.func, nodes.Attribute):
+            return
+        method = node.func.attrname
+        if method not in lazy_methods:
+            return
+        message_index = 1 if method == "log" else 0
+        if len(node.args) <= message_index:
+            return
+        loop = enclosing_loop(node)
+        if loop is None or _is_guarded(node):
+            return
+        if not is_logger(node.func.expr):
+            return
+        kind = formatting_kind(node.args[message_index])
+        if kind is not None:
+            self.add_message(
+                "eager-log-formatting-in-loop", node=node, args=(kind, method)
+            )
+            return
+        for argument in node.args[message_index + 1 :]:
+            if isinstance(argument, nodes.Call):
+                self.add_message(
+                    "log-argument-call-in-loop",
+                    node=argument,
+                    args=(argument.as_string(),),
+                )
@@ -0,0 +1,222 @@
+"""Shared context of the loops in a module.
+
+Checkers query the loop evaluating a node instead of tracking loops with
+their own visit and leave hooks. Each loop has a single ``LoopContext``,
+created on first use, whose properties are computed once and shared by all
+checkers, including those of other plugins::
+
+    from perflint.loop_context import enclosing_loop
+
+    def visit_call(self, node):
+        loop = enclosing_loop(node)
+        if loop is not None and loop.trip_count != 1:
+            ...
+
+A node is in a loop when it is evaluated on every iteration. The iterable of
+a ``for`` loop and the ``else`` clause of a loop are only evaluated once, so
+they belong to the enclosing loop, if there is one. Functions, lambdas and
+classes defined in a loop are a boundary, their bodies are not in the loop.
+"""
+import functools
+from typing import FrozenSet, Iterator, List, Optional, Union
+from astroid import nodes
+from pylint.checkers import utils as checker_utils
+
+from perflint.cache import ModuleCache
+from perflint.defuse import get_def_use
+from perflint.inference import safe_infer
+
+Loop = Union[nodes.For, nodes.While]
+LOOP_NODES = (nodes.For, nodes.While)
+DEFAULT_TRIP_COUNT = 10  # Assumed number of iterations of loops over iterables of unknown length
+SCOPE_NODES = (nodes.FunctionDef, nodes.Lambda, nodes.ClassDef)
+
+# Contexts by loop, for the most recently checked modules.
+_contexts: "ModuleCache[LoopContext]" = ModuleCache()
+
+
+def is_builtin_call(node: nodes.NodeNG, *names: str) -> bool:
+    """Check if a node is a call to one of the named builtin functions."""
+    if not isinstance(node, nodes.Call) or not isinstance(node.func, nodes.Name):
+        return False
+    if node.func.name not in names:
+        return False
+    scope, _ = node.func.lookup(node.func.name)
+    return isinstance(scope, nodes.Module) and scope.name == "builtins"
+
+
+def _range_length(node: nodes.Call) -> Optional[int]:
+    values = []
+    for arg in node.args:
+        if not isinstance(arg, nodes.Const) or not isinstance(arg.value, int):
+            return None
+        values.append(arg.value)
+    try:
+        return len(range(*values))
+    except (TypeError, ValueError):
+        return None
+
+
+def length_bound(node: nodes.NodeNG) -> Optional[int]:
+    """Get an upper bound of the number of items an iterable or comprehension produces."""
+    if isinstance(node, (nodes.ListComp, nodes.GeneratorExp)):
+        if len(node.generators) != 1:
+            return None
+        return length_bound(node.generators[0].iter)
+    if is_builtin_call(node, "range"):
+        return _range_length(node)
+    if is_builtin_call(node, "map", "filter", "zip"):
+        iterables = node.args if node.func.name == "zip" else node.args[1:]
+        bounds = [length_bound(iterable) for iterable in iterables]
+        if not bounds or None in bounds:
+            return None
+        return min(bounds)
+    inferred = safe_infer(node)
+    if isinstance(inferred, (nodes.List, nodes.Tuple, nodes.Set)):
+        return len(inferred.elts)
+    if isinstance(inferred, nodes.Dict):
+        return len(inferred.items)
+    if isinstance(inferred, nodes.Const) and isinstance(inferred.value, (str, bytes)):
+        return len(inferred.value)
+    return None
+
+
+def _is_evaluated_once(loop: nodes.NodeNG, child: nodes.NodeNG) -> bool:
+    """Check if a direct child of a loop is only evaluated once."""
+    if isinstance(loop, nodes.For) and child is loop.iter:
+        return True
+    return child in loop.orelse
+
+
+def _evaluated_nodes(node: nodes.NodeNG) -> Iterator[nodes.NodeNG]:
+    """Walk a node and the nodes it evaluates, stopping at nested loops and scopes."""
+    if isinstance(node, SCOPE_NODES):
+        return
+    if isinstance(node, LOOP_NODES):
+        # Only the iterable and else clause of a nested loop are evaluated once
+        if isinstance(node, nodes.For):
+            yield from _evaluated_nodes(node.iter)
+        for statement in node.orelse:
+            yield from _evaluated_nodes(statement)
+        return
+    yield node
+    for child in node.get_children():
+        yield from _evaluated_nodes(child)
+
+
+class LoopContext:
+    """Properties of a loop, computed on first use."""
+
+    def __init__(self, node: Loop, parent: Optional["LoopContext"]):
+        self.node = node
+        self.parent = parent
+        self.depth: int = parent.depth + 1 if parent else 1
+
+    def __repr__(self) -> str:
+        return f"<LoopContext {self.node!r} depth={self.depth}>"
+
+    @functools.cached_property
+    def targets(self) -> FrozenSet[str]:
+        """Names assigned by the target of a for loop."""
+        if not isinstance(self.node, nodes.For):
+            return frozenset()
+        return frozenset(
+            target.name
+            for target in self.node.target.nodes_of_class(nodes.AssignName)
+        )
+
+    @functools.cached_property
+    def outer_targets(self) -> FrozenSet[str]:
+        """Names assigned by the targets of the loops enclosing this one."""
+        if self.parent is None:
+            return frozenset()
+        return self.parent.targets | self.parent.outer_targets
+
+    @functools.cached_property
+    def assigned(self) -> FrozenSet[str]:
+        """Names rebound or mutated anywhere in the loop, including nested loops."""
+        return get_def_use(self.node.scope()).changed_in(self.node)
+
+    @functools.cached_property
+    def evaluated(self) -> List[nodes.NodeNG]:
+        """Nodes evaluated on every iteration, excluding those of nested loops."""
+        return [
+            evaluated
+            for child in self.node.get_children()
+            if not _is_evaluated_once(self.node, child)
+            for evaluated in _evaluated_nodes(child)
+        ]
+
+    @functools.cached_property
+    def invariant_candidates(self) -> List[Union[nodes.Name, nodes.Const]]:
+        """Names and constants in the loop which are not changed by it.
+
+        Builtins and ``self`` are excluded.
+        """
+        return [
+            child
+            for child in self.evaluated
+            if isinstance(child, nodes.Const)
+            or (
+                isinstance(child, nodes.Name)
+                and child.name not in self.assigned
+                and child.name != "self"
+                and not checker_utils.is_builtin(child.name)
+            )
+        ]
+
+    @functools.cached_property
+    def trip_count(self) -> Optional[int]:
+        """Estimated number of iterations, when the iterable has a known length."""
+        if not isinstance(self.node, nodes.For):
+            return None
+        return length_bound(self.node.iter)
+
+
+def _parent_loop(node: nodes.NodeNG) -> Optional[Loop]:
+    """Find the innermost loop which evaluates ``node`` on every iteration."""
+    child, parent = node, node.parent
+    while parent is not None and not isinstance(parent, SCOPE_NODES):
+        if isinstance(parent, LOOP_NODES) and not _is_evaluated_once(parent, child):
+            return parent
+        child, parent = parent, parent.parent
+    return None
+
+
+def get_loop_context(node: Loop) -> LoopContext:
+    """Get the context of a loop."""
+    context = _contexts.get(node)
+    if context is None:
+        parent = _parent_loop(node)
+        context = _contexts[node] = LoopContext(
+            node, get_loop_context(parent) if parent is not None else None
+        )
+    return context
+
+
+def enclosing_loop(node: nodes.NodeNG) -> Optional[LoopContext]:
+    """Get the context of the innermost loop evaluating ``node``, if it is in a loop."""
+    loop = _parent_loop(node)
+    return get_loop_context(loop) if loop is not None else None
+
+
+def loop_depth(node: nodes.NodeNG) -> int:
+    """Count the loops evaluating ``node``, within its own function."""
+    loop = enclosing_loop(node)
+    return loop.depth if loop is not None else 0
+
+
+def in_loop(node: nodes.NodeNG) -> bool:
+    """Check if a node is evaluated on every iteration of a loop."""
+    return _parent_loop(node) is not None
+
+
+def estimated_iterations(node: nodes.NodeNG) -> int:
+    """Estimate how many times a node is evaluated per call of its function."""
+    iterations = 1
+    loop = enclosing_loop(node)
+    while loop is not None:
+        trip_count = loop.trip_count
+        iterations *= trip_count if trip_count is not None else DEFAULT_TRIP_COUNT
+        loop = loop.parent
+    return iterations
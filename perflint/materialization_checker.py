@@ -0,0 +1,187 @@
+from typing import Optional
+from astroid import bases, nodes, objects
+from pylint.checkers import BaseChecker
+from pylint.checkers import utils as checker_utils
+
+from perflint.inference import safe_infer
+from perflint.utils import iterated_once
+from perflint.loop_context import is_builtin_call, length_bound
+
+
+reducing_builtins = ("sum", "any", "all", "min", "max")
+list_header_size = 56
+pointer_size = 8
+
+
+def producer_kind(node: nodes.NodeNG) -> Optional[str]:
+    """Describe a lazy producer (generator, map, filter or dictionary view), if ``node`` is one."""
+    if isinstance(node, nodes.GeneratorExp):
+        return "generator"
+    inferred = safe_infer(node)
+    if isinstance(inferred, bases.Generator):
+        return "generator"
+    if isinstance(inferred, (objects.DictKeys, objects.DictValues, objects.DictItems)):
+        return "dictionary view"
+    if isinstance(inferred, bases.Instance) and inferred.name in ("map", "filter", "zip"):
+        return f"{inferred.name} object"
+    return None
+
+
+def format_allocation(items: Optional[int]) -> str:
+    """Describe the size of the list allocation avoided, when the number of items is known."""
+    if items is None:
+        return ""
+    size = list_header_size + items * pointer_size
+    for unit in ("bytes", "KiB", "MiB"):
+        if size < 1024 or unit == "MiB":
+            break
+        size /= 1024
+    amount = f"{size:,.0f}" if unit == "bytes" else f"{size:,.1f}"
+    return f" (avoids a list of {items:,} items, ~{amount} {unit})"
+
+
+class MaterializationChecker(BaseChecker):
+    """
+    Check for iterables which are materialized into lists unnecessarily.
+    """
+
+    name = "materialization-checker"
+    priority = -1
+    msgs = {
+        "W8901": (
+            "Pass a generator expression to %s() instead of building a list%s.",
+            "list-comprehension-in-reduction",
+            "Reducing functions consume an iterator, building a list first allocates every item at once.",
+        ),
+        "W8902": (
+            "str.join() builds a list from a generator anyway, a list comprehension is faster.",
+            "join-generator",
+            "str.join() needs the length of its argument, so it converts generators to lists.",
+        ),
+        "W8903": (
+            "Counting a %s by building a list, use sum(1 for _ in ...) instead.",
+            "len-of-materialized-iterator",
+            "Building a list only to get its length allocates every item.",
+        ),
+        "W8904": (
+            "Use %s() instead of sorting to get a single item%s.",
+            "sorted-for-min-max",
+            "Sorting is O(n log n) and copies the iterable, min() and max() are O(n).",
+        ),
+        "W8905": (
+            'Membership test on a list copy, test "%s" directly.',
+            "materialized-membership",
+            "Membership tests on lists are O(n) and copying to a list is O(n), dictionaries and sets are O(1).",
+        ),
+        "W8906": (
+            'List "%s" is only iterated once, iterate over the %s directly%s.',
+            "single-use-materialization",
+            "Materializing a lazy iterator which is consumed once allocates every item at once.",
+        ),
+    }
+
+    @checker_utils.only_required_for_messages(
+        "list-comprehension-in-reduction",
+        "join-generator",
+        "len-of-materialized-iterator",
+        "single-use-materialization",
+    )
+    def visit_call(self, node: nodes.Call) -> None:
+        if len(node.args) != 1:
+            return
+        if isinstance(node.func, nodes.Attribute) and node.func.attrname == "join":
+            self._check_join(node)
+            return
+        if node.keywords:
+            return
+        arg = node.args[0]
+        if is_builtin_call(node, *reducing_builtins):
+            if isinstance(arg, nodes.ListComp):
+                self.add_message(
+                    "list-comprehension-in-reduction",
+                    node=arg,
+                    args=(node.func.name, format_allocation(length_bound(arg))),
+                )
+        elif is_builtin_call(node, "len"):
+            if is_builtin_call(arg, "list", "tuple") and len(arg.args) == 1:
+                kind = producer_kind(arg.args[0])
+                if kind is not None:
+                    self.add_message(
+                        "len-of-materialized-iterator", node=node, args=(kind,)
+                    )
+        elif is_builtin_call(node, "list"):
+            self._check_single_use(node)
+
+    def _check_join(self, node: nodes.Call) -> None:
+        if not isinstance(node.args[0], nodes.GeneratorExp):
+            return
+        separator = safe_infer(node.func.expr)
+        if isinstance(separator, nodes.Const) and isinstance(
+            separator.value, (str, bytes)
+        ):
+            self.add_message("join-generator", node=node.args[0])
+
+    def _check_single_use(self, node: nodes.Call) -> None:
+        """Look for xs = list(map(...)) followed by a single for loop over xs."""
+        kind = producer_kind(node.args[0])
+        if kind is None or kind == "dictionary view":
+            return
+        if not isinstance(node.parent, nodes.Assign):
+            return
+        target = node.parent.targets[0]
+        if not isinstance(target, nodes.AssignName):
+            return
+        if iterated_once(target):
+            self.add_message(
+                "single-use-materialization",
+                node=node,
+                args=(target.name, kind, format_allocation(length_bound(node.args[0]))),
+            )
+
+    @checker_utils.only_required_for_messages("sorted-for-min-max")
+    def visit_subscript(self, node: nodes.Subscript) -> None:
+        if not is_builtin_call(node.value, "sorted") or not node.value.args:
+            return
+        index = node.slice
+        if isinstance(index, nodes.UnaryOp) and index.op == "-":
+            index = index.operand
+            last = True
+        else:
+            last = False
+        if not isinstance(index, nodes.Const) or index.value != (1 if last else 0):
+            return
+        reverse = False
+        for keyword in node.value.keywords or ():
+            if keyword.arg == "reverse":
+                if not isinstance(keyword.value, nodes.Const):
+                    return
+                reverse = bool(keyword.value.value)
+        replacement = "max" if last != reverse else "min"
+        self.add_message(
+            "sorted-for-min-max",
+            node=node,
+            args=(replacement, format_allocation(length_bound(node.value.args[0]))),
+        )
+
+    @checker_utils.only_required_for_messages("materialized-membership")
+    def visit_compare(self, node: nodes.Compare) -> None:
+        for op, right in node.ops:
+            if op not in ("in", "not in"):
+                continue
+            if not is_builtin_call(right, "list", "tuple") or len(right.args) != 1:
+                continue
+            source = right.args[0]
+            if isinstance(safe_infer(source), objects.DictKeys):
+                if (
+                    isinstance(source, nodes.Call)
+                    and isinstance(source.func, nodes.Attribute)
+                    and source.func.attrname == "keys"
+                ):
+                    source = source.func.expr  # Test the dictionary, not its keys
+            elif producer_kind(source) == "dictionary view":
+                pass
+            elif not isinstance(safe_infer(source), (nodes.Dict, nodes.Set)):
+                continue
+            self.add_message(
+                "materialized-membership", node=right, args=(source.as_string(),)
+            )
@@ -0,0 +1,286 @@
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
+from astroid import bases, nodes
+from pylint.checkers import BaseChecker
+from pylint.checkers import utils as checker_utils
+
+from perflint.defuse import DefUse, get_def_use
+from perflint.inference import safe_infer
+from perflint.loop_context import in_loop
+from perflint.purity import Effects, call_effects, function_effects, is_pure
+
+
+unhashable_nodes = (
+    nodes.List,
+    nodes.Dict,
+    nodes.Set,
+    nodes.ListComp,
+    nodes.DictComp,
+    nodes.SetComp,
+)
+unhashable_type_names = ("list", "dict", "set", "bytearray", "List", "Dict", "Set")
+mutable_builtins = ("list", "dict", "set", "bytearray")
+
+
+def _scope_nodes(node: nodes.NodeNG) -> Iterator[nodes.NodeNG]:
+    """Walk the nodes of a function body, without entering nested scopes."""
+    for child in node.get_children():
+        if isinstance(child, (nodes.FunctionDef, nodes.ClassDef, nodes.Lambda)):
+            continue
+        yield child
+        yield from _scope_nodes(child)
+
+
+def _is_cached(func: nodes.FunctionDef) -> bool:
+    if not func.decorators:
+        return False
+    return any("cache" in decorator.as_string() for decorator in func.decorators.nodes)
+
+
+def _has_hashable_parameters(func: nodes.FunctionDef) -> bool:
+    for annotation in func.args.annotations:
+        if annotation is None:
+            continue
+        if isinstance(annotation, nodes.Subscript):
+            annotation = annotation.value
+        if isinstance(annotation, (nodes.Name, nodes.Attribute)) and (
+            annotation.as_string().split(".")[-1] in unhashable_type_names
+        ):
+            return False
+    return not any(isinstance(default, unhashable_nodes) for default in func.args.defaults)
+
+
+def recursive_calls(func: nodes.FunctionDef) -> List[nodes.Call]:
+    """Get the calls a function makes to itself."""
+    calls = []
+    for child in _scope_nodes(func):
+        if (
+            isinstance(child, nodes.Call)
+            and isinstance(child.func, nodes.Name)
+            and child.func.name == func.name
+        ):
+            _, assignments = child.func.lookup(func.name)
+            if assignments == [func]:
+                calls.append(child)
+    return calls
+
+
+def _returns_fresh_mutable(node: nodes.Call) -> bool:
+    """Calls which return a new mutable object each time can't share their result."""
+    inferred = safe_infer(node.func)
+    if isinstance(inferred, nodes.ClassDef):
+        return inferred.name not in ("int", "float", "str", "bytes", "tuple", "frozenset")
+    result = safe_infer(node)
+    if isinstance(result, unhashable_nodes):
+        return True
+    if isinstance(result, bases.Instance):
+        return result.root().name != "builtins" or result.name in mutable_builtins
+    return False
+
+
+def _branch(node: Union[nodes.If, nodes.IfExp], child: nodes.NodeNG) -> Optional[str]:
+    body, orelse = (
+        (node.body, node.orelse)
+        if isinstance(node, nodes.If)
+        else ([node.body], [node.orelse])
+    )
+    for name, branch in (("body", body), ("orelse", orelse)):
+        if any(n is child or n.parent_of(child) for n in branch):
+            return name
+    return None
+
+
+def _is_exclusive(first: nodes.NodeNG, second: nodes.NodeNG) -> bool:
+    """Check if two nodes are in different branches of an if statement or expression."""
+    for parent in first.node_ancestors():
+        if parent.parent_of(second):
+            if not isinstance(parent, (nodes.If, nodes.IfExp)):
+                return False
+            first_branch = _branch(parent, first)
+            second_branch = _branch(parent, second)
+            return None not in (first_branch, second_branch) and (
+                first_branch != second_branch
+            )
+    return False
+
+
+# The most recursive calls made on any path which leaves a statement by returning
+# or raising, and on any path which carries on to the next statement. None when
+# no path does.
+Paths = Tuple[Optional[int], Optional[int]]
+
+
+def _max(*counts: Optional[int]) -> Optional[int]:
+    counts = [count for count in counts if count is not None]
+    return max(counts) if counts else None
+
+
+def _add(count: int, paths: Paths) -> Paths:
+    return tuple(None if path is None else count + path for path in paths)
+
+
+def _expression_calls(node: nodes.NodeNG, calls: Set[nodes.Call]) -> int:
+    """Count the recursive calls evaluated by an expression, once per loop iteration."""
+    if isinstance(node, (nodes.FunctionDef, nodes.ClassDef, nodes.Lambda)):
+        return 0
+    if isinstance(node, nodes.IfExp):
+        return _expression_calls(node.test, calls) + max(
+            _expression_calls(node.body, calls), _expression_calls(node.orelse, calls)
+        )
+    count = 0
+    if node in calls:
+        # A call in a loop is made more than once per frame
+        count = 2 if in_loop(node) else 1
+    return count + sum(_expression_calls(child, calls) for child in node.get_children())
+
+
+def _block_paths(statements: List[nodes.NodeNG], calls: Set[nodes.Call]) -> Paths:
+    left, through = None, 0
+    for statement in statements:
+        statement_left, statement_through = _statement_paths(statement, calls)
+        left = _max(left, None if statement_left is None else through + statement_left)
+        if statement_through is None:
+            return left, None  # The following statements are unreachable
+        through += statement_through
+    return left, through
+
+
+def _statement_paths(statement: nodes.NodeNG, calls: Set[nodes.Call]) -> Paths:
+    if isinstance(statement, (nodes.Return, nodes.Raise)):
+        return _expression_calls(statement, calls), None
+    if isinstance(statement, nodes.If):
+        test = _expression_calls(statement.test, calls)
+        body = _block_paths(statement.body, calls)
+        orelse = _block_paths(statement.orelse, calls)
+        return _add(test, (_max(body[0], orelse[0]), _max(body[1], orelse[1])))
+    if isinstance(statement, nodes.Match):
+        subject = _expression_calls(statement.subject, calls)
+        cases = [_block_paths(case.body, calls) for case in statement.cases]
+        return _add(
+            subject,
+            (
+                _max(*(case[0] for case in cases)),
+                _max(0, *(case[1] for case in cases)),  # Or no case matches
+            ),
+        )
+    count = _expression_calls(statement, calls)
+    leaves = any(
+        isinstance(child, (nodes.Return, nodes.Raise))
+        for child in _scope_nodes(statement)
+    )
+    return (count if leaves else None), count
+
+
+def calls_per_frame(func: nodes.FunctionDef, calls: List[nodes.Call]) -> int:
+    """Get the most recursive calls a call of a function makes, along any one path through it.
+
+    Calls in different branches of an if statement, conditional expression or
+    match statement, or after a return, aren't made by the same call.
+    """
+    left, through = _block_paths(func.body, set(calls))
+    return _max(left, through) or 0
+
+
+class MemoizationChecker(BaseChecker):
+    """
+    Check for pure computations which are repeated and could be cached.
+    """
+
+    name = "memoization-checker"
+    priority = -1
+    msgs = {
+        "W9101": (
+            'Function "%s" calls itself %d times per call, cache its results with functools.lru_cache() or functools.cache().',
+            "memoize-recursive-function",
+            "Recursion with more than one recursive call per frame solves overlapping subproblems repeatedly, which is exponential without a cache.",
+        ),
+        "W9102": (
+            'Pure call "%s" is evaluated %d times in this function, store the result in a local variable.',
+            "repeated-pure-call",
+            "Calling a pure function again with the same arguments repeats the work.",
+        ),
+    }
+
+    @checker_utils.only_required_for_messages(
+        "memoize-recursive-function", "repeated-pure-call"
+    )
+    def visit_functiondef(self, node: nodes.FunctionDef) -> None:
+        self._check_recursion(node)
+        self._check_repeated_calls(node)
+
+    visit_asyncfunctiondef = visit_functiondef
+
+    def _check_recursion(self, node: nodes.FunctionDef) -> None:
+        if node.is_method() or node.is_generator() or _is_cached(node):
+            return
+        calls = recursive_calls(node)
+        count = calls_per_frame(node, calls) if calls else 0
+        if count < 2:
+            return
+        if not any(
+            isinstance(ret, nodes.Return) and ret.value is not None
+            for ret in _scope_nodes(node)
+        ):
+            return  # Nothing to cache
+        if not _has_hashable_parameters(node):
+            return
+        for call in calls:
+            arguments = [*call.args, *(kw.value for kw in call.keywords or ())]
+            if any(isinstance(argument, unhashable_nodes) for argument in arguments):
+                return
+        if not is_pure(function_effects(node)):
+            return
+        self.add_message(
+            "memoize-recursive-function", node=node, args=(node.name, count)
+        )
+
+    def _is_stable(self, node: nodes.NodeNG, def_use: DefUse) -> bool:
+        """Check if an argument has the same value everywhere in the function."""
+        if isinstance(node, nodes.Const):
+            return True
+        if isinstance(node, nodes.Attribute):
+            return self._is_stable(node.expr, def_use)
+        if isinstance(node, nodes.Name):
+            if def_use.is_mutated(node.name):
+                return False
+            definitions = def_use.definitions.get(node.name, [])
+            if node.name in def_use.scope.argnames():
+                # Parameters which are never re-bound
+                return all(isinstance(d.parent, nodes.Arguments) for d in definitions)
+            # Assigned at most once, and not on every iteration of a loop
+            return len(definitions) <= 1 and not any(in_loop(d) for d in definitions)
+        return False
+
+    def _check_repeated_calls(self, node: nodes.FunctionDef) -> None:
+        def_use = get_def_use(node)
+        calls: Dict[str, List[nodes.Call]] = {}
+        for child in _scope_nodes(node):
+            if not isinstance(child, nodes.Call):
+                continue
+            arguments = [*child.args, *(kw.value for kw in child.keywords or ())]
+            if not arguments or isinstance(child.parent, nodes.Expr):
+                continue  # Called for its effects
+            if not all(
+                self._is_stable(argument, def_use)
+                for argument in (child.func, *arguments)
+            ):
+                continue
+            calls.setdefault(child.as_string(), []).append(child)
+
+        for call_string, repeated in calls.items():
+            if len(repeated) < 2:
+                continue
+            if all(
+                _is_exclusive(first, second)
+                for i, first in enumerate(repeated)
+                for second in repeated[i + 1 :]
+            ):
+                continue
+            first = repeated[0]
+            if _returns_fresh_mutable(first):
+                continue
+            # Global state read by the call could change between the calls
+            if call_effects(first) != Effects.NONE:
+                continue
+            self.add_message(
+                "repeated-pure-call", node=first, args=(call_string, len(repeated))
+            )
@@ -0,0 +1,500 @@
+"""Side-effect analysis of function calls.
+
+Each function in the project is summarised by the effects it has when called:
+reading or writing non-local state, I/O and nondeterminism. Calls into the
+standard library are looked up in a curated table. Summaries are cached per
+module, so each function is only analysed once.
+"""
+import enum
+from typing import Dict, List, Optional, Set, Union
+from astroid import bases, nodes
+from astroid.const import Context
+from astroid.modutils import is_stdlib_module
+
+from perflint.cache import ModuleCache
+from perflint.inference import safe_infer
+
+
+class Effects(enum.Flag):
+    """Effects a call can have."""
+
+    NONE = 0
+    READ = enum.auto()  # Reads non-local state
+    WRITE = enum.auto()  # Writes non-local state, including its arguments
+    IO = enum.auto()
+    NONDETERMINISTIC = enum.auto()
+
+
+UNKNOWN = Effects.READ | Effects.WRITE | Effects.IO | Effects.NONDETERMINISTIC
+IMPURE = Effects.WRITE | Effects.IO | Effects.NONDETERMINISTIC
+MAX_DEPTH = 8
+
+# Methods of builtin types which mutate the object they are called on.
+# Methods which are not listed are non-mutating.
+mutating_methods: Dict[str, Set[str]] = {
+    "list": {
+        "append",
+        "extend",
+        "insert",
+        "remove",
+        "pop",
+        "clear",
+        "sort",
+        "reverse",
+        "__setitem__",
+        "__delitem__",
+        "__iadd__",
+        "__imul__",
+    },
+    "dict": {
+        "clear",
+        "pop",
+        "popitem",
+        "setdefault",
+        "update",
+        "__setitem__",
+        "__delitem__",
+        "__ior__",
+    },
+    "set": {
+        "add",
+        "clear",
+        "discard",
+        "pop",
+        "remove",
+        "update",
+        "difference_update",
+        "intersection_update",
+        "symmetric_difference_update",
+        "__ior__",
+        "__iand__",
+        "__isub__",
+        "__ixor__",
+    },
+    "bytearray": {
+        "append",
+        "extend",
+        "insert",
+        "pop",
+        "remove",
+        "reverse",
+        "clear",
+        "__setitem__",
+        "__delitem__",
+        "__iadd__",
+    },
+}
+immutable_types = {
+    "str",
+    "bytes",
+    "int",
+    "float",
+    "complex",
+    "bool",
+    "tuple",
+    "frozenset",
+    "range",
+    "NoneType",
+}
+
+stdlib_effects: Dict[str, Effects] = {
+    # Builtins which are not listed have unknown effects.
+    **{
+        f"builtins.{name}": Effects.NONE
+        for name in (
+            "abs",
+            "all",
+            "any",
+            "ascii",
+            "bin",
+            "bool",
+            "bytes",
+            "callable",
+            "chr",
+            "complex",
+            "dict",
+            "divmod",
+            "float",
+            "format",
+            "frozenset",
+            "hash",
+            "hex",
+            "id",
+            "int",
+            "isinstance",
+            "issubclass",
+            "len",
+            "list",
+            "max",
+            "min",
+            "oct",
+            "ord",
+            "pow",
+            "range",
+            "repr",
+            "round",
+            "set",
+            "slice",
+            "sorted",
+            "str",
+            "sum",
+            "tuple",
+            "type",
+        )
+    },
+    # These create stateful iterators, or advance them
+    **{
+        f"builtins.{name}": Effects.WRITE
+        for name in (
+            "iter",
+            "next",
+            "enumerate",
+            "zip",
+            "map",
+            "filter",
+            "reversed",
+            "setattr",
+            "delattr",
+        )
+    },
+    "builtins.getattr": Effects.READ,
+    "builtins.hasattr": Effects.READ,
+    "builtins.vars": Effects.READ,
+    "builtins.globals": Effects.READ,
+    "builtins.locals": Effects.READ,
+    "builtins.print": Effects.IO,
+    "builtins.input": Effects.IO | Effects.NONDETERMINISTIC,
+    "builtins.open": Effects.IO,
+    "_io.open": Effects.IO,
+    "math": Effects.NONE,
+    "cmath": Effects.NONE,
+    "string": Effects.NONE,
+    "keyword": Effects.NONE,
+    "unicodedata": Effects.NONE,
+    "operator": Effects.NONE,
+    "_operator": Effects.NONE,
+    "operator.call": UNKNOWN,
+    "_operator.call": UNKNOWN,
+    "struct": Effects.NONE,
+    "_struct": Effects.NONE,
+    "bisect.bisect": Effects.NONE,
+    "bisect.bisect_left": Effects.NONE,
+    "bisect.bisect_right": Effects.NONE,
+    "copy": Effects.NONE,
+    "json.dumps": Effects.NONE,
+    "json.loads": Effects.NONE,
+    "os.path": Effects.NONE,
+    "posixpath": Effects.NONE,
+    "ntpath": Effects.NONE,
+    "os.path.abspath": Effects.READ,
+    "os.path.realpath": Effects.IO,
+    "os.path.expanduser": Effects.READ,
+    "os.path.expandvars": Effects.READ,
+    "os.path.exists": Effects.IO,
+    "os.path.lexists": Effects.IO,
+    "os.path.isfile": Effects.IO,
+    "os.path.isdir": Effects.IO,
+    "os.path.islink": Effects.IO,
+    "os.path.getsize": Effects.IO,
+    "os.path.getmtime": Effects.IO,
+    "genericpath": Effects.IO,
+    "re": Effects.NONE,
+    "datetime": Effects.NONE,
+    "datetime.datetime.now": Effects.NONDETERMINISTIC,
+    "datetime.datetime.utcnow": Effects.NONDETERMINISTIC,
+    "datetime.datetime.today": Effects.NONDETERMINISTIC,
+    "datetime.date.today": Effects.NONDETERMINISTIC,
+    "time": Effects.NONDETERMINISTIC,
+    "time.sleep": Effects.IO,
+    "random": Effects.NONDETERMINISTIC,
+    "random.shuffle": Effects.WRITE | Effects.NONDETERMINISTIC,
+    "random.Random.shuffle": Effects.WRITE | Effects.NONDETERMINISTIC,
+    "_random": Effects.NONDETERMINISTIC,
+    "secrets": Effects.NONDETERMINISTIC,
+    "uuid": Effects.NONDETERMINISTIC,
+    "os": Effects.IO,
+    "posix": Effects.IO,
+    "nt": Effects.IO,
+    "io": Effects.IO,
+    "_io": Effects.IO,
+    "shutil": Effects.IO,
+    "socket": Effects.IO,
+    "subprocess": Effects.IO,
+    "sqlite3": Effects.IO,
+    "logging": Effects.IO,
+    "urllib": Effects.IO,
+    "http": Effects.IO,
+}
+
+# Item assignment and in-place operators mutate their first argument.
+_operator_mutators = (
+    "setitem",
+    "delitem",
+    "iadd",
+    "iand",
+    "iconcat",
+    "ifloordiv",
+    "ilshift",
+    "imatmul",
+    "imod",
+    "imul",
+    "ior",
+    "ipow",
+    "irshift",
+    "isub",
+    "itruediv",
+    "ixor",
+)
+stdlib_effects.update(
+    {
+        f"{module}.{name}": Effects.WRITE
+        for module in ("operator", "_operator")
+        for mutator in _operator_mutators
+        for name in (mutator, f"__{mutator}__")
+    }
+)
+
+# Function summaries, for the most recently checked modules.
+_summaries: "ModuleCache[Effects]" = ModuleCache()
+
+# Functions being analysed, outermost first, with the effects assumed for their
+# recursive calls so far.
+_analysing: List[nodes.NodeNG] = []
+_assumed: Dict[nodes.NodeNG, Effects] = {}
+# For each analysis in progress, the position in _analysing of the outermost
+# function whose assumed effects it used. -1 when it was cut off at MAX_DEPTH.
+_depends_on: List[int] = []
+
+
+def is_pure(effects: Effects) -> bool:
+    """Check if a call with these effects can be moved without changing the program."""
+    return not effects & IMPURE
+
+
+def writes_state(node: nodes.NodeNG) -> bool:
+    """Check if any call in a node can write non-local state."""
+    return any(call_effects(call) & Effects.WRITE for call in node.nodes_of_class(nodes.Call))
+
+
+def _table_effects(qname: str) -> Optional[Effects]:
+    """Look up a qualified name, or the closest module or class it belongs to."""
+    parts = qname.split(".")
+    while parts:
+        effects = stdlib_effects.get(".".join(parts))
+        if effects is not None:
+            return effects
+        parts.pop()
+    return None
+
+
+def _dotted_qname(node: nodes.NodeNG) -> Optional[str]:
+    """Get the qualified name of a dotted expression rooted at an imported module.
+
+    Used when inference fails, e.g. ``os.path.join`` is ambiguous between platforms.
+    """
+    attrs = []
+    while isinstance(node, nodes.Attribute):
+        attrs.append(node.attrname)
+        node = node.expr
+    if not attrs or not isinstance(node, nodes.Name):
+        return None
+    module = safe_infer(node)
+    if not isinstance(module, nodes.Module):
+        return None
+    return ".".join([module.name, *reversed(attrs)])
+
+
+def _builtin_type_name(node: nodes.NodeNG) -> Optional[str]:
+    inferred = safe_infer(node)
+    if isinstance(inferred, (nodes.List, nodes.ListComp)):
+        return "list"
+    if isinstance(inferred, (nodes.Dict, nodes.DictComp)):
+        return "dict"
+    if isinstance(inferred, (nodes.Set, nodes.SetComp)):
+        return "set"
+    if isinstance(inferred, nodes.Tuple):
+        return "tuple"
+    if isinstance(inferred, nodes.Const):
+        return type(inferred.value).__name__
+    if isinstance(inferred, bases.Instance) and inferred.root().name == "builtins":
+        return inferred.name
+    return None
+
+
+def method_effects(node: nodes.Call) -> Optional[Effects]:
+    """Get the effects of calling a method of a builtin type, e.g. ``items.append()``."""
+    if not isinstance(node.func, nodes.Attribute):
+        return None
+    type_name = _builtin_type_name(node.func.expr)
+    if type_name in immutable_types:
+        return Effects.NONE
+    if type_name in mutating_methods:
+        if node.func.attrname in mutating_methods[type_name]:
+            return Effects.WRITE
+        return Effects.NONE
+    return None
+
+
+def is_project_function(func: Union[nodes.FunctionDef, nodes.Lambda]) -> bool:
+    """Check if a function is defined in the project, not the standard library or builtins."""
+    module = func.root()
+    if not isinstance(module, nodes.Module) or module.name == "builtins":
+        return False
+    return not is_stdlib_module(module.name.split(".")[0])
+
+
+def call_effects(node: nodes.Call, _depth: int = 0) -> Effects:
+    """Get the effects of a call expression."""
+    effects = method_effects(node)
+    if effects is not None:
+        return effects
+
+    inferred = safe_infer(node.func)
+    if isinstance(inferred, bases.BoundMethod):
+        inferred = inferred._proxied
+    if isinstance(inferred, nodes.ClassDef):
+        if inferred.root().name == "builtins":
+            effects = _table_effects(f"builtins.{inferred.name}")
+            return UNKNOWN if effects is None else effects
+        try:
+            inferred = inferred.local_attr("__init__")[0]
+        except Exception:  # pylint: disable=broad-except
+            return Effects.NONE  # No constructor
+    if isinstance(inferred, (nodes.FunctionDef, nodes.Lambda)):
+        effects = _table_effects(inferred.qname())
+        if effects is not None:
+            return effects
+        if is_project_function(inferred):
+            return function_effects(inferred, _depth + 1)
+        return UNKNOWN
+
+    qname = _dotted_qname(node.func)
+    if qname is not None:
+        effects = _table_effects(qname)
+        if effects is not None:
+            return effects
+    return UNKNOWN
+
+
+def _local_names(func: Union[nodes.FunctionDef, nodes.Lambda]) -> Set[str]:
+    """Names bound in the body of a function, excluding its parameters.
+
+    The instance being initialised by ``__init__`` is also local to it.
+    """
+    parameters = {arg.name for arg in func.args.arguments}
+    for vararg in (func.args.vararg, func.args.kwarg):
+        if vararg:
+            parameters.add(vararg)
+    local_names = set(func.locals) - parameters
+    if func.name == "__init__" and func.args.arguments:
+        local_names.add(func.args.arguments[0].name)
+    return local_names
+
+
+def _root(node: nodes.NodeNG) -> Optional[nodes.Name]:
+    while isinstance(
+        node, (nodes.Attribute, nodes.Subscript, nodes.AssignAttr, nodes.DelAttr)
+    ):
+        node = node.value if isinstance(node, nodes.Subscript) else node.expr
+    return node if isinstance(node, nodes.Name) else None
+
+
+def _body_nodes(node: nodes.NodeNG):
+    """Walk the nodes of a function body, without entering nested scopes."""
+    for child in node.get_children():
+        if isinstance(child, (nodes.FunctionDef, nodes.ClassDef, nodes.Lambda)):
+            continue
+        yield child
+        yield from _body_nodes(child)
+
+
+def _analyse(func: Union[nodes.FunctionDef, nodes.Lambda], depth: int) -> Effects:
+    if isinstance(func, nodes.FunctionDef) and func.is_generator():
+        return Effects.WRITE  # Returns a stateful generator
+    if isinstance(func, nodes.AsyncFunctionDef):
+        return UNKNOWN
+
+    local_names = _local_names(func)
+    declared: Set[str] = set()
+    effects = Effects.NONE
+    for child in _body_nodes(func):
+        if isinstance(child, (nodes.Global, nodes.Nonlocal)):
+            declared.update(child.names)
+        elif isinstance(child, (nodes.AssignName, nodes.DelName)):
+            if child.name in declared:
+                effects |= Effects.WRITE
+        elif isinstance(child, (nodes.AssignAttr, nodes.DelAttr)) or (
+            isinstance(child, nodes.Subscript) and child.ctx != Context.Load
+        ):
+            root = _root(child)
+            if root is None or root.name not in local_names or root.name in declared:
+                effects |= Effects.WRITE
+        elif isinstance(child, nodes.Name):
+            if child.name not in local_names and child.name not in declared:
+                # Module-level variables, not functions, classes or imports
+                scope, assignments = child.lookup(child.name)
+                if isinstance(scope, nodes.Module) and any(
+                    isinstance(assigned, nodes.AssignName) for assigned in assignments
+                ):
+                    effects |= Effects.READ
+        elif isinstance(child, nodes.Call):
+            if depth > MAX_DEPTH:
+                _depends_on[-1] = -1  # Not the effects of the function, don't cache them
+                return UNKNOWN
+            call = call_effects(child, depth)
+            if call & Effects.WRITE and isinstance(child.func, nodes.Attribute):
+                # Mutating a local object, e.g. a list built by this function
+                root = _root(child.func.expr)
+                if (
+                    root is not None
+                    and root.name in local_names
+                    and root.name not in declared
+                    and method_effects(child) is not None
+                ):
+                    call &= ~Effects.WRITE
+            effects |= call
+        if effects == UNKNOWN:
+            break
+    return effects
+
+
+def function_effects(
+    func: Union[nodes.FunctionDef, nodes.Lambda], _depth: int = 0
+) -> Effects:
+    """Summarise the effects of calling a function, cached per module.
+
+    Recursive calls use the effects assumed for the function so far, starting
+    from none, and the functions of the cycle are analysed again until these
+    stop growing. Only then are their summaries cached, so the summary of a
+    function doesn't depend on which function of a cycle was analysed first.
+    """
+    effects = _summaries.get(func)
+    if effects is not None:
+        return effects
+    if func in _assumed:
+        position = _analysing.index(func)
+        if _depends_on:
+            _depends_on[-1] = min(_depends_on[-1], position)
+        return _assumed[func]
+
+    position = len(_analysing)
+    _analysing.append(func)
+    _assumed[func] = Effects.NONE
+    try:
+        while True:
+            _depends_on.append(position + 1)
+            effects = _analyse(func, _depth)
+            depends_on = _depends_on.pop()
+            if depends_on < position:
+                # Used assumptions of a caller, which analyses this function again
+                if _depends_on:
+                    _depends_on[-1] = min(_depends_on[-1], depends_on)
+                return effects
+            if depends_on > position or effects == _assumed[func]:
+                break
+            _assumed[func] = effects  # Effects only grow, so this ends
+    finally:
+        _analysing.pop()
+        del _assumed[func]
+    _summaries[func] = effects
+    return effects
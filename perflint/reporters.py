@@ -0,0 +1,234 @@
+"""Reporters which add the cost of each finding, for dashboards and code scanning.
+
+``perflint-jsonl`` writes a JSON object per finding, one per line, and
+``perflint-sarif`` a SARIF 2.1.0 log::
+
+    perflint --output-format=perflint-jsonl your_code/ > findings.jsonl
+    perflint --output-format=perflint-sarif:perflint.sarif your_code/
+
+Besides the location and message of a finding, both report the number of
+loops it is in, the function it is in, the estimated number of times it is
+evaluated per call of that function, the cost category of its rule and a
+suggested fix (see ``perflint.rules``). Findings are written as soon as the
+file they are in has been checked, instead of at the end of the run, so a run
+with tens of thousands of findings doesn't keep them all in memory.
+"""
+import abc
+import json
+from typing import Dict, List, Optional
+from astroid import MANAGER, nodes
+from astroid.exceptions import AstroidBuildingError
+from pylint.message import Message
+from pylint.reporters import BaseReporter
+
+from perflint.loop_context import estimated_iterations, loop_depth
+from perflint.rules import RULES
+from perflint.utils import node_at, nodes_by_line
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_LEVELS = {
+    "fatal": "error",
+    "error": "error",
+    "warning": "warning",
+}  # Other pylint categories are notes
+
+
+def enclosing_function(node: nodes.NodeNG) -> Optional[str]:
+    """Get the name of the function a node is in, qualified by its classes and functions."""
+    frame = node.frame()
+    while isinstance(frame, nodes.Lambda):
+        frame = frame.parent.frame()
+    if not isinstance(frame, nodes.FunctionDef):
+        return None
+    return frame.qname()[len(frame.root().name) + 1 :]
+
+
+class _StreamingReporter(BaseReporter, abc.ABC):
+    """Annotate each finding with its cost, and write the findings of each file once it is checked."""
+
+    def __init__(self, output=None):
+        super().__init__(output)
+        self._findings: List[dict] = []  # Of the file being checked
+        self._module: Optional[str] = None
+        self._tree: Optional[nodes.Module] = None
+        self._lines: Dict[int, List[nodes.NodeNG]] = {}  # Nodes of the tree by line
+
+    def handle_message(self, msg: Message) -> None:
+        self._findings.append(self._finding(msg))
+
+    def on_set_current_module(self, module: str, filepath: Optional[str]) -> None:
+        if module != self._module:
+            self._flush()
+            self._module = module
+
+    def display_messages(self, layout) -> None:
+        self._flush()
+        self._end()
+
+    def display_reports(self, layout) -> None:
+        """Reports and the score aren't part of the output."""
+
+    def _display(self, layout) -> None:
+        pass
+
+    def _node(self, msg: Message) -> Optional[nodes.NodeNG]:
+        if self._tree is None or self._tree.file != msg.abspath:
+            self._tree, self._lines = None, {}
+            try:
+                self._tree = MANAGER.ast_from_file(msg.abspath, msg.module, source=True)
+            except (AstroidBuildingError, SyntaxError):
+                return None
+            self._lines = nodes_by_line(self._tree)
+        return node_at(self._tree, msg.line, msg.column, self._lines)
+
+    def _finding(self, msg: Message) -> dict:
+        rule = RULES.get(msg.symbol)
+        node = self._node(msg)
+        return {
+            "type": msg.category,
+            "module": msg.module,
+            "obj": msg.obj,
+            "line": msg.line,
+            "column": msg.column,
+            "endLine": msg.end_line,
+            "endColumn": msg.end_column,
+            "path": msg.path,
+            "absolutePath": msg.abspath,
+            "symbol": msg.symbol,
+            "message": msg.msg,
+            "messageId": msg.msg_id,
+            "confidence": msg.confidence.name,
+            "function": enclosing_function(node) if node is not None else None,
+            "loopDepth": loop_depth(node) if node is not None else 0,
+            "estimatedIterations": estimated_iterations(node) if node is not None else 1,
+            "category": rule.category if rule else None,
+            "suggestedFix": rule.fix if rule else None,
+        }
+
+    def _flush(self) -> None:
+        if self._findings:
+            self._write(self._findings)
+            self.out.flush()
+        self._findings = []
+        self._tree, self._lines = None, {}
+
+    @abc.abstractmethod
+    def _write(self, findings: List[dict]) -> None:
+        """Write the findings of a file."""
+
+    def _end(self) -> None:
+        """Finish the output once every file is checked."""
+
+
+class JSONLinesReporter(_StreamingReporter):
+    """Write each finding as a JSON object on its own line."""
+
+    name = "perflint-jsonl"
+    extension = "jsonl"
+
+    def _write(self, findings: List[dict]) -> None:
+        for finding in findings:
+            self.writeln(json.dumps(finding))
+
+
+class SARIFReporter(_StreamingReporter):
+    """Write the findings as a SARIF log, with the perflint rules."""
+
+    name = "perflint-sarif"
+    extension = "sarif"
+
+    def __init__(self, output=None):
+        super().__init__(output)
+        self._started = False
+        self._results = 0
+        self._rule_index: Dict[str, int] = {}
+
+    def _start(self) -> None:
+        from perflint import CHECKERS, __version__  # pylint: disable=import-outside-toplevel
+
+        rules = []
+        for checker in CHECKERS:
+            for msgid, (template, symbol, description, *_) in checker.msgs.items():
+                self._rule_index[msgid] = len(rules)
+                rules.append(
+                    {
+                        "id": msgid,
+                        "name": symbol,
+                        "shortDescription": {"text": template},
+                        "fullDescription": {"text": description},
+                        "help": {"text": RULES[symbol].fix},
+                        "properties": {"category": RULES[symbol].category},
+                    }
+                )
+        tool = {
+            "driver": {
+                "name": "perflint",
+                "version": __version__,
+                "informationUri": "https://github.com/tonybaloney/perflint",
+                "rules": rules,
+            }
+        }
+        # The results are written as files are checked, between this header and _end()
+        self.out.write(
+            f'{{"$schema": "{SARIF_SCHEMA}", "version": "2.1.0", '
+            f'"runs": [{{"tool": {json.dumps(tool)}, "results": [\n'
+        )
+        self._started = True
+
+    def _result(self, finding: dict) -> dict:
+        result = {
+            "ruleId": finding["messageId"],
+            "level": SARIF_LEVELS.get(finding["type"], "note"),
+            "message": {"text": finding["message"]},
+            "locations": [
+                {
+                    "physicalLocation": {
+                        "artifactLocation": {"uri": finding["path"].replace("\\", "/")},
+                        "region": {
+                            "startLine": max(finding["line"], 1),
+                            "startColumn": finding["column"] + 1,
+                        },
+                    }
+                }
+            ],
+            "properties": {
+                key: finding[key]
+                for key in (
+                    "symbol",
+                    "function",
+                    "loopDepth",
+                    "estimatedIterations",
+                    "category",
+                    "suggestedFix",
+                )
+            },
+        }
+        region = result["locations"][0]["physicalLocation"]["region"]
+        if finding["endLine"] is not None:
+            region["endLine"] = finding["endLine"]
+            if finding["endColumn"] is not None:
+                region["endColumn"] = finding["endColumn"] + 1
+        if finding["messageId"] in self._rule_index:
+            result["ruleIndex"] = self._rule_index[finding["messageId"]]
+        if finding["function"] is not None:
+            result["locations"][0]["logicalLocations"] = [
+                {
+                    "fullyQualifiedName": f"{finding['module']}.{finding['function']}",
+                    "kind": "function",
+                }
+            ]
+        return result
+
+    def _write(self, findings: List[dict]) -> None:
+        if not self._started:
+            self._start()
+        for finding in findings:
+            separator = ",\n" if self._results else ""
+            self.out.write(separator + json.dumps(self._result(finding)))
+            self._results += 1
+
+    def _end(self) -> None:
+        if not self._started:
+            self._start()
+        self.out.write("\n]}]}\n")
+        self.out.flush()
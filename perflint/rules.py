@@ -0,0 +1,202 @@
+"""The cost category and suggested fix of each rule, reported by the structured reporters."""
+from typing import Dict, NamedTuple
+
+# Cost categories, what a finding costs when the code runs
+REPEATED_WORK = "repeated-work"  # The same value is computed again on every iteration or call
+LOOKUP = "lookup"  # Name, attribute or key lookups which could be done once
+CALL_OVERHEAD = "call-overhead"  # Calls, or argument packing, which could be avoided
+ALLOCATION = "allocation"  # Containers built only to be iterated, counted or thrown away
+COPY = "copy"  # Buffers copied instead of viewed
+ALGORITHMIC = "algorithmic"  # Work which grows faster than needed with the input
+IO = "io"  # System calls, queries and transactions
+SPECIALIZATION = "specialization"  # Code the specializing interpreter can't optimize
+CONCURRENCY = "concurrency"  # Threads, pools and locks which serialize the work
+IMPORT_TIME = "import-time"  # Work done when a module is imported
+DIAGNOSTIC = "diagnostic"  # About the run itself, not the code
+
+
+class Rule(NamedTuple):
+    category: str
+    fix: str
+
+
+RULES: Dict[str, Rule] = {
+    "unnecessary-list-cast": Rule(
+        ALLOCATION, "Iterate over the iterable directly instead of copying it to a list."
+    ),
+    "incorrect-dictionary-iterator": Rule(
+        ALLOCATION, "Iterate over .keys() or .values() instead of unpacking .items()."
+    ),
+    "dictionary-lookup-in-key-loop": Rule(
+        LOOKUP, "Iterate over .items() to get each key and value together."
+    ),
+    "dictionary-keys-membership": Rule(
+        ALLOCATION, "Test membership on the dictionary itself."
+    ),
+    "loop-invariant-statement": Rule(
+        REPEATED_WORK, "Compute the expression once before the loop."
+    ),
+    "loop-global-usage": Rule(
+        LOOKUP, "Copy the global name to a local variable before the loop."
+    ),
+    "loop-try-except-usage": Rule(
+        REPEATED_WORK, "Move the try..except block around the loop."
+    ),
+    "memoryview-over-bytes": Rule(
+        COPY, "Slice a memoryview() of the bytes instead of the bytes."
+    ),
+    "dotted-import-in-loop": Rule(
+        LOOKUP, "Import the name directly with from ... import."
+    ),
+    "nested-loop-join": Rule(
+        ALGORITHMIC, "Build a dictionary index of the inner iterable before the loop."
+    ),
+    "use-tuple-over-list": Rule(ALLOCATION, "Use a tuple literal instead of a list."),
+    "use-list-comprehension": Rule(
+        CALL_OVERHEAD, "Replace the loop and append() with a list comprehension."
+    ),
+    "use-list-copy": Rule(
+        CALL_OVERHEAD, "Copy the list with list() or .copy() instead of a loop."
+    ),
+    "use-dict-comprehension": Rule(
+        CALL_OVERHEAD, "Replace the loop with a dictionary comprehension."
+    ),
+    "inline-trivial-function": Rule(
+        CALL_OVERHEAD, "Inline the expression of the function in the loop."
+    ),
+    "unnecessary-dict-unpacking": Rule(
+        CALL_OVERHEAD, "Pass the keyword arguments directly."
+    ),
+    "kwargs-forwarding": Rule(
+        CALL_OVERHEAD, "Pass the arguments of the called function explicitly."
+    ),
+    "staticmethod-via-self-in-loop": Rule(
+        LOOKUP, "Call the static method through the class, or copy it to a local variable."
+    ),
+    "loop-constant-expression": Rule(
+        REPEATED_WORK, "Fold the expression into a local variable before the loop."
+    ),
+    "class-constant-via-self-in-loop": Rule(
+        LOOKUP, "Copy the class constant to a local variable before the loop."
+    ),
+    "loop-constant-container": Rule(
+        ALLOCATION, "Define the container once outside of the loop, as a tuple or frozenset."
+    ),
+    "loop-container-allocations": Rule(
+        ALLOCATION, "Reuse containers across iterations or use tuples of constants."
+    ),
+    "open-in-loop": Rule(IO, "Open the file once before the loop."),
+    "unbatched-write-in-loop": Rule(
+        IO, "Collect the data and write it once, or use a buffered file."
+    ),
+    "readlines-single-pass": Rule(
+        ALLOCATION, "Iterate over the file object instead of readlines()."
+    ),
+    "read-splitlines": Rule(
+        ALLOCATION, "Iterate over the file object instead of splitting its contents."
+    ),
+    "stat-in-loop": Rule(IO, "Use os.scandir() and the attributes of its entries."),
+    "list-comprehension-in-reduction": Rule(
+        ALLOCATION, "Pass a generator expression instead of a list comprehension."
+    ),
+    "join-generator": Rule(
+        ALLOCATION, "Pass a list comprehension to str.join() instead of a generator."
+    ),
+    "len-of-materialized-iterator": Rule(
+        ALLOCATION, "Count the items with sum(1 for _ in ...) instead of building a list."
+    ),
+    "sorted-for-min-max": Rule(
+        ALGORITHMIC, "Use min() or max() instead of sorting."
+    ),
+    "materialized-membership": Rule(
+        ALLOCATION, "Test membership on the iterable directly."
+    ),
+    "single-use-materialization": Rule(
+        ALLOCATION, "Iterate over the iterable directly instead of building a list."
+    ),
+    "consume-and-reslice": Rule(
+        COPY, "Advance an offset, or slice a memoryview() of the buffer."
+    ),
+    "bytes-copy-in-loop": Rule(
+        COPY, "Pass the memoryview or bytearray directly instead of copying it."
+    ),
+    "growing-bytes-buffer": Rule(
+        COPY, "Append to a bytearray and convert it once after the loop."
+    ),
+    "unpack-sliced-buffer": Rule(
+        COPY, "Unpack with an offset, such as struct.unpack_from(), instead of a slice."
+    ),
+    "memoize-recursive-function": Rule(
+        ALGORITHMIC, "Cache the results of the function with functools.lru_cache()."
+    ),
+    "repeated-pure-call": Rule(
+        REPEATED_WORK, "Store the result of the call in a local variable."
+    ),
+    "execute-in-loop": Rule(
+        IO, "Query all the rows at once, or use executemany()."
+    ),
+    "commit-in-loop": Rule(IO, "Commit once after the loop."),
+    "fetchone-loop": Rule(
+        IO, "Iterate over the cursor, or fetch rows with fetchmany()."
+    ),
+    "eager-log-formatting-in-loop": Rule(
+        REPEATED_WORK, "Pass the arguments to the logging call instead of formatting the message."
+    ),
+    "log-argument-call-in-loop": Rule(
+        REPEATED_WORK, "Compute the argument only when the level is enabled, or before the loop."
+    ),
+    "import-time-loop": Rule(
+        IMPORT_TIME, "Move the loop into a function called on first use."
+    ),
+    "import-time-io": Rule(
+        IMPORT_TIME, "Defer the I/O to a function called on first use."
+    ),
+    "import-time-regex-table": Rule(
+        IMPORT_TIME, "Compile the regular expressions lazily on first use."
+    ),
+    "import-time-comprehension": Rule(
+        IMPORT_TIME, "Build the collection lazily with functools.cache()."
+    ),
+    "heavy-import-single-use": Rule(
+        IMPORT_TIME, "Import the module inside the function which uses it."
+    ),
+    "slow-module-import": Rule(
+        IMPORT_TIME, "Defer the import, or reduce the work its module does when imported."
+    ),
+    "polymorphic-attribute": Rule(
+        SPECIALIZATION, "Assign values of a single type to the attribute."
+    ),
+    "class-mutated-at-runtime": Rule(
+        SPECIALIZATION, "Define the attributes in the class body instead of modifying it."
+    ),
+    "dynamic-attribute-hook": Rule(
+        SPECIALIZATION, "Define the attributes explicitly instead of computing them on lookup."
+    ),
+    "heterogeneous-loop": Rule(
+        SPECIALIZATION, "Iterate over items of a single type, or split the loop by type."
+    ),
+    "cpu-bound-thread-pool": Rule(
+        CONCURRENCY, "Run the function in a ProcessPoolExecutor instead."
+    ),
+    "pool-created-in-loop": Rule(
+        CONCURRENCY, "Create the pool once before the loop."
+    ),
+    "lock-in-loop": Rule(
+        CONCURRENCY, "Acquire the lock once around the loop, or batch the work done holding it."
+    ),
+    "result-after-submit": Rule(
+        CONCURRENCY, "Submit all the tasks, then wait for their results."
+    ),
+    "equality-dispatch-chain": Rule(
+        ALGORITHMIC, "Look the handler up in a dict dispatch table."
+    ),
+    "isinstance-dispatch-chain": Rule(
+        ALGORITHMIC, "Use functools.singledispatch or a dict keyed by type."
+    ),
+    "history-write-failed": Rule(
+        DIAGNOSTIC, "Check that the --history database can be written to."
+    ),
+    "inference-budget-exceeded": Rule(
+        DIAGNOSTIC, "Raise the inference budget, or exclude generated modules from the run."
+    ),
+}
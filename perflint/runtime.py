@@ -0,0 +1,292 @@
+"""Confirm static findings by running the code they were found in.
+
+Static analysis can't tell whether a loop runs 3 times or 3 million times. This
+harness lints a set of files, runs an entry point or a pytest selection with a
+line monitor attached to those files, and annotates each finding with the
+observed number of iterations of its loop and the time spent in it. Findings in
+loops which never ran hot are dropped::
+
+    python -m perflint.runtime --entry mypkg.cli:main mypkg/
+    python -m perflint.runtime --pytest "tests/test_parser.py -k large" mypkg/
+
+Lines are counted with ``sys.monitoring`` on Python 3.12+, and ``sys.settrace``
+on older versions, which is considerably slower. Only lines of the linted files
+are counted.
+"""
+import argparse
+import importlib
+import json
+import os
+import runpy
+import shlex
+import sys
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from astroid import MANAGER
+from astroid.exceptions import AstroidBuildingError
+from pylint.lint import Run as PylintRun
+from pylint.message import Message
+from pylint.reporters import CollectingReporter
+
+from perflint import CHECKERS
+from perflint.loop_context import LOOP_NODES, enclosing_loop
+from perflint.utils import node_at
+
+DEFAULT_MIN_ITERATIONS = 100
+
+Line = Tuple[str, int]  # File and line number
+
+
+class LineMonitor:
+    """Count how many times each line of a set of files runs, and the time spent on it.
+
+    The time between two line events is attributed to the first line, so the
+    time of a line includes the calls it makes into files which aren't monitored.
+    """
+
+    def __init__(self, files: Iterable[str]):
+        self.files = {os.path.realpath(path) for path in files}
+        self.hits: Dict[Line, int] = {}
+        self.times: Dict[Line, float] = {}
+        self._tracked: Dict[str, bool] = {}
+        self._last: Optional[Line] = None
+        self._last_time = 0.0
+        self._previous_trace = None
+
+    def _is_tracked(self, filename: str) -> bool:
+        if filename not in self._tracked:
+            self._tracked[filename] = os.path.realpath(filename) in self.files
+        return self._tracked[filename]
+
+    def _account(self, now: float) -> None:
+        """Attribute the time since the last line event to that line."""
+        if self._last is not None:
+            self.times[self._last] = self.times.get(self._last, 0.0) + now - self._last_time
+
+    def _line(self, filename: str, lineno: int) -> None:
+        now = time.perf_counter()
+        self._account(now)
+        line = (os.path.realpath(filename), lineno)
+        self.hits[line] = self.hits.get(line, 0) + 1
+        self._last, self._last_time = line, now
+
+    def _monitor_line(self, code, lineno: int):
+        if not self._is_tracked(code.co_filename):
+            return sys.monitoring.DISABLE  # Don't call back for this line again
+        self._line(code.co_filename, lineno)
+        return None
+
+    def _trace(self, frame, event, arg):
+        if not self._is_tracked(frame.f_code.co_filename):
+            return None
+        return self._trace_lines
+
+    def _trace_lines(self, frame, event, arg):
+        if event == "line":
+            self._line(frame.f_code.co_filename, frame.f_lineno)
+        return self._trace_lines
+
+    def start(self) -> None:
+        if sys.version_info >= (3, 12):
+            monitoring = sys.monitoring
+            monitoring.use_tool_id(monitoring.PROFILER_ID, "perflint")
+            monitoring.register_callback(
+                monitoring.PROFILER_ID, monitoring.events.LINE, self._monitor_line
+            )
+            monitoring.set_events(monitoring.PROFILER_ID, monitoring.events.LINE)
+        else:
+            self._previous_trace = sys.gettrace()
+            sys.settrace(self._trace)
+
+    def stop(self) -> None:
+        if sys.version_info >= (3, 12):
+            monitoring = sys.monitoring
+            monitoring.set_events(monitoring.PROFILER_ID, monitoring.events.NO_EVENTS)
+            monitoring.register_callback(
+                monitoring.PROFILER_ID, monitoring.events.LINE, None
+            )
+            monitoring.free_tool_id(monitoring.PROFILER_ID)
+        else:
+            sys.settrace(self._previous_trace)
+        self._account(time.perf_counter())
+        self._last = None
+
+    def __enter__(self) -> "LineMonitor":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+class Finding:
+    """A static finding, annotated with what was observed when the code ran."""
+
+    def __init__(self, message: Message):
+        self.message = message
+        self.loop_lines: Optional[Tuple[int, int]] = None
+        self.iterations: Optional[int] = None  # Of the loop the finding is in
+        self.hits = 0  # Of the line the finding is on
+        self.seconds = 0.0  # Spent in the loop, or on the line
+
+    def __str__(self) -> str:
+        message = self.message
+        if self.iterations is not None:
+            observed = f"loop ran {self.iterations:,} iterations"
+        else:
+            observed = f"line ran {self.hits:,} times"
+        return (
+            f"{message.path}:{message.line}:{message.column}: {message.msg_id}: "
+            f"{message.msg} ({message.symbol}) [{observed}, {self.seconds * 1000:.1f} ms]"
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "path": self.message.path,
+            "line": self.message.line,
+            "column": self.message.column,
+            "message-id": self.message.msg_id,
+            "symbol": self.message.symbol,
+            "message": self.message.msg,
+            "iterations": self.iterations,
+            "hits": self.hits,
+            "seconds": self.seconds,
+        }
+
+
+def lint(paths: Sequence[str], options: Sequence[str] = ()) -> List[Message]:
+    """Lint files with the perflint checkers, and collect the messages."""
+    rules = [msgid for checker in CHECKERS for msgid in checker.msgs]
+    reporter = CollectingReporter()
+    PylintRun(
+        [
+            "--load-plugins=perflint",
+            "--disable=all",
+            f"--enable={','.join(rules)}",
+            *options,
+            *paths,
+        ],
+        reporter=reporter,
+        exit=False,
+    )
+    return reporter.messages
+
+
+def loop_lines(path: str, line: int, column: int) -> Optional[Tuple[int, int]]:
+    """Get the first line of the body and the last line of the loop a message is in."""
+    try:
+        module = MANAGER.ast_from_file(path, source=True)
+    except (AstroidBuildingError, SyntaxError):
+        return None
+    node = node_at(module, line, column)
+    if node is None:
+        return None
+    if isinstance(node, LOOP_NODES):
+        loop = node
+    else:
+        context = enclosing_loop(node)
+        if context is None:
+            return None
+        loop = context.node
+    return loop.body[0].fromlineno, loop.tolineno
+
+
+def annotate(
+    messages: Iterable[Message], monitor: LineMonitor, min_iterations: int
+) -> List[Finding]:
+    """Annotate messages with the lines counted by a monitor.
+
+    Messages in a loop which ran fewer than ``min_iterations`` times are dropped.
+    """
+    findings = []
+    for message in messages:
+        path = os.path.realpath(message.abspath)
+        finding = Finding(message)
+        finding.hits = monitor.hits.get((path, message.line), 0)
+        finding.loop_lines = loop_lines(message.abspath, message.line, message.column)
+        if finding.loop_lines is not None:
+            body, end = finding.loop_lines
+            # The first line of the body runs once per iteration
+            finding.iterations = monitor.hits.get((path, body), 0)
+            if finding.iterations < min_iterations:
+                continue
+            finding.seconds = sum(
+                monitor.times.get((path, lineno), 0.0) for lineno in range(body, end + 1)
+            )
+        else:
+            finding.seconds = monitor.times.get((path, message.line), 0.0)
+        findings.append(finding)
+    return findings
+
+
+def run_entry_point(entry: str) -> None:
+    """Run a script path, ``module`` or ``module:function``."""
+    if entry.endswith(".py"):
+        runpy.run_path(entry, run_name="__main__")
+        return
+    module, _, function = entry.partition(":")
+    if function:
+        getattr(importlib.import_module(module), function)()
+    else:
+        runpy.run_module(module, run_name="__main__", alter_sys=True)
+
+
+def run_pytest(args: str) -> None:
+    import pytest  # pylint: disable=import-outside-toplevel
+
+    pytest.main(shlex.split(args))
+
+
+def confirm(
+    paths: Sequence[str],
+    entry: Optional[str] = None,
+    pytest_args: Optional[str] = None,
+    min_iterations: int = DEFAULT_MIN_ITERATIONS,
+    options: Sequence[str] = (),
+) -> List[Finding]:
+    """Lint files, run an entry point or pytest, and keep the findings which ran hot."""
+    messages = lint(paths, options)
+    files = {message.abspath for message in messages}
+    with LineMonitor(files) as monitor:
+        try:
+            if entry is not None:
+                run_entry_point(entry)
+            if pytest_args is not None:
+                run_pytest(pytest_args)
+        except SystemExit:
+            pass
+    return annotate(messages, monitor, min_iterations)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m perflint.runtime",
+        description="Run code and keep the perflint findings in loops which ran hot.",
+    )
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument(
+        "--entry", help="Script path, module or module:function to run."
+    )
+    target.add_argument("--pytest", help="Arguments to run pytest with.")
+    parser.add_argument(
+        "--min-iterations",
+        type=int,
+        default=DEFAULT_MIN_ITERATIONS,
+        help="Drop findings in loops which ran fewer times than this.",
+    )
+    parser.add_argument("--json", action="store_true", help="Print findings as JSON.")
+    parser.add_argument("paths", nargs="+", help="Files or packages to lint.")
+    args = parser.parse_args(argv)
+
+    findings = confirm(args.paths, args.entry, args.pytest, args.min_iterations)
+    if args.json:
+        print(json.dumps([finding.to_dict() for finding in findings], indent=2))
+    else:
+        for finding in findings:
+            print(finding)
+    return 1 if findings else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,352 @@
+"""Split a lint run across several processes or machines, and merge the results.
+
+Each shard lints the files assigned to it and writes its messages and
+statistics to a JSON file instead of reporting them::
+
+    perflint --shard 1/3 src/  # On the first machine
+    perflint --shard 2/3 src/  # On the second machine
+    perflint --shard 3/3 src/  # On the third machine
+    perflint merge perflint-shard-*-of-3.json
+
+Every shard expands the same arguments into the same files, and assigns them
+to shards the same way, so shards don't need to communicate. Files are assigned
+by their number of lines, largest first, to the shard with the fewest lines so
+far, and files of the same length are ordered by a hash of their path. Lines
+are counted the same way whatever the line endings of a checkout. ``merge``
+reports the messages in the order a single run would, and exits with the same
+code.
+
+``ShardLinter`` overrides private methods of ``PyLinter``, pylint doesn't have a
+public way to filter the expanded files of a run or to tell parsing from
+checking. ``--shard`` fails with a usage error when the installed pylint
+doesn't have them.
+"""
+import argparse
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sys
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from pylint import __version__ as pylint_version
+from pylint.interfaces import CONFIDENCE_MAP
+from pylint.lint import PyLinter
+from pylint.lint import Run as PylintRun
+from pylint.message import Message
+from pylint.reporters import CollectingReporter, JSONReporter
+from pylint.reporters.text import ColorizedTextReporter, TextReporter
+from pylint.reporters.ureports.nodes import EvaluationSection, Section
+from pylint.typing import FileItem, MessageLocationTuple
+
+SHARD_FORMAT_VERSION = 1
+USAGE_ERROR = 32  # The exit code of pylint for usage errors
+# Phases of a run, messages are reported in this order
+EXPAND, PARSE, CHECK = range(3)
+
+# Methods of PyLinter overridden by ShardLinter, and their parameters
+OVERRIDDEN_METHODS = {
+    "_iterate_file_descrs": ["self", "files_or_modules"],
+    "_get_asts": ["self", "fileitems", "data"],
+    "_load_reporters": ["self", "reporter_names"],
+}
+
+Shard = Tuple[int, int]  # Number of the shard from 1, and number of shards
+Position = Tuple[int, int]  # Phase of the run and index of the file a message is for
+
+reporters = {
+    "text": TextReporter,
+    "colorized": ColorizedTextReporter,
+    "json": JSONReporter,
+}
+categories = ("fatal", "error", "warning", "refactor", "convention", "info")
+
+
+def parse_shard(value: str) -> Shard:
+    """Parse a shard given as ``i/n``."""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected i/n, got {value!r}") from None
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"shard {index} is not between 1 and {count}")
+    return index, count
+
+
+def default_output(shard: Shard) -> str:
+    return "perflint-shard-{0}-of-{1}.json".format(*shard)
+
+
+def file_cost(path: str) -> int:
+    """Estimate the cost of linting a file from its number of lines."""
+    try:
+        with open(path, "rb") as file:
+            return len(file.read().splitlines())
+    except OSError:
+        return 0
+
+
+def stable_hash(path: str) -> str:
+    """Hash a path the same way on every machine which checked out the same tree."""
+    relative = os.path.relpath(path).replace(os.sep, "/")
+    return hashlib.sha1(relative.encode("utf-8")).hexdigest()
+
+
+def assign_shards(paths: Sequence[str], count: int) -> List[int]:
+    """Assign each file to a shard, numbered from 0, balancing their total cost."""
+    costs = [file_cost(path) for path in paths]
+    order = sorted(
+        range(len(paths)), key=lambda i: (-costs[i], stable_hash(paths[i]))
+    )
+    loads = [0] * count
+    assignment = [0] * len(paths)
+    for i in order:
+        shard = loads.index(min(loads))
+        assignment[i] = shard
+        loads[shard] += costs[i]
+    return assignment
+
+
+class ShardError(Exception):
+    pass
+
+
+def check_linter() -> None:
+    """Check that the installed pylint has the methods ``ShardLinter`` overrides."""
+    for name, parameters in OVERRIDDEN_METHODS.items():
+        method = getattr(PyLinter, name, None)
+        if method is None:
+            raise ShardError(f"pylint {pylint_version} has no PyLinter.{name}()")
+        found = list(inspect.signature(method).parameters)
+        if found != parameters:
+            raise ShardError(
+                f"PyLinter.{name}() of pylint {pylint_version} takes ({', '.join(found)}), "
+                f"expected ({', '.join(parameters)})"
+            )
+
+
+class ShardLinter(PyLinter):
+    """A linter which only checks the files assigned to one shard."""
+
+    def __init__(self, *args, shard: Shard, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.shard = shard
+        self.shard_files: Optional[List[str]] = None  # All the files, of every shard
+        self.shard_phase = CHECK
+
+    def _iterate_file_descrs(self, files_or_modules: Sequence[str]) -> Iterator[FileItem]:
+        items = list(super()._iterate_file_descrs(files_or_modules))
+        self.shard_files = [item.filepath for item in items]
+        index, count = self.shard
+        assignment = assign_shards(self.shard_files, count)
+        for item, shard in zip(items, assignment):
+            if shard == index - 1:
+                yield item
+
+    def _get_asts(self, *args, **kwargs):
+        # Every file is parsed before any is checked, syntax errors are reported first
+        self.shard_phase = PARSE
+        try:
+            return super()._get_asts(*args, **kwargs)
+        finally:
+            self.shard_phase = CHECK
+
+    def _load_reporters(self, reporter_names: str) -> None:
+        """Keep the shard reporter, the output format is used when merging."""
+
+
+class ShardReporter(CollectingReporter):
+    """Collect messages with the phase of the run and the index of the file they were emitted in."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.positions: List[Position] = []
+        self._file_index: Dict[str, int] = {}
+
+    def handle_message(self, msg: Message) -> None:
+        super().handle_message(msg)
+        files = self.linter.shard_files
+        if files is None:
+            self.positions.append((EXPAND, -1))
+            return
+        if not self._file_index:
+            for index, path in enumerate(files):
+                self._file_index[path] = index
+                self._file_index[os.path.abspath(path)] = index
+        file = self._file_index.get(msg.abspath, len(files))
+        self.positions.append((self.linter.shard_phase, file))
+
+
+class ShardRun(PylintRun):
+    def __init__(self, args: Sequence[str], shard: Shard, reporter: ShardReporter):
+        self.LinterClass = functools.partial(ShardLinter, shard=shard)
+        super().__init__(args, reporter=reporter, exit=False)
+
+
+def _message_to_dict(message: Message, position: Position) -> dict:
+    return {
+        "phase": position[0],
+        "file": position[1],
+        "msg_id": message.msg_id,
+        "symbol": message.symbol,
+        "msg": message.msg,
+        "confidence": message.confidence.name,
+        "abspath": message.abspath,
+        "path": message.path,
+        "module": message.module,
+        "obj": message.obj,
+        "line": message.line,
+        "column": message.column,
+        "end_line": message.end_line,
+        "end_column": message.end_column,
+    }
+
+
+def _message_from_dict(data: dict) -> Message:
+    return Message(
+        data["msg_id"],
+        data["symbol"],
+        MessageLocationTuple(
+            data["abspath"],
+            data["path"],
+            data["module"],
+            data["obj"],
+            data["line"],
+            data["column"],
+            data["end_line"],
+            data["end_column"],
+        ),
+        data["msg"],
+        CONFIDENCE_MAP.get(data["confidence"]),
+    )
+
+
+def run_shard(args: Sequence[str], shard: Shard) -> dict:
+    """Lint the files of one shard, and get its result as a JSON serializable dict."""
+    check_linter()
+    reporter = ShardReporter()
+    run = ShardRun(args, shard, reporter)
+    linter = run.linter
+    messages = list(zip(reporter.positions, reporter.messages))
+    if shard[0] != 1:
+        # Every shard expands the arguments, only keep the errors doing so once
+        messages = [item for item in messages if item[0][0] != EXPAND]
+    return {
+        "version": SHARD_FORMAT_VERSION,
+        "shard": list(shard),
+        "files": linter.shard_files or [],
+        "messages": [_message_to_dict(message, position) for position, message in messages],
+        "msg_status": linter.msg_status,
+        "fail_on_issues": linter.any_fail_on_issues(),
+        "stats": {
+            "statement": linter.stats.statement,
+            **{category: getattr(linter.stats, category) for category in categories},
+        },
+        "config": {
+            "evaluation": linter.config.evaluation,
+            "score": linter.config.score,
+            "fail_under": linter.config.fail_under,
+            "exit_zero": linter.config.exit_zero,
+        },
+    }
+
+
+class MergeError(Exception):
+    pass
+
+
+def load_shards(paths: Sequence[str]) -> List[dict]:
+    """Load shard result files, checking they are every shard of the same run."""
+    shards = []
+    for path in paths:
+        try:
+            with open(path, encoding="utf-8") as file:
+                shards.append(json.load(file))
+        except (OSError, ValueError) as ex:
+            raise MergeError(f"Can't read shard file {path}: {ex}") from ex
+    if not shards:
+        raise MergeError("No shard files given")
+    for shard in shards:
+        if shard.get("version") != SHARD_FORMAT_VERSION:
+            raise MergeError(f"Unsupported shard file version {shard.get('version')}")
+    count = shards[0]["shard"][1]
+    numbers = sorted(shard["shard"][0] for shard in shards)
+    if any(shard["shard"][1] != count for shard in shards) or numbers != list(
+        range(1, count + 1)
+    ):
+        found = ", ".join("{0}/{1}".format(*shard["shard"]) for shard in shards)
+        raise MergeError(f"Expected every shard of {count} exactly once, got {found}")
+    if any(shard["files"] != shards[0]["files"] for shard in shards):
+        raise MergeError("Shards were run on different files")
+    return sorted(shards, key=lambda shard: shard["shard"][0])
+
+
+def merged_messages(shards: Sequence[dict]) -> List[Message]:
+    """Order the messages of all shards like a single run, by phase, file, then as emitted."""
+    ordered = []
+    for number, shard in enumerate(shards):
+        for emitted, data in enumerate(shard["messages"]):
+            ordered.append(((data["phase"], data["file"], number, emitted), data))
+    ordered.sort(key=lambda item: item[0])
+    return [_message_from_dict(data) for _, data in ordered]
+
+
+def evaluate(shards: Sequence[dict]) -> Tuple[Optional[float], str]:
+    """Compute the score of the merged run, and the message reporting it."""
+    stats = {
+        name: sum(shard["stats"][name] for shard in shards)
+        for name in ("statement", *categories)
+    }
+    if stats["statement"] == 0:
+        return None, ""
+    try:
+        note = eval(shards[0]["config"]["evaluation"], {}, stats)  # pylint: disable=eval-used
+    except Exception as ex:  # pylint: disable=broad-except
+        return None, f"An exception occurred while rating: {ex}"
+    return note, f"Your code has been rated at {note:.2f}/10"
+
+
+def exit_code(shards: Sequence[dict], score: Optional[float]) -> int:
+    """Get the exit code pylint would have exited with after a single run."""
+    config = shards[0]["config"]
+    msg_status = 0
+    for shard in shards:
+        msg_status |= shard["msg_status"]
+    if config["exit_zero"]:
+        return 0
+    if any(shard["fail_on_issues"] for shard in shards):
+        return msg_status or 1
+    if score is not None:
+        return 0 if score >= config["fail_under"] else msg_status or 1
+    return msg_status
+
+
+def merge(paths: Sequence[str], output_format: str = "text", out=None) -> int:
+    """Report the messages of shard result files, and get the exit code of the run."""
+    shards = load_shards(paths)
+    reporter = reporters[output_format](out or sys.stdout)
+    for message in merged_messages(shards):
+        reporter.handle_message(message)
+    reporter.display_messages(Section())
+    score, evaluation = evaluate(shards)
+    if evaluation and shards[0]["config"]["score"]:
+        reporter.display_reports(EvaluationSection(evaluation))
+    return exit_code(shards, score)
+
+
+def merge_main(argv: Sequence[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="perflint merge",
+        description="Combine the result files of perflint --shard runs into one report.",
+    )
+    parser.add_argument(
+        "--output-format", choices=sorted(reporters), default="text"
+    )
+    parser.add_argument("files", nargs="+", help="Shard result files.")
+    args = parser.parse_args(argv)
+    try:
+        return merge(args.files, args.output_format)
+    except MergeError as ex:
+        print(f"perflint merge: {ex}", file=sys.stderr)
+        return USAGE_ERROR
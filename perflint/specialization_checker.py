@@ -0,0 +1,188 @@
+from typing import List, Optional, Set
+from astroid import bases, nodes
+from pylint.checkers import BaseChecker
+from pylint.checkers import utils as checker_utils
+
+from perflint.cache import ModuleCache
+from perflint.inference import safe_infer
+from perflint.loop_context import get_loop_context, in_loop, is_builtin_call
+from perflint.utils import self_attribute_assignments
+
+# The specializing adaptive interpreter was added in Python 3.11 (PEP 659)
+MIN_PY_VERSION = (3, 11)
+
+# Classes instantiated in a loop, for the most recently checked modules.
+_hot_classes: "ModuleCache[Set[nodes.ClassDef]]" = ModuleCache()
+
+
+def hot_classes(module: nodes.Module) -> Set[nodes.ClassDef]:
+    """Get the classes which are instantiated in a loop of a module."""
+    classes = _hot_classes.get(module)
+    if classes is None:
+        classes = set()
+        for call in module.nodes_of_class(nodes.Call):
+            if not in_loop(call):
+                continue
+            inferred = safe_infer(call.func)
+            if isinstance(inferred, nodes.ClassDef):
+                classes.add(inferred)
+        _hot_classes[module] = classes
+    return classes
+
+
+def _is_hot(node: nodes.NodeNG) -> bool:
+    """Check if a node is in a loop, or in a method of a class instantiated in a loop."""
+    if in_loop(node):
+        return True
+    klass = node.frame().parent if isinstance(node.frame(), nodes.FunctionDef) else None
+    return isinstance(klass, nodes.ClassDef) and klass in hot_classes(node.root())
+
+
+def value_type(node: nodes.NodeNG) -> Optional[str]:
+    """Get the name of the type of an expression, if it can be inferred."""
+    inferred = safe_infer(node)
+    if isinstance(
+        inferred,
+        (nodes.Const, bases.Instance, nodes.List, nodes.Tuple, nodes.Set, nodes.Dict),
+    ):
+        return inferred.pytype().split(".")[-1]
+    return None
+
+
+def _attribute_assignments(node: nodes.AssignAttr) -> List[nodes.NodeNG]:
+    """Get the other assignments to the same attribute of the same object."""
+    assignments = self_attribute_assignments(node)
+    if assignments:
+        return assignments
+    target = node.expr.as_string()
+    return [
+        other
+        for other in node.frame().nodes_of_class(nodes.AssignAttr)
+        if other.attrname == node.attrname and other.expr.as_string() == target
+    ]
+
+
+class SpecializationChecker(BaseChecker):
+    """
+    Check for code which defeats the specializing adaptive interpreter of Python 3.11+.
+
+    Only enabled when ``py-version`` is 3.11 or newer.
+    """
+
+    name = "specialization-checker"
+    priority = -1
+    msgs = {
+        "W9501": (
+            'Attribute "%s" is assigned both %s and %s, operations on it can\'t stay specialized to one type.',
+            "polymorphic-attribute",
+            "The adaptive interpreter specializes instructions for the types it sees, values which change type cause them to deoptimize.",
+        ),
+        "W9502": (
+            'Class "%s" is modified at runtime, which invalidates the specialized attribute lookups on its instances.',
+            "class-mutated-at-runtime",
+            "Specialized attribute lookups are guarded by a version of the class, which changes every time the class is modified.",
+        ),
+        "W9503": (
+            'Class "%s" is instantiated in a loop and defines %s, which prevents its attribute lookups from being specialized.',
+            "dynamic-attribute-hook",
+            "Attribute lookups on classes with __getattribute__ or __getattr__ call Python code and can't use the specialized lookups.",
+        ),
+        "W9504": (
+            "Loop iterates over items of different types (%s), instructions using them can't stay specialized.",
+            "heterogeneous-loop",
+            "Instructions specialized for the type of the first items deoptimize when the type changes.",
+        ),
+    }
+
+    def __init__(self, linter=None):
+        super().__init__(linter)
+        self._enabled = True
+
+    def open(self) -> None:
+        self._enabled = self.linter.config.py_version >= MIN_PY_VERSION
+
+    @checker_utils.only_required_for_messages(
+        "polymorphic-attribute", "class-mutated-at-runtime"
+    )
+    def visit_assignattr(self, node: nodes.AssignAttr) -> None:
+        if not self._enabled or not _is_hot(node):
+            return
+        if not isinstance(node.frame(), nodes.FunctionDef):
+            return
+        if isinstance(safe_infer(node.expr), nodes.ClassDef):
+            self.add_message(
+                "class-mutated-at-runtime", node=node, args=(node.expr.as_string(),)
+            )
+            return
+        if not isinstance(node.parent, (nodes.Assign, nodes.AnnAssign)):
+            return
+        own_type = value_type(node.parent.value)
+        if own_type in (None, "NoneType"):
+            return  # Optional attributes are commonly initialized to None
+        for other in _attribute_assignments(node):
+            if other is node or not isinstance(
+                other.parent, (nodes.Assign, nodes.AnnAssign)
+            ):
+                continue
+            other_type = value_type(other.parent.value)
+            if other_type not in (None, "NoneType", own_type):
+                self.add_message(
+                    "polymorphic-attribute",
+                    node=node,
+                    args=(node.as_string(), other_type, own_type),
+                )
+                return
+
+    @checker_utils.only_required_for_messages("class-mutated-at-runtime")
+    def visit_call(self, node: nodes.Call) -> None:
+        if not self._enabled or not node.args:
+            return
+        if not is_builtin_call(node, "setattr", "delattr") or not _is_hot(node):
+            return
+        klass = safe_infer(node.args[0])
+        if isinstance(klass, nodes.ClassDef):
+            self.add_message(
+                "class-mutated-at-runtime", node=node, args=(klass.name,)
+            )
+
+    @checker_utils.only_required_for_messages("dynamic-attribute-hook")
+    def visit_classdef(self, node: nodes.ClassDef) -> None:
+        if not self._enabled or node not in hot_classes(node.root()):
+            return
+        for name in ("__getattribute__", "__getattr__"):
+            if name in node.locals and isinstance(node.locals[name][0], nodes.FunctionDef):
+                self.add_message(
+                    "dynamic-attribute-hook",
+                    node=node.locals[name][0],
+                    args=(node.name, name),
+                )
+                return
+
+    @checker_utils.only_required_for_messages("heterogeneous-loop")
+    def visit_for(self, node: nodes.For) -> None:
+        if not self._enabled or not isinstance(node.target, nodes.AssignName):
+            return
+        iterable = safe_infer(node.iter)
+        if not isinstance(iterable, (nodes.List, nodes.Tuple, nodes.Set)):
+            return
+        types = []
+        for element in iterable.elts:
+            element_type = value_type(element)
+            if element_type is None:
+                return
+            if element_type not in types:
+                types.append(element_type)
+        if len(types) < 2 or not self._operates_on(node):
+            return
+        self.add_message("heterogeneous-loop", node=node, args=(", ".join(types),))
+
+    def _operates_on(self, node: nodes.For) -> bool:
+        """Check if the loop body uses the target in operations which are specialized."""
+        for child in get_loop_context(node).evaluated:
+            if not isinstance(child, nodes.Name) or child.name != node.target.name:
+                continue
+            if isinstance(child.parent, (nodes.BinOp, nodes.Compare, nodes.Subscript)):
+                return True
+            if isinstance(child.parent, nodes.Attribute) and child.parent.expr is child:
+                return True
+        return False
@@ -0,0 +1,111 @@
+"""Helpers for navigating the AST, shared by the checkers."""
+from typing import Dict, Iterable, List, Optional, Union
+from astroid import nodes
+
+
+def get_children_recursive(node: nodes.NodeNG):
+    """Get children of a node."""
+    for child in node.get_children():
+        yield child
+        yield from get_children_recursive(child)
+
+
+def root_name(node: nodes.NodeNG) -> Union[None, str]:
+    """Get the name an attribute, subscript or name expression is rooted at."""
+    while isinstance(node, (nodes.Attribute, nodes.Subscript)):
+        node = node.expr if isinstance(node, nodes.Attribute) else node.value
+    if isinstance(node, nodes.Name):
+        return node.name
+    return None
+
+
+def iterated_once(target: nodes.AssignName) -> bool:
+    """Check if an assigned name is only ever used once, as the iterable of a for loop."""
+    uses = [
+        name
+        for name in target.frame().nodes_of_class(nodes.Name)
+        if name.name == target.name
+    ]
+    return (
+        len(uses) == 1
+        and isinstance(uses[0].parent, nodes.For)
+        and uses[0].parent.iter is uses[0]
+    )
+
+
+def assigned_value(assigned: nodes.NodeNG) -> Optional[nodes.NodeNG]:
+    """Get the expression assigned by ``x = value`` or ``with value as x``."""
+    if isinstance(assigned.parent, (nodes.Assign, nodes.AnnAssign)):
+        return assigned.parent.value
+    if isinstance(assigned.parent, nodes.With):
+        for item, var in assigned.parent.items:
+            if var is assigned:
+                return item
+    return None
+
+
+def self_attribute_assignments(node: nodes.Attribute) -> List[nodes.NodeNG]:
+    """Get the assignments to ``self.<attr>`` in the class of the enclosing method."""
+    if not isinstance(node.expr, nodes.Name) or node.expr.name != "self":
+        return []
+    frame = node.frame()
+    if not isinstance(frame, nodes.FunctionDef) or not isinstance(
+        frame.parent, nodes.ClassDef
+    ):
+        return []
+    return frame.parent.instance_attrs.get(node.attrname, [])
+
+
+def local_type(name: nodes.NodeNG) -> Union[None, nodes.Name]:
+    if not isinstance(name, nodes.Name):
+        return
+
+    if name.name in name.frame().locals:
+        vals = name.frame().locals[name.name]
+        if len(vals) > 0:
+            assigned = vals[0].assign_type()
+            if isinstance(assigned, nodes.Arguments):
+                for annotation, arg in zip(assigned.annotations, assigned.arguments):
+                    if arg.name == name.name:
+                        if isinstance(annotation, nodes.Name):
+                            return annotation
+                        elif isinstance(annotation, nodes.Subscript) and isinstance(
+                            annotation.value, nodes.Name
+                        ):
+                            return annotation.value
+                        else:
+                            return None
+    else:
+        return
+
+
+def nodes_by_line(module: nodes.Module) -> Dict[int, List[nodes.NodeNG]]:
+    """Index the nodes of a module by their line, outermost first."""
+    lines: Dict[int, List[nodes.NodeNG]] = {}
+    for node in module.nodes_of_class(nodes.NodeNG):
+        lines.setdefault(node.lineno, []).append(node)
+    return lines
+
+
+def node_at(
+    module: nodes.Module,
+    line: int,
+    column: int,
+    lines: Optional[Dict[int, List[nodes.NodeNG]]] = None,
+) -> Optional[nodes.NodeNG]:
+    """Find the outermost node a message at a line and column was reported on.
+
+    ``lines``, from ``nodes_by_line``, saves walking the module for each message.
+    """
+    candidates: Iterable[nodes.NodeNG] = (
+        lines.get(line, ())
+        if lines is not None
+        else (node for node in module.nodes_of_class(nodes.NodeNG) if node.lineno == line)
+    )
+    first = None
+    for node in candidates:
+        if node.col_offset == column:
+            return node
+        if first is None:
+            first = node
+    return first
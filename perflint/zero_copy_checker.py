@@ -0,0 +1,300 @@
+from typing import Iterator, List, Optional, Tuple
+from astroid import bases, nodes
+from pylint.checkers import BaseChecker
+from pylint.checkers import utils as checker_utils
+
+from perflint.inference import safe_infer
+from perflint.io_checker import call_qname, opening_call, is_unbuffered_or_binary
+from perflint.loop_context import in_loop, is_builtin_call
+from perflint.utils import local_type
+
+
+buffer_types = ("bytes", "bytearray", "memoryview")
+socket_classes = ("socket.socket", "_socket.socket")
+
+
+def _is_socket_class(node: Optional[nodes.NodeNG]) -> bool:
+    return isinstance(node, nodes.ClassDef) and any(
+        cls.qname() in socket_classes for cls in (node, *node.ancestors())
+    )
+
+
+def _names_socket_class(node: nodes.NodeNG) -> bool:
+    """Check if an expression names a socket class, e.g. ``socket.socket``."""
+    if _is_socket_class(safe_infer(node)):
+        return True
+    # socket.socket is ambiguous between the C and Python classes, resolve it by name
+    if isinstance(node, nodes.Attribute):
+        module = safe_infer(node.expr)
+        return (
+            isinstance(module, nodes.Module)
+            and f"{module.name}.{node.attrname}" in socket_classes
+        )
+    if isinstance(node, nodes.Name):
+        _, assignments = node.lookup(node.name)
+        return (
+            len(assignments) == 1
+            and isinstance(assignments[0], nodes.ImportFrom)
+            and any(
+                f"{assignments[0].modname}.{name}" in socket_classes
+                for name, alias in assignments[0].names
+                if (alias or name) == node.name
+            )
+        )
+    return False
+
+
+def _parameter_annotation(assigned: nodes.AssignName) -> Optional[nodes.NodeNG]:
+    arguments = assigned.parent
+    for args, annotations in (
+        (arguments.posonlyargs, arguments.posonlyargs_annotations),
+        (arguments.args or [], arguments.annotations),
+        (arguments.kwonlyargs, arguments.kwonlyargs_annotations),
+    ):
+        for arg, annotation in zip(args, annotations):
+            if arg is assigned:
+                return annotation
+    return None
+
+
+def is_socket(node: nodes.NodeNG) -> bool:
+    """Check if an expression is a socket, from its value, annotation or the class it was created from.
+
+    ``recv()`` of other objects, such as multiprocessing connections, returns anything.
+    """
+    inferred = safe_infer(node)
+    if isinstance(inferred, bases.Instance):
+        return _is_socket_class(inferred._proxied)
+    if not isinstance(node, nodes.Name):
+        return False
+    _, assignments = node.lookup(node.name)
+    if len(assignments) != 1 or not isinstance(assignments[0], nodes.AssignName):
+        return False
+    assigned = assignments[0]
+    if isinstance(assigned.parent, nodes.Arguments):
+        annotation = _parameter_annotation(assigned)
+        return annotation is not None and _names_socket_class(annotation)
+    if isinstance(assigned.parent, nodes.Assign) and isinstance(
+        assigned.parent.value, nodes.Call
+    ):
+        return _names_socket_class(assigned.parent.value.func)
+    return False
+
+
+def _read_origin(node: nodes.Call) -> Optional[str]:
+    """Get the type returned by ``sock.recv()`` or ``f.read()`` of a binary file."""
+    if not isinstance(node.func, nodes.Attribute):
+        return None
+    if node.func.attrname == "recv":
+        return "bytes" if is_socket(node.func.expr) else None
+    if node.func.attrname in ("read", "read1", "readline"):
+        handle = opening_call(node.func.expr)
+        if handle is not None and is_unbuffered_or_binary(handle):
+            return "bytes"
+    return None
+
+
+def buffer_origin(node: nodes.NodeNG) -> Optional[str]:
+    """Get the buffer type an expression creates, without following names."""
+    if isinstance(node, nodes.Const):
+        return "bytes" if isinstance(node.value, bytes) else None
+    if isinstance(node, nodes.Call):
+        for name in buffer_types:
+            if is_builtin_call(node, name):
+                return name
+        return _read_origin(node)
+    return None
+
+
+def buffer_type(node: nodes.NodeNG) -> Optional[str]:
+    """Get the buffer type of an expression: bytes, bytearray, memoryview or None.
+
+    Names are resolved through their annotation or assignments, so buffers
+    received from a socket or read from a binary file are recognised.
+    """
+    if isinstance(node, nodes.Subscript):
+        if not isinstance(node.slice, nodes.Slice):
+            return None  # Indexing a buffer returns an int
+        # Slicing a memoryview returns a memoryview, slicing bytes copies them
+        return buffer_type(node.value)
+    origin = buffer_origin(node)
+    if origin is not None:
+        return origin
+    if isinstance(node, (nodes.Name, nodes.AssignName)):
+        annotation = local_type(node)
+        if annotation is not None:
+            return annotation.name if annotation.name in buffer_types else None
+        _, assignments = node.lookup(node.name)
+        origins = set()
+        for assigned in assignments:
+            if isinstance(assigned, nodes.AssignName) and isinstance(
+                assigned.parent, (nodes.Assign, nodes.AnnAssign)
+            ):
+                origins.add(buffer_origin(assigned.parent.value))
+        origins.discard(None)
+        if "memoryview" in origins:
+            return "memoryview"
+        if origins:
+            return origins.pop()
+    inferred = safe_infer(node)
+    if isinstance(inferred, nodes.Const) and isinstance(inferred.value, bytes):
+        return "bytes"
+    if (
+        isinstance(inferred, bases.Instance)
+        and inferred.name in buffer_types
+        and inferred.root().name == "builtins"
+    ):
+        return inferred.name
+    return None
+
+
+def is_bytes_like(node: nodes.NodeNG) -> bool:
+    """Check if an expression is a bytes or bytearray object, whose slices are copies."""
+    return buffer_type(node) in ("bytes", "bytearray")
+
+
+def _is_tail_slice(node: nodes.NodeNG, name: str) -> bool:
+    return (
+        isinstance(node, nodes.Subscript)
+        and isinstance(node.value, nodes.Name)
+        and node.value.name == name
+        and isinstance(node.slice, nodes.Slice)
+        and node.slice.lower is not None
+        and node.slice.upper is None
+        and node.slice.step is None
+    )
+
+
+def _assigned_pairs(node: nodes.Assign) -> Iterator[Tuple[nodes.NodeNG, nodes.NodeNG]]:
+    """Pair the targets of an assignment with their values, including tuple unpacking."""
+    for target in node.targets:
+        if isinstance(target, nodes.Tuple) and isinstance(node.value, nodes.Tuple):
+            if len(target.elts) == len(node.value.elts):
+                yield from zip(target.elts, node.value.elts)
+        else:
+            yield target, node.value
+
+
+def resliced_names(node: nodes.NodeNG) -> List[nodes.Name]:
+    """Get the names re-bound to a tail slice of themselves, e.g. ``data = data[n:]``."""
+    if not isinstance(node, nodes.Assign):
+        return []
+    return [
+        value.value
+        for target, value in _assigned_pairs(node)
+        if isinstance(target, nodes.AssignName) and _is_tail_slice(value, target.name)
+    ]
+
+
+class ZeroCopyChecker(BaseChecker):
+    """
+    Check for copies of byte buffers which could use a memoryview or an offset.
+    """
+
+    name = "zero-copy-checker"
+    priority = -1
+    msgs = {
+        "W9001": (
+            'Buffer "%s" is re-sliced on every iteration, which copies the rest of it. Advance an offset into a memoryview instead.',
+            "consume-and-reslice",
+            "Slicing bytes copies the slice, consuming a buffer by re-slicing it is O(n^2).",
+        ),
+        "W9002": (
+            '"%s" copies the buffer on every iteration, pass the memoryview or bytearray directly.',
+            "bytes-copy-in-loop",
+            "Converting a bytearray or memoryview to bytes copies it.",
+        ),
+        "W9003": (
+            'Bytes buffer "%s" is rebuilt on every iteration, append to a bytearray and convert it once after the loop.',
+            "growing-bytes-buffer",
+            "Joining or concatenating bytes copies the whole buffer each time it grows.",
+        ),
+        "W9004": (
+            'Unpacking a slice of "%s" copies it, use %s with an offset instead.',
+            "unpack-sliced-buffer",
+            "struct.unpack_from() reads directly from a buffer at an offset.",
+        ),
+    }
+
+    @checker_utils.only_required_for_messages(
+        "consume-and-reslice", "growing-bytes-buffer"
+    )
+    def visit_assign(self, node: nodes.Assign) -> None:
+        if not in_loop(node):
+            return
+        for name in resliced_names(node):
+            if is_bytes_like(name):
+                self.add_message("consume-and-reslice", node=node, args=(name.name,))
+        for target, value in _assigned_pairs(node):
+            if isinstance(target, nodes.AssignName) and self._is_growing(
+                target.name, value
+            ):
+                self.add_message("growing-bytes-buffer", node=node, args=(target.name,))
+
+    def _is_growing(self, name: str, value: nodes.NodeNG) -> bool:
+        """Look for ``buf = b"".join([buf, chunk])`` and ``buf = buf + chunk``."""
+        if (
+            isinstance(value, nodes.Call)
+            and isinstance(value.func, nodes.Attribute)
+            and value.func.attrname == "join"
+            and len(value.args) == 1
+            and isinstance(value.args[0], (nodes.List, nodes.Tuple))
+        ):
+            separator = value.func.expr
+            return (
+                isinstance(separator, nodes.Const)
+                and isinstance(separator.value, bytes)
+                and any(
+                    isinstance(elt, nodes.Name) and elt.name == name
+                    for elt in value.args[0].elts
+                )
+            )
+        if (
+            isinstance(value, nodes.BinOp)
+            and value.op == "+"
+            and isinstance(value.left, nodes.Name)
+            and value.left.name == name
+        ):
+            return buffer_type(value.left) == "bytes"
+        return False
+
+    @checker_utils.only_required_for_messages("growing-bytes-buffer")
+    def visit_augassign(self, node: nodes.AugAssign) -> None:
+        # bytearray is extended in place, bytes are copied
+        if node.op != "+=" or not isinstance(node.target, nodes.AssignName):
+            return
+        if not in_loop(node):
+            return
+        if buffer_type(node.target) == "bytes":
+            self.add_message(
+                "growing-bytes-buffer", node=node, args=(node.target.name,)
+            )
+
+    @checker_utils.only_required_for_messages(
+        "bytes-copy-in-loop", "unpack-sliced-buffer"
+    )
+    def visit_call(self, node: nodes.Call) -> None:
+        if is_builtin_call(node, "bytes") and len(node.args) == 1 and in_loop(node):
+            if buffer_type(node.args[0]) in ("bytearray", "memoryview"):
+                self.add_message(
+                    "bytes-copy-in-loop", node=node, args=(node.as_string(),)
+                )
+            return
+        qname = call_qname(node)
+        if qname == "_struct.unpack" and len(node.args) == 2:
+            self._check_unpack(node.args[1], "struct.unpack_from()")
+        elif qname == "_struct.Struct.unpack" and len(node.args) == 1:
+            self._check_unpack(node.args[0], "Struct.unpack_from()")
+
+    def _check_unpack(self, buffer: nodes.NodeNG, replacement: str) -> None:
+        if not isinstance(buffer, nodes.Subscript) or not isinstance(
+            buffer.slice, nodes.Slice
+        ):
+            return
+        if buffer_type(buffer.value) == "memoryview":
+            return  # Slicing a memoryview doesn't copy
+        self.add_message(
+            "unpack-sliced-buffer",
+            node=buffer,
+            args=(buffer.value.as_string(), replacement),
+        )
@@ -0,0 +1,179 @@
+import astroid
+import perflint.allocation_checker
+
+from base import BaseCheckerTestCase
+
+
+class TestAllocationChecker(BaseCheckerTestCase):
+    CHECKER_CLASS = perflint.allocation_checker.AllocationChecker
+    CONFIG = {"max_loop_allocations": 1}
+
+    def test_constant_list_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        def test(items): #@
+            for item in items:
+                allowed = [1, 2, 3]
+                if item in allowed:
+                    print(item)
+        """
+        )
+
+        with self.assertAddedMessage("loop-constant-container"):
+            self.walk(test_func)
+
+    def test_mutated_constant_list(self):
+        test_func = astroid.extract_node(
+            """
+        def test(rows, out): #@
+            for row in rows:
+                counts = [0, 0, 0]
+                counts[row] += 1
+                out.append(counts)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_escaping_constant_list(self):
+        test_func = astroid.extract_node(
+            """
+        def test(rows, out): #@
+            for row in rows:
+                pair = [0, 1]
+                out.append(pair)
+            for row in rows:
+                yield [2, 3]
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_stored_into_constant_dict(self):
+        test_func = astroid.extract_node(
+            """
+        def test(rows): #@
+            for row in rows:
+                record = {"count": 0}
+                record["row"] = row
+                print(record["count"])
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_constant_membership_is_folded(self):
+        test_func = astroid.extract_node(
+            """
+        def test(items): #@
+            for item in items:
+                if item in [1, 2, 3]:
+                    print(item)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_constant_iterable_is_folded(self):
+        test_func = astroid.extract_node(
+            """
+        def test(): #@
+            for item in [1, 2, 3]:
+                print(item)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_temporary_containers(self):
+        test_func = astroid.extract_node(
+            """
+        def test(items): #@
+            seen = {}
+            for a, b in items:
+                key = (a, b)
+                seen[key] = [a, b]
+        """
+        )
+
+        with self.assertAddedMessage("loop-container-allocations"):
+            self.walk(test_func)
+
+    def test_allocation_count_and_tracking(self):
+        test_func = astroid.extract_node(
+            """
+        def test(items): #@
+            for a, b in items:
+                key = (1, 2, a)
+                value = ([a], b)
+        """
+        )
+
+        self.walk(test_func)
+        messages = self.linter.release_messages()
+        assert [m.msg_id for m in messages] == ["loop-container-allocations"]
+        # The type of a is unknown, so neither tuple can be proven untracked.
+        assert messages[0].args == (3, 3)
+
+    def test_untracked_allocations(self):
+        test_func = astroid.extract_node(
+            """
+        def test(items): #@
+            x = 5
+            for item in items:
+                a = (x, 1)
+                b = {"a": x}
+        """
+        )
+
+        self.walk(test_func)
+        messages = self.linter.release_messages()
+        assert [m.msg_id for m in messages] == ["loop-container-allocations"]
+        assert messages[0].args == (2, 0)
+
+    def test_swap_is_not_allocation(self):
+        test_func = astroid.extract_node(
+            """
+        def test(a, b): #@
+            while a:
+                a, b = b, a
+                c, d = a, b
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_nested_function_not_counted(self):
+        test_func = astroid.extract_node(
+            """
+        def test(items): #@
+            for item in items:
+                def inner():
+                    return [item], [item]
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_nested_loop_iterable_counts_in_outer_loop(self):
+        test_func = astroid.extract_node(
+            """
+        def test(items): #@
+            for item in items:
+                for x in [item, item]:
+                    print(x)
+                print([item])
+        """
+        )
+
+        self.walk(test_func)
+        messages = self.linter.release_messages()
+        assert [m.msg_id for m in messages] == ["loop-container-allocations"]
+        assert messages[0].args == (2, 2)
@@ -0,0 +1,102 @@
+import json
+import os
+import astroid
+from astroid import MANAGER
+
+from perflint.callgraph import (
+    CallGraphIndex,
+    ProjectCallGraph,
+    get_call_graph,
+    project_files,
+)
+
+
+def test_heat_of_nested_calls():
+    module = astroid.parse(
+        """
+    def inner():
+        pass
+
+    def outer():
+        for _ in range(10):
+            inner()
+
+    def main():
+        for _ in range(10):
+            for _ in range(10):
+                outer()
+    """
+    )
+    graph = get_call_graph(module)
+    assert graph.heat(module["main"]) == 0
+    assert graph.heat(module["outer"]) == 2
+    assert graph.heat(module["inner"]) == 3
+
+
+def test_recursive_heat():
+    module = astroid.parse(
+        """
+    def recursive(x):
+        for i in range(x):
+            recursive(i)
+    """
+    )
+    graph = get_call_graph(module)
+    assert graph.heat(module["recursive"]) == 1
+
+
+def write_package(tmp_path, monkeypatch, name):
+    """A package named differently in each test, as astroid caches modules by name."""
+    monkeypatch.syspath_prepend(str(tmp_path))
+    package = tmp_path / name
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "helpers.py").write_text("def helper():\n    pass\n")
+    (package / "main.py").write_text(
+        f"from {name}.helpers import helper\n\n"
+        "def main():\n"
+        "    for _ in range(10):\n"
+        "        helper()\n"
+    )
+    (package / "unrelated.py").write_text("def other():\n    pass\n")
+    return package
+
+
+def test_persisted_index(tmp_path, monkeypatch):
+    package = write_package(tmp_path, monkeypatch, "indexed")
+    index_path = tmp_path / "index.json"
+    root = str(package)
+
+    index = CallGraphIndex(str(index_path), root)
+    files = list(project_files(str(package / "main.py")))
+    edges = [edge for path in files for edge in index.edges(path)]
+    index.save()
+    assert len(files) == 4
+    assert [(caller.split("::")[1], callee.split("::")[1], depth) for caller, callee, depth in edges] == [
+        ("main", "helper", 1)
+    ]
+
+    saved = json.loads(index_path.read_text())
+    assert set(saved["roots"][root]["files"]) == set(files)
+
+    # Unchanged files are read from the index
+    reloaded = CallGraphIndex(str(index_path), root)
+    assert reloaded.edges(str(package / "main.py")) == edges
+    assert not reloaded._changed
+
+    # A change to any module invalidates the calls of the others, which may be inferred through it
+    (package / "helpers.py").write_text("def helper():\n    return 1\n")
+    stale = CallGraphIndex(str(index_path), root)
+    assert stale.edges(str(package / "main.py")) == edges
+    assert stale._changed
+
+
+def test_project_graph_reads_modules_mentioning_the_function(tmp_path, monkeypatch):
+    package = write_package(tmp_path, monkeypatch, "lazy")
+    helpers = MANAGER.ast_from_file(str(package / "helpers.py"), "lazy.helpers", source=True)
+    graph = ProjectCallGraph(str(package))
+    assert graph.heat(helpers["helper"]) == 1
+    assert sorted(os.path.basename(path) for path in graph._loaded) == [
+        "helpers.py",
+        "main.py",
+    ]
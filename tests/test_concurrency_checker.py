@@ -0,0 +1,203 @@
+import astroid
+import perflint.concurrency_checker
+
+from base import BaseCheckerTestCase
+
+
+class TestConcurrencyChecker(BaseCheckerTestCase):
+    CHECKER_CLASS = perflint.concurrency_checker.ConcurrencyChecker
+
+    def test_cpu_bound_thread_pool(self):
+        test_func = astroid.extract_node(
+            """
+        from concurrent.futures import ThreadPoolExecutor
+
+        def checksum(data):
+            total = 0
+            for byte in data:
+                total = (total * 31 + byte) % 65521
+            return total
+
+        def test(chunks): #@
+            with ThreadPoolExecutor() as executor:
+                return list(executor.map(checksum, chunks))
+        """
+        )
+
+        with self.assertAddedMessage("cpu-bound-thread-pool"):
+            self.walk(test_func)
+
+    def test_cpu_bound_thread(self):
+        test_func = astroid.extract_node(
+            """
+        import threading
+
+        def count(n):
+            return sum(i * i for i in range(n))
+
+        def test(): #@
+            thread = threading.Thread(target=count, args=(10_000_000,))
+            thread.start()
+        """
+        )
+
+        with self.assertAddedMessage("cpu-bound-thread-pool"):
+            self.walk(test_func)
+
+    def test_io_bound_thread_pool(self):
+        test_func = astroid.extract_node(
+            """
+        from concurrent.futures import ThreadPoolExecutor
+
+        def fetch(paths):
+            for path in paths:
+                with open(path) as f:
+                    yield f.read()
+
+        def load(path):
+            with open(path) as f:
+                return [line.strip() for line in f]
+
+        def test(paths): #@
+            with ThreadPoolExecutor() as executor:
+                return list(executor.map(load, paths))
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_pool_created_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        import multiprocessing
+
+        def test(batches, work): #@
+            for batch in batches:
+                with multiprocessing.Pool() as pool:
+                    pool.map(work, batch)
+        """
+        )
+
+        with self.assertAddedMessage("pool-created-in-loop"):
+            self.walk(test_func)
+
+    def test_executor_created_once(self):
+        test_func = astroid.extract_node(
+            """
+        from concurrent.futures import ProcessPoolExecutor
+
+        def test(batches, work): #@
+            with ProcessPoolExecutor() as executor:
+                for batch in batches:
+                    executor.map(work, batch)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_lock_around_loop_body(self):
+        test_func = astroid.extract_node(
+            """
+        import threading
+
+        lock = threading.Lock()
+
+        def test(items, results): #@
+            for item in items:
+                with lock:
+                    results.append(item)
+        """
+        )
+
+        with self.assertAddedMessage("lock-in-loop"):
+            self.walk(test_func)
+
+    def test_lock_in_inner_loop(self):
+        test_func = astroid.extract_node(
+            """
+        import threading
+
+        class Counter:
+            def __init__(self):
+                self.lock = threading.RLock()
+                self.counts = {}
+
+            def add(self, rows): #@
+                for row in rows:
+                    key = row[0]
+                    for value in row[1:]:
+                        self.lock.acquire()
+                        self.counts[key] = self.counts.get(key, 0) + value
+                        self.lock.release()
+        """
+        )
+
+        with self.assertAddedMessage("lock-in-loop"):
+            self.walk(test_func)
+
+    def test_fine_grained_lock(self):
+        test_func = astroid.extract_node(
+            """
+        import threading
+
+        lock = threading.Lock()
+
+        def test(items, results, transform): #@
+            for item in items:
+                value = transform(item)
+                with lock:
+                    results.append(value)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_result_after_submit(self):
+        test_func = astroid.extract_node(
+            """
+        from concurrent.futures import ThreadPoolExecutor
+
+        def test(urls, fetch): #@
+            with ThreadPoolExecutor() as executor:
+                for url in urls:
+                    future = executor.submit(fetch, url)
+                    print(future.result())
+        """
+        )
+
+        with self.assertAddedMessage("result-after-submit"):
+            self.walk(test_func)
+
+    def test_chained_result(self):
+        test_func = astroid.extract_node(
+            """
+        import multiprocessing
+
+        def test(items, work): #@
+            pool = multiprocessing.Pool()
+            for item in items:
+                print(pool.apply_async(work, (item,)).get())
+        """
+        )
+
+        with self.assertAddedMessage("result-after-submit"):
+            self.walk(test_func)
+
+    def test_results_after_submitting(self):
+        test_func = astroid.extract_node(
+            """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        def test(urls, fetch): #@
+            with ThreadPoolExecutor() as executor:
+                futures = [executor.submit(fetch, url) for url in urls]
+                for future in as_completed(futures):
+                    print(future.result())
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
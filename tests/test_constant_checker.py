@@ -0,0 +1,138 @@
+import astroid
+import perflint.constant_checker
+
+from base import BaseCheckerTestCase
+
+
+class TestConstantFoldingChecker(BaseCheckerTestCase):
+    CHECKER_CLASS = perflint.constant_checker.ConstantFoldingChecker
+
+    def test_module_constant_expression(self):
+        test_func = astroid.extract_node(
+            """
+        PI = 3.14159
+
+        def test(): #@
+            for i in range(10):
+                print(i * (2 * PI))
+        """
+        )
+
+        with self.assertAddedMessage("loop-constant-expression"):
+            self.walk(test_func)
+
+    def test_shift_constant_expression(self):
+        test_func = astroid.extract_node(
+            """
+        BITS = 8
+
+        def test(): #@
+            for i in range(10):
+                print(i & (1 << BITS) - 1)
+        """
+        )
+
+        with self.assertAddedMessage("loop-constant-expression"):
+            self.walk(test_func)
+
+    def test_literal_expression(self):
+        test_func = astroid.extract_node(
+            """
+        def test(): #@
+            for i in range(10):
+                print(i * (2 * 3))
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_reassigned_module_name(self):
+        test_func = astroid.extract_node(
+            """
+        SCALE = 2
+        SCALE = 3
+
+        def test(): #@
+            for i in range(10):
+                print(i * (2 * SCALE))
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_class_constant_expression(self):
+        test_func = astroid.extract_node(
+            """
+        class Config:
+            SIZE = 1024
+
+        def test(): #@
+            for i in range(10):
+                print(i * (Config.SIZE * 4))
+        """
+        )
+
+        with self.assertAddedMessage("loop-constant-expression"):
+            self.walk(test_func)
+
+    def test_class_constant_via_self(self):
+        test_func = astroid.extract_node(
+            """
+        class Buffer:
+            SIZE = 1024
+
+            def test(self, items): #@
+                for item in items:
+                    print(item[:self.SIZE])
+        """
+        )
+
+        with self.assertAddedMessage("class-constant-via-self-in-loop"):
+            self.walk(test_func)
+
+    def test_instance_attribute_via_self(self):
+        test_func = astroid.extract_node(
+            """
+        class Buffer:
+            SIZE = 1024
+
+            def __init__(self):
+                self.SIZE = 2048
+
+            def test(self, items): #@
+                for item in items:
+                    print(item[:self.SIZE])
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_constant_expression_outside_loop(self):
+        test_func = astroid.extract_node(
+            """
+        PI = 3.14159
+
+        def test(): #@
+            return 2 * PI
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_loop_iterable_evaluated_once(self):
+        test_func = astroid.extract_node(
+            """
+        SIZE = 8
+
+        def test(): #@
+            for i in range(SIZE * 2):
+                print(i)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
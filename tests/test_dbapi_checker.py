@@ -0,0 +1,130 @@
+import astroid
+import perflint.dbapi_checker
+
+from base import BaseCheckerTestCase
+
+
+class TestDBAPIChecker(BaseCheckerTestCase):
+    CHECKER_CLASS = perflint.dbapi_checker.DBAPIChecker
+
+    def test_insert_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        import sqlite3
+
+        def test(rows): #@
+            conn = sqlite3.connect(":memory:")
+            cur = conn.cursor()
+            for row in rows:
+                cur.execute("INSERT INTO t VALUES (?, ?)", row)
+        """
+        )
+
+        with self.assertAddedMessage("execute-in-loop"):
+            self.walk(test_func)
+
+    def test_select_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        import sqlite3
+
+        def test(ids): #@
+            with sqlite3.connect("app.db") as conn:
+                for id in ids:
+                    conn.execute("SELECT * FROM users WHERE id = ?", (id,))
+        """
+        )
+
+        with self.assertAddedMessage("execute-in-loop"):
+            self.walk(test_func)
+
+    def test_execute_outside_loop(self):
+        test_func = astroid.extract_node(
+            """
+        import sqlite3
+
+        def test(rows): #@
+            conn = sqlite3.connect(":memory:")
+            conn.executemany("INSERT INTO t VALUES (?, ?)", rows)
+            conn.commit()
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_commit_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        import sqlite3
+
+        def test(conn: sqlite3.Connection, rows): #@
+            for row in rows:
+                conn.commit()
+        """
+        )
+
+        with self.assertAddedMessage("commit-in-loop"):
+            self.walk(test_func)
+
+    def test_fetchone_loop(self):
+        test_func = astroid.extract_node(
+            """
+        import sqlite3
+
+        def test(conn: sqlite3.Connection): #@
+            cur = conn.execute("SELECT * FROM t")
+            while True:
+                row = cur.fetchone()
+                if row is None:
+                    break
+                print(row)
+        """
+        )
+
+        with self.assertAddedMessage("fetchone-loop"):
+            self.walk(test_func)
+
+    def test_fetchone_in_for_loop(self):
+        test_func = astroid.extract_node(
+            """
+        def test(cur: "sqlite3.Cursor", ids): #@
+            cur.execute("SELECT * FROM t WHERE id IN (?, ?)", ids)
+            for _ in ids:
+                print(cur.fetchone())
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_self_connection(self):
+        test_func = astroid.extract_node(
+            """
+        import sqlite3
+
+        class Store:
+            def __init__(self):
+                self.conn = sqlite3.connect(":memory:")
+
+            def save(self, rows): #@
+                for row in rows:
+                    self.conn.execute("UPDATE t SET v = ? WHERE k = ?", row)
+        """
+        )
+
+        with self.assertAddedMessage("execute-in-loop"):
+            self.walk(test_func)
+
+    def test_unrelated_execute(self):
+        test_func = astroid.extract_node(
+            """
+        def test(jobs, runner): #@
+            for job in jobs:
+                runner.execute(job)
+                runner.commit()
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
@@ -0,0 +1,77 @@
+import astroid
+from perflint.defuse import get_def_use
+
+
+def test_tuple_and_starred_targets():
+    func = astroid.extract_node(
+        """
+    def test(values): #@
+        first, (second, *rest) = values
+    """
+    )
+    assert set(get_def_use(func).definitions) == {"values", "first", "second", "rest"}
+
+
+def test_mutations():
+    func = astroid.extract_node(
+        """
+    def fill(items):
+        items.append(1)
+
+    def test(): #@
+        a, b, c, d, e, f = [], [], [], [], [], []
+        a += [1]
+        b[1:2] = [2]
+        del c[0]
+        fill(d)
+        e.pop()
+        f.index(1)
+        len(f)
+        enumerate(f)
+    """
+    )
+    def_use = get_def_use(func)
+    assert set(def_use.mutations) == {"a", "b", "c", "d", "e"}
+    assert not def_use.is_mutated("f")
+
+
+def test_alias_is_mutation():
+    func = astroid.extract_node(
+        """
+    def test(): #@
+        items = [1, 2]
+        other = items
+        other.append(3)
+    """
+    )
+    assert get_def_use(func).is_mutated("items")
+
+
+def test_changed_in_loop():
+    func = astroid.extract_node(
+        """
+    def test(values): #@
+        total = 0
+        for i, *rest in values:
+            for j in rest:
+                total += j
+            values.sort()
+    """
+    )
+    loop = func.body[1]
+    assert get_def_use(func).changed_in(loop) == {"i", "rest", "j", "total", "values"}
+    assert get_def_use(func).changed_in(loop.body[0]) == {"j", "total"}
+
+
+def test_nested_function_mutates_enclosing():
+    func = astroid.extract_node(
+        """
+    def test(): #@
+        items = [1, 2]
+        def inner():
+            items.append(3)
+        inner()
+    """
+    )
+    assert not get_def_use(func).is_mutated("items")
+    assert get_def_use(func.body[1]).nonlocal_mutations() == {"items"}
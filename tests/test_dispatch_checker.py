@@ -0,0 +1,171 @@
+import astroid
+import perflint.dispatch_checker
+from perflint.dispatch_checker import comparisons_saved
+
+from base import BaseCheckerTestCase
+
+
+def test_comparisons_saved():
+    # Branches are reached after 1, 2, 3 and 4 comparisons
+    assert comparisons_saved([1, 1, 1, 1]) == 1.5
+    # A branch testing two values costs two comparisons
+    assert comparisons_saved([2, 1]) == 1.5
+
+
+class TestDispatchChecker(BaseCheckerTestCase):
+    CHECKER_CLASS = perflint.dispatch_checker.DispatchChecker
+    CONFIG = {"call_graph": True, "call_graph_index": ""}
+
+    def test_equality_chain_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        def test(keys): #@
+            for key in keys:
+                if key == "7":
+                    move(-1, -1)
+                elif key == "8":
+                    move(0, -1)
+                elif key in ("9", "u"):
+                    move(1, -1)
+                elif key == "4":
+                    move(-1, 0)
+                elif "6" == key:
+                    move(1, 0)
+                else:
+                    pass
+        """
+        )
+
+        with self.assertAddedMessage("equality-dispatch-chain"):
+            self.walk(test_func)
+
+    def test_isinstance_chain_in_hot_function(self):
+        test_module = astroid.parse(
+            """
+        def describe(node):
+            if isinstance(node, int):
+                return "int"
+            elif isinstance(node, float):
+                return "float"
+            elif isinstance(node, str):
+                return "str"
+            elif isinstance(node, (list, tuple)):
+                return "sequence"
+            elif isinstance(node, dict):
+                return "dict"
+            return "object"
+
+        def main(values):
+            for value in values:
+                print(describe(value))
+        """
+        )
+
+        with self.assertAddedMessage("isinstance-dispatch-chain"):
+            self.walk(test_module)
+
+    def test_chain_outside_hot_code(self):
+        test_func = astroid.extract_node(
+            """
+        def test(command): #@
+            if command == "start":
+                start()
+            elif command == "stop":
+                stop()
+            elif command == "restart":
+                restart()
+            elif command == "status":
+                status()
+            elif command == "reload":
+                reload()
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_short_chain(self):
+        test_func = astroid.extract_node(
+            """
+        def test(keys): #@
+            for key in keys:
+                if key == "a":
+                    pass
+                elif key == "b":
+                    pass
+                elif key == "c":
+                    pass
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_mixed_subjects(self):
+        test_func = astroid.extract_node(
+            """
+        def test(items): #@
+            for x, y in items:
+                if x == 1:
+                    pass
+                elif y == 2:
+                    pass
+                elif x == 3:
+                    pass
+                elif x > 4:
+                    pass
+                elif x == 5:
+                    pass
+                elif x == 6:
+                    pass
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_match_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        def test(keys): #@
+            for key in keys:
+                match key:
+                    case "7":
+                        move(-1, -1)
+                    case "8" | "k":
+                        move(0, -1)
+                    case "9":
+                        move(1, -1)
+                    case "4":
+                        move(-1, 0)
+                    case "6":
+                        move(1, 0)
+                    case _:
+                        pass
+        """
+        )
+
+        with self.assertAddedMessage("equality-dispatch-chain"):
+            self.walk(test_func)
+
+    def test_match_with_patterns(self):
+        test_func = astroid.extract_node(
+            """
+        def test(points): #@
+            for point in points:
+                match point:
+                    case (0, 0):
+                        pass
+                    case (x, 0):
+                        pass
+                    case (0, y):
+                        pass
+                    case (x, y) if x == y:
+                        pass
+                    case (x, y):
+                        pass
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
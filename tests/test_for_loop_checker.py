@@ -52,3 +52,59 @@ class TestUniqueReturnChecker(BaseCheckerTestCase):
 
         with self.assertAddedMessage("incorrect-dictionary-iterator"):
             self.checker.visit_for(for_node)
+
+    def test_dict_key_loop_lookup(self):
+        for_node = astroid.extract_node("""
+        def test():
+            d = {1: 1, 2: 2}
+
+            for k in d: #@
+                print(k, d[k])
+        """)
+
+        with self.assertAddedMessage("dictionary-lookup-in-key-loop"):
+            self.checker.visit_for(for_node)
+
+    def test_dict_keys_loop_lookup(self):
+        for_node = astroid.extract_node("""
+        def test(d: dict):
+            for k in d.keys(): #@
+                print(k, d[k])
+        """)
+
+        with self.assertAddedMessage("dictionary-lookup-in-key-loop"):
+            self.checker.visit_for(for_node)
+
+    def test_dict_key_loop_assignment(self):
+        for_node = astroid.extract_node("""
+        def test():
+            d = {1: 1, 2: 2}
+
+            for k in d: #@
+                d[k] = 0
+        """)
+
+        with self.assertNoMessages():
+            self.checker.visit_for(for_node)
+
+    def test_list_index_loop_lookup(self):
+        for_node = astroid.extract_node("""
+        def test():
+            items = [1, 2]
+
+            for i in items: #@
+                print(items[i])
+        """)
+
+        with self.assertNoMessages():
+            self.checker.visit_for(for_node)
+
+    def test_dict_keys_membership(self):
+        compare_node = astroid.extract_node("""
+        def test(key):
+            d = {1: 1, 2: 2}
+            return key in d.keys() #@
+        """)
+
+        with self.assertAddedMessage("dictionary-keys-membership"):
+            self.checker.visit_compare(compare_node.value)
@@ -0,0 +1,168 @@
+import astroid
+import perflint.function_call_checker
+
+from base import BaseCheckerTestCase
+
+
+class TestFunctionCallChecker(BaseCheckerTestCase):
+    CHECKER_CLASS = perflint.function_call_checker.FunctionCallChecker
+
+    def test_trivial_function_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        def double(x):
+            return x * 2
+
+        def test(): #@
+            for i in range(10):
+                double(i)
+        """
+        )
+
+        with self.assertAddedMessage("inline-trivial-function"):
+            self.walk(test_func)
+
+    def test_trivial_lambda_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        def test(): #@
+            double = lambda x: x * 2
+            for i in range(10):
+                double(i)
+        """
+        )
+
+        with self.assertAddedMessage("inline-trivial-function"):
+            self.walk(test_func)
+
+    def test_trivial_function_outside_loop(self):
+        test_func = astroid.extract_node(
+            """
+        def double(x):
+            return x * 2
+
+        def test(): #@
+            double(2)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_complex_function_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        def double(x):
+            y = x * 2
+            return y
+
+        def test(): #@
+            for i in range(10):
+                double(i)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_dict_literal_unpacking(self):
+        test_func = astroid.extract_node(
+            """
+        def foo(a, b):
+            pass
+
+        def test(): #@
+            foo(**{"a": 1, "b": 2})
+        """
+        )
+
+        with self.assertAddedMessage("unnecessary-dict-unpacking"):
+            self.walk(test_func)
+
+    def test_dict_unpacking_of_non_keyword_names(self):
+        test_func = astroid.extract_node(
+            """
+        def foo(**options):
+            pass
+
+        def test(): #@
+            foo(**{"not-an-identifier": 1, "class": 2})
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_dict_unpacking_unknown_parameters(self):
+        test_func = astroid.extract_node(
+            """
+        def foo(a):
+            pass
+
+        def test(callback): #@
+            foo(**{"b": 1})
+            callback(**{"a": 1})
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_trivial_library_function_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        import re
+
+        def test(lines): #@
+            for line in lines:
+                re.findall("a", line)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_kwargs_forwarding(self):
+        test_func = astroid.extract_node(
+            """
+        def foo(a, b):
+            pass
+
+        def test(**kwargs): #@
+            foo(**kwargs)
+        """
+        )
+
+        with self.assertAddedMessage("kwargs-forwarding"):
+            self.walk(test_func)
+
+    def test_kwargs_forwarding_to_kwargs(self):
+        test_func = astroid.extract_node(
+            """
+        def foo(a, **options):
+            pass
+
+        def test(**kwargs): #@
+            foo(**kwargs)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_staticmethod_via_self_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        class Foo:
+            @staticmethod
+            def bar(x):
+                print(x)
+
+            def test(self): #@
+                for i in range(10):
+                    self.bar(i)
+        """
+        )
+
+        with self.assertAddedMessage("staticmethod-via-self-in-loop"):
+            self.walk(test_func)
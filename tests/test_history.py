@@ -0,0 +1,158 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+from perflint.history import (
+    connect,
+    density,
+    fingerprint,
+    fixed_findings,
+    new_findings,
+    persistent_findings,
+)
+from perflint.runtime import lint
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BEFORE = textwrap.dedent(
+    """
+    def cast(items):
+        for i in list((1, 2, 3)):
+            print(i)
+
+
+    def fixed():
+        for i in list((4, 5)):
+            print(i)
+    """
+)
+
+# A line added above both findings, one fixed and one new
+AFTER = textwrap.dedent(
+    """
+    import os
+
+
+    def cast(items):
+        for i in list((1, 2, 3)):
+            print(i)
+
+
+    def fixed():
+        for i in (4, 5):
+            print(i)
+
+
+    def nested():
+        for i in range(4):
+            for j in range(5):
+                for k in list((6, 7)):
+                    print(i, j, k)
+    """
+)
+
+
+def test_fingerprint_ignores_line_and_whitespace():
+    symbol = "unnecessary-list-cast"
+    first = fingerprint("pkg/mod.py", symbol, "f", "  for i in list(x):\n", 0)
+    assert first == fingerprint("pkg/mod.py", symbol, "f", "for i in  list(x):", 0)
+    assert first != fingerprint("pkg/mod.py", symbol, "f", "for i in list(x):", 1)
+    assert first != fingerprint("pkg/mod.py", symbol, "g", "for i in list(x):", 0)
+
+
+def record(paths, database):
+    lint(
+        paths,
+        [
+            f"--history={database}",
+            "--call-graph-index=",
+            "--persistent=n",
+            "--clear-cache-post-run=y",
+        ],
+    )
+
+
+def test_history_between_runs(tmp_path):
+    package = tmp_path / "pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    module = package / "mod.py"
+    database = str(tmp_path / "history.sqlite")
+
+    module.write_text(BEFORE)
+    record([str(package)], database)
+    module.write_text(AFTER)
+    record([str(package)], database)
+
+    connection = connect(database)
+    try:
+        assert [row["symbol"] for row in persistent_findings(connection)] == [
+            "unnecessary-list-cast"
+        ]
+        [fixed] = fixed_findings(connection)
+        assert (fixed["obj"], fixed["run"]) == ("fixed", 1)
+        [new] = new_findings(connection)
+        assert (new["obj"], new["line"]) == ("nested", 18)
+        assert (new["depth"], new["cost"]) == (2, 20)  # 4 * 5 iterations
+        # Every finding of the first run is new
+        assert len(new_findings(connection, run=1)) == 2
+
+        modules = connection.execute(
+            "SELECT module, package, loc, loops, cost FROM modules WHERE run = 2 ORDER BY module"
+        ).fetchall()
+        assert [tuple(row) for row in modules] == [
+            ("pkg", "pkg", 0, 0, 0),
+            ("pkg.mod", "pkg", 12, 5, 21),
+        ]
+        [row] = density(connection)
+        assert (row["package"], row["findings"], row["loc"]) == ("pkg", 2, 12)
+        assert round(row["per_kloc"], 1) == 166.7
+    finally:
+        connection.close()
+
+
+def _perflint(cwd, *args):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    return subprocess.run(
+        [sys.executable, "-m", "perflint", *args],
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.PIPE,
+        text=True,
+        check=False,
+    )
+
+
+def test_history_with_other_reporters_and_jobs(tmp_path):
+    package = tmp_path / "pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "first.py").write_text(BEFORE)
+    (package / "second.py").write_text(AFTER)
+    options = ["--call-graph-index=", "--persistent=n", "--history=history.sqlite"]
+
+    run = _perflint(tmp_path, "--jobs=2", *options, "pkg")
+
+    assert "unnecessary-list-cast" in run.stdout
+    connection = connect(str(tmp_path / "history.sqlite"))
+    try:
+        assert len(new_findings(connection)) == 4
+        modules = connection.execute("SELECT module, loops, cost FROM modules ORDER BY module")
+        assert [tuple(row) for row in modules] == [
+            ("pkg", 0, 0),
+            ("pkg.first", 2, 2),
+            ("pkg.second", 5, 21),
+        ]
+    finally:
+        connection.close()
+
+
+def test_history_write_failure_is_reported(tmp_path):
+    (tmp_path / "failing.py").write_text(BEFORE)
+    options = ["--call-graph-index=", "--persistent=n", "--history=missing/history.sqlite"]
+
+    run = _perflint(tmp_path, *options, "failing.py")
+
+    assert "history-write-failed" in run.stdout
+    assert run.returncode & 1  # Fatal message
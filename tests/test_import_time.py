@@ -0,0 +1,36 @@
+from perflint.import_time import import_time, parse_importtime
+
+
+def test_parse_importtime():
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       179 |        179 |   _io\n"
+        "import time:       384 |       1006 | _frozen_importlib_external\n"
+        "Traceback (most recent call last):\n"
+    )
+    assert parse_importtime(output) == {"_io": 179, "_frozen_importlib_external": 1006}
+
+
+def test_measure_package(tmp_path):
+    package = tmp_path / "slowpkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("from slowpkg import sub\n")
+    (package / "sub.py").write_text("import time\ntime.sleep(0.05)\n")
+
+    cost = import_time("slowpkg", str(package / "__init__.py"))
+    assert cost is not None and cost >= 50
+    # Submodules are measured by the import of their package
+    sub_cost = import_time("slowpkg.sub")
+    assert sub_cost is not None and 50 <= sub_cost <= cost
+
+
+def test_measure_standalone_module(tmp_path):
+    (tmp_path / "slowmodule.py").write_text("import time\ntime.sleep(0.05)\n")
+
+    cost = import_time("slowmodule", str(tmp_path / "slowmodule.py"))
+    assert cost is not None and cost >= 50
+
+
+def test_unimportable_module(tmp_path):
+    (tmp_path / "broken.py").write_text("raise ImportError\n")
+    assert import_time("broken", str(tmp_path / "broken.py")) is None
@@ -0,0 +1,174 @@
+import astroid
+import pytest
+import perflint.import_time_checker
+from pylint.testutils import set_config
+
+from base import BaseCheckerTestCase
+
+
+class TestImportTimeChecker(BaseCheckerTestCase):
+    CHECKER_CLASS = perflint.import_time_checker.ImportTimeChecker
+
+    @pytest.fixture(autouse=True)
+    def _tmp_path(self, tmp_path):
+        self.tmp_path = tmp_path
+
+    def test_module_level_loop(self):
+        test_module = astroid.parse(
+            """
+        TABLE = {}
+        for i in range(256):
+            TABLE[i] = i * i
+        """
+        )
+
+        with self.assertAddedMessage("import-time-loop"):
+            self.walk(test_module)
+
+    def test_main_block(self):
+        test_module = astroid.parse(
+            """
+        import sys
+
+        def main(args):
+            for arg in args:
+                print(open(arg).read())
+
+        if __name__ == "__main__":
+            for arg in sys.argv:
+                main(arg)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_module)
+
+    def test_module_level_io(self):
+        test_module = astroid.parse(
+            """
+        import json
+
+        with open("config.json") as f:
+            CONFIG = json.load(f)
+        """
+        )
+
+        with self.assertAddedMessage("import-time-io"):
+            self.walk(test_module)
+
+    def test_class_body_io(self):
+        test_module = astroid.parse(
+            """
+        import subprocess
+
+        class Version:
+            CURRENT = subprocess.check_output(["git", "describe"])
+        """
+        )
+
+        with self.assertAddedMessage("import-time-io"):
+            self.walk(test_module)
+
+    def test_regex_table(self):
+        test_module = astroid.parse(
+            """
+        import re
+
+        PATTERNS = {
+            "int": re.compile(r"\\d+"),
+            "float": re.compile(r"\\d+\\.\\d*"),
+            "word": re.compile(r"\\w+"),
+            "space": re.compile(r"\\s+"),
+            "hex": re.compile(r"0x[0-9a-f]+"),
+        }
+        """
+        )
+
+        with self.assertAddedMessage("import-time-regex-table"):
+            self.walk(test_module)
+
+    def test_few_regexes(self):
+        test_module = astroid.parse(
+            """
+        import re
+
+        WORD = re.compile(r"\\w+")
+        SPACE = re.compile(r"\\s+")
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_module)
+
+    def test_large_comprehension(self):
+        test_module = astroid.parse(
+            """
+        SQUARES = [i * i for i in range(100_000)]
+        SMALL = [i * i for i in range(10)]
+        """
+        )
+
+        with self.assertAddedMessage("import-time-comprehension"):
+            self.walk(test_module)
+
+    def test_heavy_import_single_use(self):
+        test_module = astroid.parse(
+            """
+        import numpy as np
+
+        def mean(values):
+            return np.mean(values)
+
+        def total(values):
+            return sum(values)
+        """
+        )
+
+        with self.assertAddedMessage("heavy-import-single-use"):
+            self.walk(test_module)
+
+    def test_heavy_import_used_at_module_level(self):
+        test_module = astroid.parse(
+            """
+        import numpy as np
+
+        ZERO = np.zeros(3)
+
+        def mean(values: np.ndarray):
+            return np.mean(values)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_module)
+
+    def test_functions_and_type_checking(self):
+        test_module = astroid.parse(
+            """
+        from typing import TYPE_CHECKING
+
+        if TYPE_CHECKING:
+            import pandas
+
+        def load(path) -> "pandas.DataFrame":
+            for line in open(path):
+                yield line
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_module)
+
+    @set_config(measure_import_time=True, import_time_threshold=50)
+    def test_measured_import_time(self):
+        package = self.tmp_path / "measuredpkg"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        source = "import time\ntime.sleep(0.06)\nfor i in range(3):\n    pass\n"
+        (package / "startup.py").write_text(source)
+        test_module = astroid.parse(
+            source, "measuredpkg.startup", str(package / "startup.py")
+        )
+
+        with self.assertAddedMessage("slow-module-import"):
+            self.walk(test_module)
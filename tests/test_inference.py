@@ -0,0 +1,135 @@
+import json
+import time
+
+import astroid
+import pytest
+from astroid import MANAGER
+from astroid.util import safe_infer as astroid_safe_infer
+
+import perflint.inference
+from perflint.callgraph import CallGraphIndex, module_edges
+from perflint.inference import budget, safe_infer, syntactic_infer
+from perflint.runtime import lint
+
+
+def slow_infer(node, context=None):
+    time.sleep(0.2)
+    return None
+
+
+@pytest.fixture
+def slow_inference(monkeypatch):
+    monkeypatch.setattr(perflint.inference, "astroid_safe_infer", slow_infer)
+    yield
+    budget.configure(None, 0, 0)
+
+
+def test_syntactic_infer():
+    items, spread, call = astroid.extract_node(
+        """
+    items = (1, 2, 3)
+    spread = items
+    items #@
+    spread #@
+    len(items) #@
+    """
+    )
+    assert isinstance(syntactic_infer(items), astroid.nodes.Tuple)
+    assert syntactic_infer(spread) is None  # Only literals are resolved
+    assert syntactic_infer(call) is None
+    assert isinstance(syntactic_infer(call.args[0]), astroid.nodes.Tuple)
+
+
+def test_node_budget_interrupts_inference(slow_inference):
+    node = astroid.extract_node("items = [1]\nitems")
+    budget.configure(None, 0, 20)
+    started = time.perf_counter()
+    assert isinstance(safe_infer(node), astroid.nodes.List)
+    assert time.perf_counter() - started < 0.15
+    assert (budget.timeouts, budget.fallbacks, budget.exhausted) == (1, 1, False)
+
+
+def test_file_budget_stops_inference(slow_inference):
+    node = astroid.extract_node("items = [1]\nitems")
+    budget.configure(None, 50, 0)
+    safe_infer(node)
+    assert budget.exhausted
+    started = time.perf_counter()
+    for _ in range(10):
+        assert isinstance(safe_infer(node), astroid.nodes.List)
+    assert time.perf_counter() - started < 0.1  # Not inferred anymore
+    assert budget.fallbacks == 11
+
+
+def test_file_budget_bounds_call_graph(slow_inference):
+    module = astroid.parse(
+        "def helper():\n"
+        "    pass\n"
+        "def main():\n" + "".join("    helper()\n" for _ in range(20))
+    )
+    budget.configure(None, 50, 0)
+    started = time.perf_counter()
+    module_edges(module)
+    assert time.perf_counter() - started < 1  # Instead of 4s inferring every call
+    assert budget.exhausted
+    assert budget.fallbacks == 20
+
+
+def test_interrupted_module_build_is_evicted(monkeypatch):
+    def build_and_infer(node, context=None):
+        # Like astroid, which caches a module before finishing building it
+        MANAGER.cache_module(astroid.parse("x = 1", module_name="half_built"))
+        time.sleep(0.2)
+
+    monkeypatch.setattr(perflint.inference, "astroid_safe_infer", build_and_infer)
+    budget.configure(None, 0, 20)
+    try:
+        safe_infer(astroid.extract_node("items = [1]\nitems"))
+        assert budget.timeouts == 1
+        assert "half_built" not in MANAGER.astroid_cache
+    finally:
+        budget.configure(None, 0, 0)
+        MANAGER.astroid_cache.pop("half_built", None)
+
+
+def test_partial_edges_are_not_persisted(tmp_path, monkeypatch, slow_inference):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    (tmp_path / "budgeted.py").write_text(
+        "def helper():\n    pass\n\ndef main():\n    helper()\n"
+    )
+    path = str(tmp_path / "budgeted.py")
+    index_path = str(tmp_path / "index.json")
+    budget.configure(None, 50, 0)
+
+    index = CallGraphIndex(index_path, str(tmp_path))
+    assert index.edges(path) == []  # The call wasn't inferred
+    index.save()
+    budget.configure(None, 0, 0)
+    monkeypatch.setattr(perflint.inference, "astroid_safe_infer", astroid_safe_infer)
+    index = CallGraphIndex(index_path, str(tmp_path))
+    assert len(index.edges(path)) == 1
+    index.save()
+    with open(index_path, encoding="utf-8") as index_file:
+        [entry] = json.load(index_file)["roots"].values()
+    assert len(entry["files"][path]) == 1
+
+
+def test_degraded_mode_is_reported(tmp_path, slow_inference):
+    module = tmp_path / "generated.py"
+    module.write_text(
+        "def f():\n"
+        "    items = (1, 2, 3)\n"
+        "    for i in list(items):\n"
+        "        print(i)\n"
+    )
+    messages = lint(
+        [str(module)],
+        [
+            "--call-graph-index=",
+            "--persistent=n",
+            "--perflint-inference-budget-ms=50",
+        ],
+    )
+    symbols = [message.symbol for message in messages]
+    assert "unnecessary-list-cast" in symbols  # Found syntactically
+    assert "inference-budget-exceeded" in symbols
@@ -0,0 +1,173 @@
+import astroid
+import perflint.io_checker
+
+from base import BaseCheckerTestCase
+
+
+class TestIOChecker(BaseCheckerTestCase):
+    CHECKER_CLASS = perflint.io_checker.IOChecker
+
+    def test_invariant_open_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        def test(items): #@
+            for item in items:
+                with open("log.txt", "a") as f:
+                    f.write(item)
+        """
+        )
+
+        with self.assertAddedMessage("open-in-loop"):
+            self.walk(test_func)
+
+    def test_variant_open_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        def test(paths): #@
+            for path in paths:
+                with open(path) as f:
+                    print(f.read())
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_variant_path_open_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        from pathlib import Path
+
+        def test(names): #@
+            for name in names:
+                with Path(name).open() as f:
+                    print(f.read())
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_binary_write_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        def test(chunks): #@
+            with open("out.bin", "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+        """
+        )
+
+        with self.assertAddedMessage("unbatched-write-in-loop"):
+            self.walk(test_func)
+
+    def test_unbuffered_write_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        def test(chunks): #@
+            f = open("out.txt", "w", buffering=0)
+            for chunk in chunks:
+                f.write(chunk)
+        """
+        )
+
+        with self.assertAddedMessage("unbatched-write-in-loop"):
+            self.walk(test_func)
+
+    def test_buffered_text_write_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        def test(lines): #@
+            with open("out.txt", "w") as f:
+                for line in lines:
+                    f.write(line)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_readlines_iteration(self):
+        test_func = astroid.extract_node(
+            """
+        def test(): #@
+            with open("data.txt") as f:
+                for line in f.readlines():
+                    print(line)
+        """
+        )
+
+        with self.assertAddedMessage("readlines-single-pass"):
+            self.walk(test_func)
+
+    def test_readlines_single_pass(self):
+        test_func = astroid.extract_node(
+            """
+        def test(): #@
+            with open("data.txt") as f:
+                lines = f.readlines()
+            for line in lines:
+                print(line)
+        """
+        )
+
+        with self.assertAddedMessage("readlines-single-pass"):
+            self.walk(test_func)
+
+    def test_readlines_multiple_passes(self):
+        test_func = astroid.extract_node(
+            """
+        def test(): #@
+            with open("data.txt") as f:
+                lines = f.readlines()
+            print(len(lines))
+            for line in lines:
+                print(line)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_read_splitlines(self):
+        test_func = astroid.extract_node(
+            """
+        def test(): #@
+            with open("data.txt") as f:
+                data = f.read()
+            for line in data.splitlines():
+                print(line)
+        """
+        )
+
+        with self.assertAddedMessage("read-splitlines"):
+            self.walk(test_func)
+
+    def test_path_read_text_splitlines(self):
+        test_func = astroid.extract_node(
+            """
+        import pathlib
+
+        def test(): #@
+            for line in pathlib.Path("data.txt").read_text().splitlines():
+                print(line)
+        """
+        )
+
+        with self.assertAddedMessage("read-splitlines"):
+            self.walk(test_func)
+
+    def test_stat_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        import os
+
+        def test(paths): #@
+            for path in paths:
+                if os.path.isfile(path):
+                    print(os.stat(path).st_size)
+        """
+        )
+
+        with self.assertAddedMessage("stat-in-loop"):
+            self.walk(test_func)
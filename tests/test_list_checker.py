@@ -63,4 +63,87 @@ class TestListMutationChecker(BaseCheckerTestCase):
         """)
 
         with self.assertNoMessages():
-            self.walk(test_func)
\ No newline at end of file
+            self.walk(test_func)
+
+    def test_non_mutating_method(self):
+        test_func = astroid.extract_node("""
+        def test(): #@
+            items = [1,2,3,4]
+            return items.index(3) + items.count(1)
+        """)
+
+        with self.assertAddedMessage("use-tuple-over-list"):
+            self.walk(test_func)
+
+    def test_mutated_list_by_augassign(self):
+        test_func = astroid.extract_node("""
+        def test(): #@
+            items = [1,2,3,4]
+            items += [5]
+        """)
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_mutated_list_by_del(self):
+        test_func = astroid.extract_node("""
+        def test(): #@
+            items = [1,2,3,4]
+            del items[0]
+        """)
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_mutated_list_by_slice(self):
+        test_func = astroid.extract_node("""
+        def test(): #@
+            items = [1,2,3,4]
+            items[1:3] = [0]
+        """)
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_mutated_list_by_tuple_assignment(self):
+        test_func = astroid.extract_node("""
+        def test(): #@
+            items = [1,2,3,4]
+            items[0], items[1] = items[1], items[0]
+        """)
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_list_passed_to_mutating_function(self):
+        test_func = astroid.extract_node("""
+        import random
+        def test(): #@
+            items = [1,2,3,4]
+            random.shuffle(items)
+        """)
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_list_passed_to_pure_function(self):
+        test_func = astroid.extract_node("""
+        def test(): #@
+            items = [1,2,3,4]
+            return sum(items)
+        """)
+
+        with self.assertAddedMessage("use-tuple-over-list"):
+            self.walk(test_func)
+
+    def test_list_mutated_by_nested_function(self):
+        test_func = astroid.extract_node("""
+        def test(): #@
+            items = [1,2,3,4]
+            def add():
+                items.append(5)
+            add()
+        """)
+
+        with self.assertNoMessages():
+            self.walk(test_func)
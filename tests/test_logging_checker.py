@@ -0,0 +1,175 @@
+import astroid
+import perflint.logging_checker
+
+from base import BaseCheckerTestCase
+
+
+class TestLoggingChecker(BaseCheckerTestCase):
+    CHECKER_CLASS = perflint.logging_checker.LoggingChecker
+
+    def test_fstring_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        import logging
+
+        logger = logging.getLogger(__name__)
+
+        def test(items): #@
+            for item in items:
+                logger.debug(f"Processing {item}")
+        """
+        )
+
+        with self.assertAddedMessage("eager-log-formatting-in-loop"):
+            self.walk(test_func)
+
+    def test_percent_formatting_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        import logging
+
+        def test(items): #@
+            for item in items:
+                logging.info("Processing %s" % item)
+        """
+        )
+
+        with self.assertAddedMessage("eager-log-formatting-in-loop"):
+            self.walk(test_func)
+
+    def test_format_method_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        import logging
+
+        def test(log: logging.Logger, items): #@
+            while items:
+                log.log(logging.DEBUG, "Popped {}".format(items.pop()))
+        """
+        )
+
+        with self.assertAddedMessage("eager-log-formatting-in-loop"):
+            self.walk(test_func)
+
+    def test_self_logger(self):
+        test_func = astroid.extract_node(
+            """
+        import logging
+
+        class Worker:
+            def __init__(self):
+                self.log = logging.getLogger("worker")
+
+            def run(self, items): #@
+                for item in items:
+                    self.log.debug(f"{item}")
+        """
+        )
+
+        with self.assertAddedMessage("eager-log-formatting-in-loop"):
+            self.walk(test_func)
+
+    def test_lazy_formatting(self):
+        test_func = astroid.extract_node(
+            """
+        import logging
+
+        logger = logging.getLogger(__name__)
+
+        def test(items): #@
+            for item in items:
+                logger.debug("Processing %s", item)
+            logger.debug(f"Processed {len(items)}")
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_call_argument_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        import logging
+
+        logger = logging.getLogger(__name__)
+
+        def test(items): #@
+            for item in items:
+                logger.debug("State %s", describe(item))
+        """
+        )
+
+        with self.assertAddedMessage("log-argument-call-in-loop"):
+            self.walk(test_func)
+
+    def test_guarded_by_level(self):
+        test_func = astroid.extract_node(
+            """
+        import logging
+
+        logger = logging.getLogger(__name__)
+
+        def test(items): #@
+            debug = logger.isEnabledFor(logging.DEBUG)
+            for item in items:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Processing {item}")
+                if debug:
+                    logger.debug("State %s", describe(item))
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_guarded_around_loop(self):
+        test_func = astroid.extract_node(
+            """
+        import logging
+
+        logger = logging.getLogger(__name__)
+
+        def test(items): #@
+            if logger.isEnabledFor(logging.DEBUG):
+                for item in items:
+                    logger.debug(f"Processing {item}")
+                    logger.debug("State %s", describe(item))
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_guard_outside_function(self):
+        test_func = astroid.extract_node(
+            """
+        import logging
+
+        logger = logging.getLogger(__name__)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            def test(items): #@
+                for item in items:
+                    logger.debug(f"Processing {item}")
+        """
+        )
+
+        with self.assertAddedMessage("eager-log-formatting-in-loop"):
+            self.walk(test_func)
+
+    def test_warning_and_other_objects(self):
+        test_func = astroid.extract_node(
+            """
+        import logging
+
+        logger = logging.getLogger(__name__)
+
+        def test(items, console): #@
+            for item in items:
+                logger.warning(f"Skipped {item}")
+                console.info(f"Processing {item}")
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
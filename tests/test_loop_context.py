@@ -0,0 +1,74 @@
+import astroid
+from perflint.loop_context import enclosing_loop, get_loop_context, in_loop, loop_depth
+
+
+def test_depth_and_targets():
+    outer, inner, call = astroid.extract_node(
+        """
+    def test(rows):
+        for i, row in enumerate(rows): #@
+            for value in row: #@
+                print(value) #@
+    """
+    )
+    context = enclosing_loop(call)
+    assert context is get_loop_context(inner)
+    assert context.parent is get_loop_context(outer)
+    assert context.depth == 2
+    assert context.targets == {"value"}
+    assert context.outer_targets == {"i", "row"}
+
+
+def test_iterable_and_else_belong_to_enclosing_loop():
+    loop = astroid.extract_node(
+        """
+    def test(rows):
+        for row in rows: #@
+            for value in sorted(row):
+                pass
+            else:
+                print(row)
+    """
+    )
+    inner = loop.body[0]
+    assert loop_depth(inner.iter) == 1
+    assert loop_depth(inner.orelse[0]) == 1
+    assert enclosing_loop(inner.iter).node is loop
+    assert not in_loop(loop.iter)
+
+
+def test_functions_are_a_boundary():
+    func = astroid.extract_node(
+        """
+    def test(rows):
+        for row in rows:
+            def inner():
+                return len(row) #@
+    """
+    )
+    assert not in_loop(func)
+
+
+def test_assigned_and_candidates():
+    loop = astroid.extract_node(
+        """
+    def test(items, limit):
+        total = 0
+        while total < limit: #@
+            total += len(items)
+    """
+    )
+    context = get_loop_context(loop)
+    assert context.assigned == {"total"}
+    assert [name.name for name in context.invariant_candidates] == ["limit", "items"]
+    assert context.trip_count is None
+
+
+def test_trip_count():
+    loop = astroid.extract_node(
+        """
+    for i in range(2, 10, 2): #@
+        pass
+    """
+    )
+    assert get_loop_context(loop).trip_count == 4
@@ -308,3 +308,386 @@ class TestUniqueReturnChecker(BaseCheckerTestCase):
 
         with self.assertNoMessages():
             self.walk(test_func)
+
+    def test_nested_loop_join(self):
+        test_func = astroid.extract_node(
+            """
+        def test(orders, customers): #@
+            for order in orders:
+                for customer in customers:
+                    if order.customer_id == customer.id:
+                        print(order, customer)
+        """
+        )
+
+        with self.assertAddedMessage("nested-loop-join"):
+            self.walk(test_func)
+
+    def test_nested_loop_join_subscript_continue(self):
+        test_func = astroid.extract_node(
+            """
+        def test(orders, customers): #@
+            for order in orders:
+                for customer in customers:
+                    if customer["id"] != order["customer"]:
+                        continue
+                    print(order, customer)
+        """
+        )
+
+        with self.assertAddedMessage("nested-loop-join"):
+            self.walk(test_func)
+
+    def test_nested_loop_join_tuple_target(self):
+        test_func = astroid.extract_node(
+            """
+        def test(orders, customers): #@
+            for i, order in enumerate(orders):
+                for customer in customers:
+                    if customer.active and customer.id == order.customer_id:
+                        print(i, customer)
+        """
+        )
+
+        with self.assertAddedMessage("nested-loop-join"):
+            self.walk(test_func)
+
+    def test_nested_loop_index_comparison(self):
+        test_func = astroid.extract_node(
+            """
+        def test(matrix, rows, n): #@
+            for i in range(n):
+                for j in range(n):
+                    if i == j:
+                        print(matrix[i][j])
+            for i, row in enumerate(rows):
+                for j in range(n):
+                    if j != i:
+                        continue
+                    print(row)
+        """
+        )
+
+        self.walk(test_func)
+        got = [msg.msg_id for msg in self.linter.release_messages()]
+        assert "nested-loop-join" not in got
+
+    def test_nested_loop_same_level_comparison(self):
+        test_func = astroid.extract_node(
+            """
+        def test(orders, customers): #@
+            for order in orders:
+                for customer in customers:
+                    if customer.id == customer.parent_id:
+                        print(order, customer)
+        """
+        )
+
+        self.walk(test_func)
+        got = [msg.msg_id for msg in self.linter.release_messages()]
+        assert "nested-loop-join" not in got
+
+    def test_nondeterministic_call(self):
+        test_func = astroid.extract_node(
+            """
+        from random import random
+        from time import time
+
+        def test(): #@
+            for _ in range(10):
+                x = random()
+                y = time()
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_next_call(self):
+        test_func = astroid.extract_node(
+            """
+        def test(): #@
+            it = iter((1, 2, 3))
+            for _ in range(3):
+                x = next(it)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_pure_function_call(self):
+        test_func = astroid.extract_node(
+            """
+        def area(width, height):
+            return width * height
+
+        def test(): #@
+            w = 2
+            h = 3
+            for i in range(3):
+                print(area(w, h) + i)
+        """
+        )
+
+        with self.assertAddedMessage("loop-invariant-statement"):
+            self.walk(test_func)
+
+    def test_impure_function_call(self):
+        test_func = astroid.extract_node(
+            """
+        counter = []
+
+        def count(width):
+            counter.append(width)
+            return len(counter)
+
+        def test(): #@
+            w = 2
+            for i in range(3):
+                print(count(w) + i)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_non_mutating_method(self):
+        test_func = astroid.extract_node(
+            """
+        def test(): #@
+            name = "fruit"
+            for i in range(3):
+                print(name.upper(), i)
+                print(len(name) + i)
+        """
+        )
+
+        with self.assertAddedMessage("loop-invariant-statement"):
+            self.walk(test_func)
+
+    def test_global_in_function_called_from_loop(self):
+        test_func = astroid.extract_node(
+            """
+        glbl = 1
+
+        def helper(): #@
+            return glbl
+
+        def test():
+            for _ in range(10):
+                helper()
+        """
+        )
+
+        with self.assertAddedMessage("loop-global-usage"):
+            self.walk(test_func)
+
+    def test_global_in_function_called_outside_loop(self):
+        test_func = astroid.extract_node(
+            """
+        glbl = 1
+
+        def helper(): #@
+            return glbl
+
+        def test():
+            helper()
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_tuple_assignment_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        def test(pairs): #@
+            a = b = 0
+            for _ in range(10):
+                a, b = b, a + b
+                x = a * b
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_assigned_in_inner_loop(self):
+        test_func = astroid.extract_node(
+            """
+        def test(rows): #@
+            total = 0
+            for row in rows:
+                previous = total * 2
+                for value in row:
+                    total += value
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_mutated_by_function_call(self):
+        test_func = astroid.extract_node(
+            """
+        from random import shuffle
+        def test(items): #@
+            for _ in range(10):
+                shuffle(items)
+                first = sorted(items)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_bytearray_slice(self):
+        test_func = astroid.extract_node(
+            """
+        def test(): #@
+            buf = bytearray(1000)
+            for i in range(10):
+                print(buf[i:])
+        """
+        )
+
+        with self.assertAddedMessage("memoryview-over-bytes"):
+            self.walk(test_func)
+
+    def test_received_bytes_slice(self):
+        test_func = astroid.extract_node(
+            """
+        import socket
+
+        def test(): #@
+            sock = socket.socket()
+            data = sock.recv(1024)
+            for i in range(10):
+                print(data[i:])
+        """
+        )
+
+        with self.assertAddedMessage("memoryview-over-bytes"):
+            self.walk(test_func)
+
+    def test_binary_read_slice(self):
+        test_func = astroid.extract_node(
+            """
+        def test(): #@
+            with open("data.bin", "rb") as f:
+                data = f.read()
+            for i in range(10):
+                print(data[i:])
+        """
+        )
+
+        with self.assertAddedMessage("memoryview-over-bytes"):
+            self.walk(test_func)
+
+    def test_mutually_recursive_call_with_io(self):
+        test_func = astroid.extract_node(
+            """
+        def a(n):
+            b(n)
+            print(n)
+
+        def b(n):
+            return a(n - 1)
+
+        def test(): #@
+            for i in range(10):
+                x = a(1)
+                y = b(3)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_method_of_unknown_receiver(self):
+        test_func = astroid.extract_node(
+            """
+        import queue
+
+        def test(q: queue.Queue): #@
+            while True:
+                item = q.get()
+                remaining = q.unfinished_tasks - 1
+                print(item, remaining)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_read_after_write(self):
+        test_func = astroid.extract_node(
+            """
+        cache = {}
+
+        def store(key, value):
+            cache[key] = value
+
+        def lookup(key):
+            return cache.get(key)
+
+        def test(xs): #@
+            for x in xs:
+                store(x, 1)
+                y = lookup(1)
+                print(y)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_read_without_write(self):
+        test_func = astroid.extract_node(
+            """
+        cache = {}
+
+        def lookup(key):
+            return cache.get(key)
+
+        def test(xs): #@
+            for x in xs:
+                y = lookup(1)
+                print(x, y)
+        """
+        )
+
+        self.walk(test_func)
+        messages = self.linter.release_messages()
+        assert [m.msg_id for m in messages] == ["loop-invariant-statement"]
+
+    def test_received_from_connection(self):
+        test_func = astroid.extract_node(
+            """
+        from multiprocessing.connection import Connection
+
+        def test(conn: Connection): #@
+            msg = conn.recv()
+            for i in range(10):
+                print(msg[i:])
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_bytes_indexing(self):
+        test_func = astroid.extract_node(
+            """
+        import socket
+
+        def test(sock: socket.socket): #@
+            buf = sock.recv(1024)
+            for k in range(10):
+                print(buf[k], buf[k + 1])
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
@@ -0,0 +1,170 @@
+import astroid
+import perflint.materialization_checker
+
+from base import BaseCheckerTestCase
+
+
+class TestMaterializationChecker(BaseCheckerTestCase):
+    CHECKER_CLASS = perflint.materialization_checker.MaterializationChecker
+
+    def test_sum_of_list_comprehension(self):
+        test_func = astroid.extract_node(
+            """
+        def test(): #@
+            return sum([i * 2 for i in range(1000)])
+        """
+        )
+
+        self.walk(test_func)
+        messages = self.linter.release_messages()
+        assert [m.msg_id for m in messages] == ["list-comprehension-in-reduction"]
+        assert messages[0].args == (
+            "sum",
+            " (avoids a list of 1,000 items, ~7.9 KiB)",
+        )
+
+    def test_any_of_list_comprehension(self):
+        test_func = astroid.extract_node(
+            """
+        def test(items): #@
+            return any([i > 2 for i in items])
+        """
+        )
+
+        with self.assertAddedMessage("list-comprehension-in-reduction"):
+            self.walk(test_func)
+
+    def test_any_of_generator(self):
+        test_func = astroid.extract_node(
+            """
+        def test(items): #@
+            return any(i > 2 for i in items)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_join_generator(self):
+        test_func = astroid.extract_node(
+            """
+        def test(items): #@
+            return ", ".join(str(i) for i in items)
+        """
+        )
+
+        with self.assertAddedMessage("join-generator"):
+            self.walk(test_func)
+
+    def test_len_of_list_of_generator(self):
+        test_func = astroid.extract_node(
+            """
+        def numbers():
+            yield 1
+
+        def test(): #@
+            return len(list(numbers()))
+        """
+        )
+
+        with self.assertAddedMessage("len-of-materialized-iterator"):
+            self.walk(test_func)
+
+    def test_len_of_list_of_list(self):
+        test_func = astroid.extract_node(
+            """
+        def test(): #@
+            items = [1, 2, 3]
+            return len(list(items))
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_sorted_first_item(self):
+        test_func = astroid.extract_node(
+            """
+        def test(items): #@
+            return sorted(items)[0]
+        """
+        )
+
+        self.walk(test_func)
+        messages = self.linter.release_messages()
+        assert [m.msg_id for m in messages] == ["sorted-for-min-max"]
+        assert messages[0].args == ("min", "")
+
+    def test_sorted_reversed_last_item(self):
+        test_func = astroid.extract_node(
+            """
+        def test(items): #@
+            return sorted(items, reverse=True)[-1]
+        """
+        )
+
+        self.walk(test_func)
+        messages = self.linter.release_messages()
+        assert messages[0].args == ("min", "")
+
+    def test_list_of_keys_membership(self):
+        test_func = astroid.extract_node(
+            """
+        def test(key): #@
+            d = {"a": 1}
+            return key in list(d.keys())
+        """
+        )
+
+        self.walk(test_func)
+        messages = self.linter.release_messages()
+        assert [m.msg_id for m in messages] == ["materialized-membership"]
+        assert messages[0].args == ("d",)
+
+    def test_list_of_aliased_keys_membership(self):
+        test_func = astroid.extract_node(
+            """
+        def test(key): #@
+            d = {"a": 1}
+            ks = d.keys()
+            return key in list(ks)
+        """
+        )
+
+        self.walk(test_func)
+        messages = self.linter.release_messages()
+        assert [m.msg_id for m in messages] == ["materialized-membership"]
+        assert messages[0].args == ("ks",)
+
+    def test_single_use_map(self):
+        test_func = astroid.extract_node(
+            """
+        def test(): #@
+            names = list(map(str, range(10)))
+            for name in names:
+                print(name)
+        """
+        )
+
+        self.walk(test_func)
+        messages = self.linter.release_messages()
+        assert [m.msg_id for m in messages] == ["single-use-materialization"]
+        assert messages[0].args == (
+            "names",
+            "map object",
+            " (avoids a list of 10 items, ~136 bytes)",
+        )
+
+    def test_reused_map(self):
+        test_func = astroid.extract_node(
+            """
+        def test(): #@
+            names = list(map(str, range(10)))
+            for name in names:
+                print(name)
+            return names
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
@@ -0,0 +1,213 @@
+import astroid
+import perflint.memoization_checker
+
+from base import BaseCheckerTestCase
+
+
+class TestMemoizationChecker(BaseCheckerTestCase):
+    CHECKER_CLASS = perflint.memoization_checker.MemoizationChecker
+
+    def test_fibonacci(self):
+        test_func = astroid.extract_node(
+            """
+        def fib(n): #@
+            if n < 2:
+                return n
+            return fib(n - 1) + fib(n - 2)
+        """
+        )
+
+        with self.assertAddedMessage("memoize-recursive-function"):
+            self.walk(test_func)
+
+    def test_recursion_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        def partitions(n, largest): #@
+            if n == 0:
+                return 1
+            total = 0
+            for part in range(1, min(n, largest) + 1):
+                total += partitions(n - part, part)
+            return total
+        """
+        )
+
+        with self.assertAddedMessage("memoize-recursive-function"):
+            self.walk(test_func)
+
+    def test_single_recursion(self):
+        test_func = astroid.extract_node(
+            """
+        def factorial(n): #@
+            if n < 2:
+                return 1
+            return n * factorial(n - 1)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_already_cached(self):
+        test_func = astroid.extract_node(
+            """
+        import functools
+
+        @functools.lru_cache(maxsize=None)
+        def fib(n): #@
+            if n < 2:
+                return n
+            return fib(n - 1) + fib(n - 2)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_impure_recursion(self):
+        test_func = astroid.extract_node(
+            """
+        def fib(n): #@
+            print(n)
+            if n < 2:
+                return n
+            return fib(n - 1) + fib(n - 2)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_unhashable_argument(self):
+        test_func = astroid.extract_node(
+            """
+        def total(items: list, i): #@
+            if i >= len(items):
+                return 0
+            return total(items, i + 1) + total(items, i + 2)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_repeated_pure_call(self):
+        test_func = astroid.extract_node(
+            """
+        import math
+
+        def test(x): #@
+            a = math.sqrt(x) * 2
+            b = math.sqrt(x) + 1
+            return a, b
+        """
+        )
+
+        with self.assertAddedMessage("repeated-pure-call"):
+            self.walk(test_func)
+
+    def test_repeated_call_argument_changes(self):
+        test_func = astroid.extract_node(
+            """
+        import math
+
+        def test(x): #@
+            a = math.sqrt(x) * 2
+            x += 1
+            b = math.sqrt(x) + 1
+            return a, b
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_repeated_call_exclusive_branches(self):
+        test_func = astroid.extract_node(
+            """
+        import math
+
+        def test(x, flag): #@
+            if flag:
+                return math.sqrt(x) * 2
+            else:
+                return math.sqrt(x) + 1
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_repeated_impure_call(self):
+        test_func = astroid.extract_node(
+            """
+        import random
+
+        def test(): #@
+            a = random.randint(1, 6)
+            b = random.randint(1, 6)
+            return a, b
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_repeated_constructor(self):
+        test_func = astroid.extract_node(
+            """
+        def test(x): #@
+            a = list(x)
+            b = list(x)
+            return a, b
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_exclusive_branches(self):
+        test_func = astroid.extract_node(
+            """
+        def power(x, n): #@
+            if n == 0:
+                return 1
+            if n % 2:
+                return x * power(x, n - 1)
+            return power(x, n // 2) ** 2
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_exclusive_expression(self):
+        test_func = astroid.extract_node(
+            """
+        def search(items, value, lo, hi): #@
+            if hi - lo <= 1:
+                return lo
+            mid = (lo + hi) // 2
+            return search(items, value, lo, mid) if value < items[mid] else search(items, value, mid, hi)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_exclusive_match_arms(self):
+        test_func = astroid.extract_node(
+            """
+        def depth(tree): #@
+            match tree:
+                case (left, None):
+                    return 1 + depth(left)
+                case (None, right):
+                    return 1 + depth(right)
+            return 0
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
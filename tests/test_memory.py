@@ -0,0 +1,76 @@
+import gc
+import tracemalloc
+
+import astroid
+from pylint.lint import PyLinter
+from pylint.reporters import CollectingReporter
+from pylint.utils import ASTWalker
+
+from perflint import loop_context
+from perflint.cache import MODULES_KEPT, ModuleCache
+
+
+def generated_module(rows: int) -> str:
+    """A data table of ``rows`` literal containers, and a few functions with loops."""
+    table = "\n".join(f"    ({i}, 'row{i}', [{i}, {i + 1}], {{'id': {i}}})," for i in range(rows))
+    functions = "\n".join(
+        f"def f{i}(items):\n"
+        f"    for item in items:\n"
+        f"        total = (1, 2, {i})\n"
+        f"        print(item, total, TABLE[{i}], [item, {i}])\n"
+        for i in range(10)
+    )
+    return f"TABLE = [\n{table}\n]\n{functions}"
+
+
+def walker() -> ASTWalker:
+    linter = PyLinter(reporter=CollectingReporter())
+    linter.load_plugin_modules(["perflint"])
+    linter.set_option("call-graph-index", "")
+    walker = ASTWalker(linter)
+    for checker in linter.get_checkers():
+        if checker.__module__.startswith("perflint"):
+            checker.open()
+            walker.add_checker(checker)
+    return walker
+
+
+def peak_memory(rows: int) -> int:
+    """Peak memory used by the checkers while walking a generated module."""
+    module = astroid.parse(generated_module(rows), module_name=f"table{rows}")
+    ast_walker = walker()
+    ast_walker.linter.set_current_module(module.name)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        ast_walker.walk(module)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_peak_memory_is_flat_in_literal_containers():
+    small, large = peak_memory(500), peak_memory(2000)
+    assert large < small * 1.5
+
+
+def test_module_cache_keeps_recent_modules():
+    first, second, third = (astroid.parse("x = 1", module_name=f"m{i}") for i in range(3))
+    cache: ModuleCache[int] = ModuleCache(modules=2)
+    cache[first.body[0]] = 1
+    cache[second.body[0]] = 2
+    assert cache.get(first.body[0]) == 1  # Now the most recently used
+    cache[third.body[0]] = 3
+    assert cache.cached_modules() == 2
+    assert cache.get(first.body[0]) == 1
+    assert cache.get(second.body[0]) is None  # Released
+
+
+def test_loop_contexts_are_released_between_modules():
+    loop_context._contexts.clear()
+    ast_walker = walker()
+    for i in range(MODULES_KEPT * 2):
+        module = astroid.parse(generated_module(1), module_name=f"released{i}")
+        ast_walker.linter.set_current_module(module.name)
+        ast_walker.walk(module)
+    assert loop_context._contexts.cached_modules() == MODULES_KEPT
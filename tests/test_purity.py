@@ -0,0 +1,169 @@
+import astroid
+from perflint.purity import MAX_DEPTH, UNKNOWN, Effects, call_effects, function_effects, is_pure
+
+
+def test_pure_function():
+    func = astroid.extract_node(
+        """
+    def area(width, height): #@
+        result = []
+        result.append(width * height)
+        return sum(result)
+    """
+    )
+    assert function_effects(func) == Effects.NONE
+
+
+def test_global_write():
+    func = astroid.extract_node(
+        """
+    total = 0
+
+    def add(value): #@
+        global total
+        total += value
+    """
+    )
+    assert function_effects(func) & Effects.WRITE
+
+
+def test_argument_mutation():
+    func = astroid.extract_node(
+        """
+    def add(items, value): #@
+        items.append(value)
+    """
+    )
+    assert function_effects(func) & Effects.WRITE
+
+
+def test_transitive_io():
+    func = astroid.extract_node(
+        """
+    def log(message):
+        print(message)
+
+    def process(value): #@
+        log(value)
+        return value
+    """
+    )
+    assert function_effects(func) == Effects.IO
+
+
+def test_recursive_function():
+    func = astroid.extract_node(
+        """
+    def fib(n): #@
+        if n < 2:
+            return n
+        return fib(n - 1) + fib(n - 2)
+    """
+    )
+    assert is_pure(function_effects(func))
+
+
+def test_constructor_initialising_self():
+    call = astroid.extract_node(
+        """
+    class Point:
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+
+    Point(1, 2) #@
+    """
+    )
+    assert is_pure(call_effects(call))
+
+
+def test_stdlib_effects():
+    calls = astroid.extract_node(
+        """
+    import math, random, time, os
+
+    math.sqrt(2) #@
+    random.randint(1, 2) #@
+    time.time() #@
+    os.path.join("a", "b") #@
+    os.listdir(".") #@
+    """
+    )
+    assert [call_effects(call) for call in calls] == [
+        Effects.NONE,
+        Effects.NONDETERMINISTIC,
+        Effects.NONDETERMINISTIC,
+        Effects.NONE,
+        Effects.IO,
+    ]
+
+
+def test_builtin_methods():
+    calls = astroid.extract_node(
+        """
+    items = [1, 2]
+    items.append(3) #@
+    items.index(1) #@
+    "abc".upper() #@
+    unknown.method() #@
+    """
+    )
+    assert [call_effects(call) & Effects.WRITE for call in calls] == [
+        Effects.WRITE,
+        Effects.NONE,
+        Effects.NONE,
+        Effects.WRITE,
+    ]
+
+
+MUTUAL_RECURSION = """
+def a(n): #@
+    b(n)
+    print(n)
+
+def b(n): #@
+    return a(n - 1)
+"""
+
+
+def test_mutual_recursion_independent_of_order():
+    a, b = astroid.extract_node(MUTUAL_RECURSION)
+    assert function_effects(b) == Effects.IO
+    assert function_effects(a) == Effects.IO
+
+    # Analysing a first assumes no effects for its call to b, until b is summarised
+    a, b = astroid.extract_node(MUTUAL_RECURSION)
+    assert function_effects(a) == Effects.IO
+    assert function_effects(b) == Effects.IO
+
+
+def test_depth_limit_is_not_cached():
+    module = astroid.parse(
+        "\n".join(f"def f{i}(n):\n    return f{i + 1}(n)\n" for i in range(12))
+        + "def f12(n):\n    return n\n"
+    )
+    first, deep = module.body[0], module.body[MAX_DEPTH + 1]
+    assert function_effects(first) == UNKNOWN  # Calls deeper than MAX_DEPTH are unknown
+    # The summary of a callee cut off by the depth limit isn't kept
+    assert function_effects(deep) == Effects.NONE
+
+
+def test_operator_mutators():
+    calls = astroid.extract_node(
+        """
+    import operator
+
+    operator.add(1, 2) #@
+    operator.itemgetter(0) #@
+    operator.setitem({}, 1, 2) #@
+    operator.iadd([], [1]) #@
+    operator.__delitem__({1: 2}, 1) #@
+    """
+    )
+    assert [call_effects(call) for call in calls] == [
+        Effects.NONE,
+        Effects.NONE,
+        Effects.WRITE,
+        Effects.WRITE,
+        Effects.WRITE,
+    ]
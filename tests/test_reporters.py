@@ -0,0 +1,97 @@
+import io
+import json
+import textwrap
+
+from pylint.lint import Run as PylintRun
+
+from perflint import CHECKERS
+from perflint.reporters import JSONLinesReporter
+from perflint.rules import RULES
+from perflint.runtime import lint
+
+FIRST = textwrap.dedent(
+    """
+    class Table:
+        def scan(self, rows):
+            for row in rows:
+                for i in list((1, 2, 3)):
+                    print(row, i)
+    """
+)
+
+SECOND = textwrap.dedent(
+    """
+    def top():
+        for i in list((4, 5)):
+            print(i)
+    """
+)
+
+
+def test_every_rule_has_cost_metadata():
+    symbols = {msg[1] for checker in CHECKERS for msg in checker.msgs.values()}
+    assert symbols == set(RULES)
+
+
+def test_jsonl_streams_findings_per_file(tmp_path):
+    (tmp_path / "first.py").write_text(FIRST)
+    (tmp_path / "second.py").write_text(SECOND)
+    messages = lint(
+        [str(tmp_path / "first.py"), str(tmp_path / "second.py")],
+        ["--call-graph-index=", "--persistent=n"],
+    )
+    output = io.StringIO()
+    reporter = JSONLinesReporter(output)
+
+    reporter.on_set_current_module("first", str(tmp_path / "first.py"))
+    for msg in messages:
+        if msg.module == "first":
+            reporter.handle_message(msg)
+    assert output.getvalue() == ""  # The file isn't finished yet
+    reporter.on_set_current_module("second", str(tmp_path / "second.py"))
+    [first] = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert first["symbol"] == "unnecessary-list-cast"
+    assert (first["function"], first["loopDepth"], first["estimatedIterations"]) == (
+        "Table.scan",
+        1,
+        10,
+    )
+    assert first["category"] == "allocation"
+    assert first["suggestedFix"] == RULES["unnecessary-list-cast"].fix
+
+    for msg in messages:
+        if msg.module == "second":
+            reporter.handle_message(msg)
+    reporter.display_messages(None)
+    second = json.loads(output.getvalue().splitlines()[1])
+    assert (second["function"], second["loopDepth"]) == ("top", 0)
+
+
+def test_sarif_report(tmp_path):
+    module = tmp_path / "first.py"
+    module.write_text(FIRST)
+    sarif = tmp_path / "perflint.sarif"
+    PylintRun(
+        [
+            "--load-plugins=perflint",
+            "--disable=all",
+            "--enable=unnecessary-list-cast",
+            "--call-graph-index=",
+            "--persistent=n",
+            f"--output-format=perflint-sarif:{sarif}",
+            str(module),
+        ],
+        exit=False,
+    )
+    log = json.loads(sarif.read_text())
+    assert log["version"] == "2.1.0"
+    [run] = log["runs"]
+    rules = run["tool"]["driver"]["rules"]
+    [result] = run["results"]
+    assert rules[result["ruleIndex"]]["name"] == "unnecessary-list-cast"
+    assert result["locations"][0]["physicalLocation"]["region"]["startLine"] == 5
+    assert result["locations"][0]["logicalLocations"][0]["fullyQualifiedName"] == (
+        "first.Table.scan"
+    )
+    assert result["properties"]["loopDepth"] == 1
+    assert result["properties"]["category"] == "allocation"
@@ -0,0 +1,69 @@
+import json
+import textwrap
+
+from perflint.runtime import LineMonitor, confirm, main, run_entry_point
+
+
+SCRIPT = textwrap.dedent(
+    """
+    import os
+
+
+    def hot(items):
+        total = 0
+        for item in items:
+            total += len(os.sep) + item
+        return total
+
+
+    def cold(items):
+        total = 0
+        for item in items:
+            total += len(os.sep) + item
+        return total
+
+
+    hot(range(500))
+    cold(range(3))
+    """
+)
+
+
+def test_line_monitor(tmp_path):
+    script = tmp_path / "counted.py"
+    script.write_text(SCRIPT)
+    with LineMonitor([str(script)]) as monitor:
+        run_entry_point(str(script))
+    path = str(script.resolve())
+    assert monitor.hits[(path, 8)] == 500  # Body of the loop in hot()
+    assert monitor.hits[(path, 15)] == 3
+    assert monitor.times[(path, 8)] > 0
+    # Other files aren't counted
+    assert {path} == {line[0] for line in monitor.hits}
+
+
+def test_confirm_drops_cold_loops(tmp_path):
+    script = tmp_path / "hotcold.py"
+    script.write_text(SCRIPT)
+    findings = confirm(
+        [str(script)],
+        entry=str(script),
+        min_iterations=100,
+        options=["--call-graph-index="],
+    )
+    assert findings
+    assert {finding.message.line for finding in findings} == {8}
+    for finding in findings:
+        assert finding.iterations == 500
+        assert finding.loop_lines == (8, 8)
+        assert "loop ran 500 iterations" in str(finding)
+
+
+def test_main_json(tmp_path, capsys):
+    script = tmp_path / "cli.py"
+    script.write_text(SCRIPT)
+    status = main(
+        ["--entry", str(script), "--min-iterations", "1000", "--json", str(script)]
+    )
+    assert status == 0
+    assert json.loads(capsys.readouterr().out) == []
@@ -0,0 +1,132 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from pylint.lint import PyLinter
+
+from perflint.__main__ import main
+from perflint.sharding import (
+    OVERRIDDEN_METHODS,
+    USAGE_ERROR,
+    ShardError,
+    ShardLinter,
+    assign_shards,
+    check_linter,
+    file_cost,
+    merge_main,
+    parse_shard,
+)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULE = """
+def f{0}():
+    items = (1, 2, 3)
+    for i in list(items):
+        print(i)
+"""
+
+
+def test_parse_shard():
+    assert parse_shard("2/3") == (2, 3)
+    for value in ("0/3", "4/3", "3", "a/b"):
+        with pytest.raises(Exception):
+            parse_shard(value)
+
+
+def test_assign_shards_balances_cost(tmp_path):
+    paths = []
+    for i, lines in enumerate((90, 50, 40, 30, 20, 10)):
+        path = tmp_path / f"m{i}.py"
+        path.write_text("x = 1\n" * lines)
+        paths.append(str(path))
+    assignment = assign_shards(paths, 2)
+    loads = [0, 0]
+    for path, shard in zip(paths, assignment):
+        loads[shard] += file_cost(path)
+    assert loads == [120, 120]
+    assert assign_shards(list(reversed(paths)), 2) == list(reversed(assignment))
+    assert sorted(set(assign_shards(paths, 10))) == list(range(6))
+
+
+def test_cost_is_independent_of_line_endings(tmp_path):
+    source = "def f():\n    return 1\n\nx = f()"
+    costs = []
+    for name, newline in (("lf", "\n"), ("crlf", "\r\n"), ("cr", "\r")):
+        path = tmp_path / f"{name}.py"
+        path.write_bytes(source.replace("\n", newline).encode())
+        costs.append(file_cost(str(path)))
+    assert costs == [4, 4, 4]
+
+
+def test_overridden_linter_methods():
+    for name in OVERRIDDEN_METHODS:
+        assert name in vars(ShardLinter)
+    check_linter()  # The installed pylint has them
+
+
+def test_changed_linter_methods(monkeypatch, capsys):
+    def _get_asts(self, fileitems):
+        pass
+
+    monkeypatch.setattr(PyLinter, "_get_asts", _get_asts)
+    monkeypatch.setattr(sys, "path", list(sys.path))  # main() changes it
+    assert main(["--shard=1/2", "."]) == USAGE_ERROR
+    assert "PyLinter._get_asts() of pylint" in capsys.readouterr().err
+    monkeypatch.delattr(PyLinter, "_get_asts")
+    with pytest.raises(ShardError, match="has no PyLinter._get_asts()"):
+        check_linter()
+
+
+def _perflint(cwd, *args):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    return subprocess.run(
+        [sys.executable, "-m", "perflint", *args],
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.PIPE,
+        text=True,
+        check=False,
+    )
+
+
+def test_merged_shards_match_single_run(tmp_path):
+    package = tmp_path / "pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    for i in range(7):
+        (package / f"m{i}.py").write_text(MODULE.format(i) + "x = 1\n" * i * 10)
+    (package / "broken.py").write_text("def broken(:\n")
+    options = ["--call-graph-index=", "--persistent=n", "pkg", "missing"]
+
+    single = _perflint(tmp_path, "--output-format=json", *options)
+    for i in (1, 2, 3):
+        shard = _perflint(tmp_path, f"--shard={i}/3", *options)
+        assert shard.returncode == 0
+    shards = [str(tmp_path / f"perflint-shard-{i}-of-3.json") for i in (1, 2, 3)]
+    merged = _perflint(tmp_path, "merge", "--output-format=json", *shards)
+
+    messages = json.loads(single.stdout)
+    assert len(messages) == 9  # Missing module, syntax error and 7 findings
+    assert json.loads(merged.stdout) == messages
+    assert merged.returncode == single.returncode != 0
+
+
+def test_merge_requires_every_shard(tmp_path, capsys):
+    for i in (1, 3):
+        shard = {
+            "version": 1,
+            "shard": [i, 3],
+            "files": [],
+            "messages": [],
+            "msg_status": 0,
+            "fail_on_issues": False,
+            "stats": {},
+            "config": {},
+        }
+        (tmp_path / f"{i}.json").write_text(json.dumps(shard))
+    code = merge_main([str(tmp_path / "1.json"), str(tmp_path / "3.json")])
+    assert code == USAGE_ERROR
+    assert "exactly once, got 1/3, 3/3" in capsys.readouterr().err
@@ -0,0 +1,188 @@
+import astroid
+import perflint.specialization_checker
+from pylint.testutils import set_config
+
+from base import BaseCheckerTestCase
+
+
+class TestSpecializationChecker(BaseCheckerTestCase):
+    CHECKER_CLASS = perflint.specialization_checker.SpecializationChecker
+    CONFIG = {"py_version": (3, 11)}
+
+    def test_attribute_changes_type_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        def test(point, values): #@
+            point.x = 0
+            for value in values:
+                point.x = str(value)
+        """
+        )
+
+        with self.assertAddedMessage("polymorphic-attribute"):
+            self.walk(test_func)
+
+    def test_attribute_of_hot_class(self):
+        test_module = astroid.parse(
+            """
+        class Counter:
+            def __init__(self):
+                self.total = 0
+                self.cache = None
+
+            def add(self, value):
+                self.total = str(value)
+                self.cache = {}
+
+        def count(values):
+            for value in values:
+                Counter().add(value)
+        """
+        )
+
+        with self.assertAddedMessage("polymorphic-attribute"):
+            self.walk(test_module)
+
+    def test_optional_attribute(self):
+        test_module = astroid.parse(
+            """
+        class Node:
+            def __init__(self):
+                self.parent = None
+                self.size = 0
+
+            def attach(self, parent):
+                self.parent = parent
+                self.size = 1
+
+        def build(values):
+            for value in values:
+                Node().attach(value)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_module)
+
+    def test_setattr_class_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        class Config:
+            pass
+
+        def test(options): #@
+            for name, value in options.items():
+                setattr(Config, name, value)
+        """
+        )
+
+        with self.assertAddedMessage("class-mutated-at-runtime"):
+            self.walk(test_func)
+
+    def test_class_attribute_assigned_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        class Registry:
+            count = 0
+
+        def test(items): #@
+            for item in items:
+                Registry.count = len(items)
+        """
+        )
+
+        with self.assertAddedMessage("class-mutated-at-runtime"):
+            self.walk(test_func)
+
+    def test_setattr_instance(self):
+        test_func = astroid.extract_node(
+            """
+        class Config:
+            pass
+
+        def test(options): #@
+            config = Config()
+            for name, value in options.items():
+                setattr(config, name, value)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_getattr_on_hot_class(self):
+        test_module = astroid.parse(
+            """
+        class Proxy:
+            def __init__(self, target):
+                self._target = target
+
+            def __getattr__(self, name):
+                return getattr(self._target, name)
+
+        def wrap(items):
+            return [Proxy(item) for item in items]
+
+        def wrap_loop(items):
+            for item in items:
+                yield Proxy(item)
+        """
+        )
+
+        with self.assertAddedMessage("dynamic-attribute-hook"):
+            self.walk(test_module)
+
+    def test_getattr_on_cold_class(self):
+        test_module = astroid.parse(
+            """
+        class Settings:
+            def __getattr__(self, name):
+                return None
+
+        settings = Settings()
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_module)
+
+    def test_heterogeneous_loop(self):
+        test_func = astroid.extract_node(
+            """
+        def test(): #@
+            total = 0
+            for value in (1, 2.5, 3, 4.5):
+                total = total + value
+        """
+        )
+
+        with self.assertAddedMessage("heterogeneous-loop"):
+            self.walk(test_func)
+
+    def test_heterogeneous_loop_without_operations(self):
+        test_func = astroid.extract_node(
+            """
+        def test(): #@
+            for value in (1, "two", None):
+                print(value)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    @set_config(py_version=(3, 10))
+    def test_disabled_before_3_11(self):
+        test_func = astroid.extract_node(
+            """
+        def test(point, values): #@
+            point.x = 0
+            for value in values:
+                point.x = str(value)
+            for value in (1, 2.5):
+                point.y = value * 2
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
@@ -0,0 +1,161 @@
+import astroid
+import perflint.zero_copy_checker
+
+from base import BaseCheckerTestCase
+
+
+class TestZeroCopyChecker(BaseCheckerTestCase):
+    CHECKER_CLASS = perflint.zero_copy_checker.ZeroCopyChecker
+
+    def test_consume_and_reslice(self):
+        test_func = astroid.extract_node(
+            """
+        import socket
+
+        def test(sock: socket.socket): #@
+            data = sock.recv(4096)
+            while data:
+                chunk, data = data[:4], data[4:]
+                print(chunk)
+        """
+        )
+
+        with self.assertAddedMessage("consume-and-reslice"):
+            self.walk(test_func)
+
+    def test_reslice_annotated(self):
+        test_func = astroid.extract_node(
+            """
+        def test(data: bytes): #@
+            while data:
+                data = data[1:]
+        """
+        )
+
+        with self.assertAddedMessage("consume-and-reslice"):
+            self.walk(test_func)
+
+    def test_reslice_memoryview(self):
+        test_func = astroid.extract_node(
+            """
+        def test(payload: bytes): #@
+            data = memoryview(payload)
+            while data:
+                chunk, data = data[:4], data[4:]
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_reslice_outside_loop(self):
+        test_func = astroid.extract_node(
+            """
+        def test(data: bytes): #@
+            data = data[4:]
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_bytes_copy_in_loop(self):
+        test_func = astroid.extract_node(
+            """
+        def test(): #@
+            buf = bytearray(1024)
+            for _ in range(10):
+                print(bytes(buf))
+        """
+        )
+
+        with self.assertAddedMessage("bytes-copy-in-loop"):
+            self.walk(test_func)
+
+    def test_bytes_of_int(self):
+        test_func = astroid.extract_node(
+            """
+        def test(): #@
+            for _ in range(10):
+                print(bytes(10))
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_growing_join(self):
+        test_func = astroid.extract_node(
+            """
+        def test(chunks): #@
+            buf = b""
+            for chunk in chunks:
+                buf = b"".join([buf, chunk])
+        """
+        )
+
+        with self.assertAddedMessage("growing-bytes-buffer"):
+            self.walk(test_func)
+
+    def test_growing_concatenation(self):
+        test_func = astroid.extract_node(
+            """
+        def test(chunks): #@
+            buf = b""
+            for chunk in chunks:
+                buf += chunk
+        """
+        )
+
+        with self.assertAddedMessage("growing-bytes-buffer"):
+            self.walk(test_func)
+
+    def test_growing_bytearray(self):
+        test_func = astroid.extract_node(
+            """
+        def test(chunks): #@
+            buf = bytearray()
+            for chunk in chunks:
+                buf += chunk
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)
+
+    def test_unpack_slice(self):
+        test_func = astroid.extract_node(
+            """
+        import struct
+        def test(data): #@
+            return struct.unpack("<I", data[4:8])
+        """
+        )
+
+        with self.assertAddedMessage("unpack-sliced-buffer"):
+            self.walk(test_func)
+
+    def test_struct_unpack_slice(self):
+        test_func = astroid.extract_node(
+            """
+        import struct
+        HEADER = struct.Struct("<HH")
+        def test(data): #@
+            return HEADER.unpack(data[:4])
+        """
+        )
+
+        with self.assertAddedMessage("unpack-sliced-buffer"):
+            self.walk(test_func)
+
+    def test_unpack_from(self):
+        test_func = astroid.extract_node(
+            """
+        import struct
+        def test(data): #@
+            return struct.unpack_from("<I", data, 4)
+        """
+        )
+
+        with self.assertNoMessages():
+            self.walk(test_func)